@@ -0,0 +1,52 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from otlmow_model.OtlmowModel.BaseClasses.OTLObject import dynamic_create_instance_from_uri
+
+from otlmow_template.AssetIdAllocator import AssetIdAllocator
+from otlmow_template.SubsetTemplateCreator import SubsetTemplateCreator
+
+current_dir = Path(__file__).parent
+model_directory_path = Path(__file__).parent.parent / 'TestModel'
+
+
+def test_allocate_returns_unique_identificators():
+    allocator = AssetIdAllocator()
+
+    identificators = [allocator.allocate() for _ in range(10000)]
+
+    assert identificators[:3] == ['dummy_aaaa', 'dummy_aaab', 'dummy_aaac']
+    assert len(set(identificators)) == 10000
+
+
+def test_allocate_is_thread_safe():
+    allocator = AssetIdAllocator()
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        identificators = list(executor.map(lambda _: allocator.allocate(), range(5000)))
+
+    assert len(set(identificators)) == 5000
+
+
+def test_assign_sets_agent_id_for_agent():
+    allocator = AssetIdAllocator()
+    agent = dynamic_create_instance_from_uri('http://purl.org/dc/terms/Agent')
+    asset = dynamic_create_instance_from_uri('https://wegenenverkeer.data.vlaanderen.be/ns/onderdeel#AllCasesTestClass',
+                                             model_directory=model_directory_path)
+
+    allocator.assign(agent)
+    allocator.assign(asset)
+
+    assert agent.agentId.identificator == 'dummy_aaaa'
+    assert asset.assetId.identificator == 'dummy_aaab'
+
+
+def test_generated_objects_have_unique_identificators():
+    objects = SubsetTemplateCreator.generate_objects_for_template(
+        subset_path=current_dir / 'OTL_AllCasesTestClass.db', class_uris_filter=None,
+        filter_attributes_by_subset=True, dummy_data_rows=200, add_geometry=True, ignore_relations=True,
+        model_directory=model_directory_path)
+
+    identificators = [o.assetId.identificator for o in objects]
+    assert len(identificators) == 600
+    assert len(set(identificators)) == 600
@@ -0,0 +1,90 @@
+import json
+import os
+import shutil
+from pathlib import Path
+
+from otlmow_template.CollectorDiskCache import CollectorDiskCache, CACHE_FILE_SUFFIX
+from otlmow_template.SubsetTemplateCreator import SubsetTemplateCreator
+
+current_dir = Path(__file__).parent
+model_directory_path = Path(__file__).parent.parent / 'TestModel'
+
+
+def test_cache_hit_returns_equal_collector(tmp_path):
+    subset_path = current_dir / 'OTL_AllCasesTestClass.db'
+    cache = CollectorDiskCache(cache_directory=tmp_path / 'cache')
+    collector = SubsetTemplateCreator._collect_subset(subset_path)
+
+    assert cache.load(subset_path=subset_path) is None
+    cache.store(subset_path=subset_path, collector=collector)
+    cached_collector = cache.load(subset_path=subset_path)
+
+    assert cached_collector is not None
+    assert cached_collector.classes == collector.classes
+    assert cached_collector.attributes == collector.attributes
+    assert cached_collector.relations == collector.relations
+    assert cached_collector.enumerations == collector.enumerations
+    assert cached_collector.class_dict == collector.class_dict
+    assert cached_collector.find_attributes_by_class(collector.classes[0]) == \
+        collector.find_attributes_by_class(collector.classes[0])
+
+
+def test_changed_subset_file_invalidates_entry(tmp_path):
+    subset_path = tmp_path / 'subset.db'
+    shutil.copy(current_dir / 'OTL_AllCasesTestClass.db', subset_path)
+    cache = CollectorDiskCache(cache_directory=tmp_path / 'cache')
+    cache.store(subset_path=subset_path, collector=SubsetTemplateCreator._collect_subset(subset_path))
+    assert cache.load(subset_path=subset_path) is not None
+
+    shutil.copy(current_dir / 'Kast_Agent.db', subset_path)
+    assert cache.load(subset_path=subset_path) is None
+
+
+def test_invalid_entries_are_removed(tmp_path):
+    subset_path = current_dir / 'Kast_Agent.db'
+    cache = CollectorDiskCache(cache_directory=tmp_path / 'cache')
+    entry_path = cache._get_entry_path(cache.get_cache_key(subset_path))
+
+    entry_path.write_bytes(b'\x80\x04not json')
+    assert cache.load(subset_path=subset_path) is None
+    assert not entry_path.exists()
+
+    # records of another layout of the dataclasses
+    cache.store(subset_path=subset_path, collector=SubsetTemplateCreator._collect_subset(subset_path))
+    records = json.loads(entry_path.read_text(encoding='utf-8'))
+    records['classes'][0]['unknown_field'] = 1
+    entry_path.write_text(json.dumps(records), encoding='utf-8')
+    assert cache.load(subset_path=subset_path) is None
+    assert not entry_path.exists()
+
+
+def test_eviction_removes_least_recently_used_entries(tmp_path):
+    cache = CollectorDiskCache(cache_directory=tmp_path / 'cache')
+    first_path = current_dir / 'OTL_AllCasesTestClass.db'
+    second_path = current_dir / 'Kast_Agent.db'
+    cache.store(subset_path=first_path, collector=SubsetTemplateCreator._collect_subset(first_path))
+    cache.store(subset_path=second_path, collector=SubsetTemplateCreator._collect_subset(second_path))
+    first_entry = cache._get_entry_path(cache.get_cache_key(first_path))
+    second_entry = cache._get_entry_path(cache.get_cache_key(second_path))
+    os.utime(first_entry, (1, 1))
+
+    cache.max_size_bytes = second_entry.stat().st_size
+    cache.evict()
+
+    assert not first_entry.exists()
+    assert cache.load(subset_path=second_path) is not None
+
+
+def test_generate_template_with_collector_disk_cache(tmp_path):
+    SubsetTemplateCreator.enable_collector_disk_cache(cache_directory=tmp_path / 'cache')
+    try:
+        for index in range(2):
+            csv_path = tmp_path / f'template_{index}.csv'
+            SubsetTemplateCreator.generate_template_from_subset(
+                subset_path=current_dir / 'OTL_AllCasesTestClass.db', template_file_path=csv_path,
+                model_directory=model_directory_path, split_per_type=False,
+                class_uris_filter=['https://wegenenverkeer.data.vlaanderen.be/ns/onderdeel#AnotherTestClass'])
+            assert csv_path.exists()
+        assert len(list((tmp_path / 'cache').glob(f'*{CACHE_FILE_SUFFIX}'))) == 1
+    finally:
+        SubsetTemplateCreator.disable_collector_disk_cache()
@@ -0,0 +1,69 @@
+import os
+import shutil
+from pathlib import Path
+
+from otlmow_template.CollectorMemoryCache import CollectorMemoryCache
+from otlmow_template.SubsetTemplateCreator import SubsetTemplateCreator
+
+current_dir = Path(__file__).parent
+
+
+def test_cache_counts_hits_and_misses():
+    cache = CollectorMemoryCache(max_entries=2)
+    subset_path = current_dir / 'OTL_AllCasesTestClass.db'
+    cache_key = cache.get_cache_key(subset_path)
+
+    assert cache.get(cache_key) is None
+    collector = SubsetTemplateCreator._collect_subset(subset_path)
+    cache.put(cache_key, collector)
+
+    assert cache.get(cache_key) is collector
+    statistics = cache.get_statistics()
+    assert statistics['hits'] == 1
+    assert statistics['misses'] == 1
+    assert statistics['entries'] == 1
+    assert statistics['size_bytes'] > 0
+
+
+def test_cache_evicts_least_recently_used_entry():
+    cache = CollectorMemoryCache(max_entries=2)
+    cache_keys = [cache.get_cache_key(current_dir / name)
+                  for name in ['OTL_AllCasesTestClass.db', 'Kast_Agent.db', 'telecom_app.db']]
+    for cache_key in cache_keys[:2]:
+        cache.put(cache_key, SubsetTemplateCreator._collect_subset(Path(cache_key[0])))
+    cache.get(cache_keys[0])
+    cache.put(cache_keys[2], SubsetTemplateCreator._collect_subset(Path(cache_keys[2][0])))
+
+    assert cache.get(cache_keys[0]) is not None
+    assert cache.get(cache_keys[1]) is None
+    assert cache.get(cache_keys[2]) is not None
+    assert cache.get_statistics()['evictions'] == 1
+
+
+def test_cache_respects_max_size_bytes():
+    subset_path = current_dir / 'OTL_AllCasesTestClass.db'
+    cache = CollectorMemoryCache(max_size_bytes=1)
+    cache_key = cache.get_cache_key(subset_path)
+    cache.put(cache_key, SubsetTemplateCreator._collect_subset(subset_path))
+
+    assert cache.get(cache_key) is None
+    assert cache.get_statistics()['size_bytes'] == 0
+
+
+def test_modified_subset_file_is_collected_again(tmp_path):
+    subset_path = tmp_path / 'subset.db'
+    shutil.copy(current_dir / 'OTL_AllCasesTestClass.db', subset_path)
+    SubsetTemplateCreator.enable_collector_memory_cache()
+    try:
+        first_collector = SubsetTemplateCreator._load_collector_from_subset_path(subset_path)
+        assert SubsetTemplateCreator._load_collector_from_subset_path(subset_path) is first_collector
+
+        stat = subset_path.stat()
+        os.utime(subset_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert SubsetTemplateCreator._load_collector_from_subset_path(subset_path) is not first_collector
+
+        statistics = SubsetTemplateCreator.get_collector_memory_cache_statistics()
+        assert statistics['hits'] == 1
+        assert statistics['misses'] == 2
+    finally:
+        SubsetTemplateCreator.disable_collector_memory_cache()
@@ -0,0 +1,110 @@
+import csv
+import datetime
+from pathlib import Path
+
+import pytest
+from openpyxl.reader.excel import load_workbook
+from otlmow_converter.OtlmowConverter import OtlmowConverter
+
+from otlmow_template.SubsetTemplateCreator import SubsetTemplateCreator
+
+current_dir = Path(__file__).parent
+model_directory_path = Path(__file__).parent.parent / 'TestModel'
+all_cases_uri = 'https://wegenenverkeer.data.vlaanderen.be/ns/onderdeel#AllCasesTestClass'
+
+
+def test_columnar_csv_template_can_be_read_by_the_converter(tmp_path):
+    created_file_paths = SubsetTemplateCreator.generate_columnar_template_from_subset(
+        subset_path=current_dir / 'OTL_AllCasesTestClass.db', template_file_path=tmp_path / 'template.csv',
+        class_uris_filter=[all_cases_uri], dummy_data_rows=250, chunk_size=100, model_directory=model_directory_path,
+        seed=1)
+
+    assert len(created_file_paths) == 1
+    objects = OtlmowConverter.from_file_to_objects(created_file_paths[0], model_directory=model_directory_path)
+    objects = list(objects)
+    assert len(objects) == 250
+    assert all(o.typeURI == all_cases_uri for o in objects)
+    assert len({o.assetId.identificator for o in objects}) == 250
+    assert len({o.testStringField for o in objects}) > 1
+    assert all(o.testKeuzelijst == 'waarde-4' for o in objects)
+
+
+def test_columnar_csv_template_with_seed_is_reproducible(tmp_path):
+    def generate(directory: Path, seed: int) -> list[list[str]]:
+        directory.mkdir()
+        file_path = SubsetTemplateCreator.generate_columnar_template_from_subset(
+            subset_path=current_dir / 'OTL_AllCasesTestClass.db', template_file_path=directory / 'template.csv',
+            dummy_data_rows=30, chunk_size=7, split_per_type=False, add_attribute_info=True,
+            model_directory=model_directory_path, seed=seed)[0]
+        with open(file_path, encoding='utf-8') as file:
+            return list(csv.reader(file, delimiter=';'))
+
+    rows = generate(tmp_path / 'first', seed=5)
+
+    assert rows == generate(tmp_path / 'second', seed=5)
+    assert rows != generate(tmp_path / 'other', seed=6)
+    header_row = rows[1]
+    assert header_row[:3] == ['typeURI', 'assetId.identificator', 'assetId.toegekendDoor']
+    assert rows[0][header_row.index('testStringField')] == 'Test attribuut voor StringField'
+    # 3 concrete classes in the subset
+    assert len(rows) == 2 + 3 * 30
+
+
+def test_columnar_xlsx_template(tmp_path):
+    file_path = tmp_path / 'template.xlsx'
+
+    SubsetTemplateCreator.generate_columnar_template_from_subset(
+        subset_path=current_dir / 'OTL_AllCasesTestClass.db', template_file_path=file_path,
+        dummy_data_rows=120, chunk_size=50, model_directory=model_directory_path)
+
+    workbook = load_workbook(file_path, read_only=True)
+    assert sorted(workbook.sheetnames) == ['onderdeel#AllCasesTestClass', 'onderdeel#AnotherTestClass',
+                                           'onderdeel#DeprecatedTestClass']
+    sheet = workbook['onderdeel#AllCasesTestClass']
+    rows = list(sheet.iter_rows(values_only=True))
+    assert rows[0][:2] == ('typeURI', 'assetId.identificator')
+    assert len(rows) == 121
+    workbook.close()
+
+    objects = list(OtlmowConverter.from_file_to_objects(file_path, model_directory=model_directory_path))
+    assert len(objects) == 360
+
+
+def test_columnar_template_with_unsupported_extension(tmp_path):
+    with pytest.raises(ValueError):
+        SubsetTemplateCreator.generate_columnar_template_from_subset(
+            subset_path=current_dir / 'OTL_AllCasesTestClass.db', template_file_path=tmp_path / 'template.json',
+            dummy_data_rows=1, model_directory=model_directory_path)
+
+
+def test_columnar_xlsx_template_keeps_the_types_of_the_values(tmp_path):
+    file_path = tmp_path / 'template.xlsx'
+
+    SubsetTemplateCreator.generate_columnar_template_from_subset(
+        subset_path=current_dir / 'OTL_AllCasesTestClass.db', template_file_path=file_path,
+        class_uris_filter=[all_cases_uri], dummy_data_rows=5, model_directory=model_directory_path, seed=2)
+
+    workbook = load_workbook(file_path, read_only=True)
+    headers, *rows = workbook['onderdeel#AllCasesTestClass'].iter_rows(values_only=True)
+    workbook.close()
+    values = dict(zip(headers, rows[0]))
+    assert isinstance(values['testIntegerField'], int)
+    assert isinstance(values['testDecimalField'], float)
+    assert isinstance(values['testBooleanField'], bool)
+    assert isinstance(values['testDateTimeField'], datetime.datetime)
+
+    objects = list(OtlmowConverter.from_file_to_objects(file_path, model_directory=model_directory_path))
+    assert isinstance(objects[0].testDateField, datetime.date)
+
+
+def test_columnar_template_fills_one_branch_of_a_union_per_row(tmp_path):
+    file_path = SubsetTemplateCreator.generate_columnar_template_from_subset(
+        subset_path=current_dir / 'OTL_AllCasesTestClass.db', template_file_path=tmp_path / 'template.csv',
+        class_uris_filter=[all_cases_uri], dummy_data_rows=50, model_directory=model_directory_path, seed=1)[0]
+    with open(file_path, encoding='utf-8') as file:
+        headers, *rows = csv.reader(file, delimiter=';')
+
+    branches = [[row[headers.index(header)] for header in ('testUnionType.unionString',
+                                                            'testUnionType.unionKwantWrd')] for row in rows]
+    assert all(bool(string_value) != bool(kwant_wrd_value) for string_value, kwant_wrd_value in branches)
+    assert len({bool(string_value) for string_value, _ in branches}) == 2
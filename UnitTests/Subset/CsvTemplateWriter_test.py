@@ -0,0 +1,58 @@
+from pathlib import Path
+
+import pytest
+from otlmow_converter.OtlmowConverter import OtlmowConverter
+
+from otlmow_template import CsvTemplateWriter as csv_template_writer_module
+from otlmow_template.CsvTemplateWriter import CsvTemplateWriter
+from otlmow_template.SubsetTemplateCreator import SubsetTemplateCreator
+from otlmow_template.TemplatePlan import TemplatePlan
+
+current_dir = Path(__file__).parent
+model_directory_path = Path(__file__).parent.parent / 'TestModel'
+
+
+def generate_objects() -> list:
+    return SubsetTemplateCreator.generate_objects_for_template(
+        subset_path=current_dir / 'OTL_AllCasesTestClass.db', class_uris_filter=None,
+        filter_attributes_by_subset=True, dummy_data_rows=3, add_geometry=True, ignore_relations=False,
+        model_directory=model_directory_path, seed=5)
+
+
+@pytest.mark.parametrize('split_per_type', [True, False])
+def test_write_csv_template_is_identical_to_writing_and_altering(tmp_path, split_per_type):
+    objects = generate_objects()
+    (tmp_path / 'altered').mkdir()
+    (tmp_path / 'written').mkdir()
+    options = dict(split_per_type=split_per_type, dummy_data_rows=3, add_attribute_info=True, add_deprecated=True)
+
+    altered_paths = OtlmowConverter.from_objects_to_file(
+        file_path=tmp_path / 'altered' / 'template.csv', sequence_of_objects=objects,
+        split_per_type=split_per_type, model_directory=model_directory_path)
+    SubsetTemplateCreator.alter_csv_template(instances=objects, file_path=tmp_path / 'altered' / 'template.csv',
+                                             **options)
+    written_paths = SubsetTemplateCreator.write_csv_template(
+        objects=objects, file_path=tmp_path / 'written' / 'template.csv', **options)
+
+    assert [path.name for path in written_paths] == [path.name for path in altered_paths]
+    for altered_path, written_path in zip(altered_paths, written_paths):
+        assert written_path.read_bytes() == altered_path.read_bytes(), written_path.name
+
+
+def test_write_file_without_dummy_data_does_not_render_the_values(tmp_path, monkeypatch):
+    objects = generate_objects()
+    table = CsvTemplateWriter.get_tables(sequence_of_objects=objects, split_per_type=True)['onderdeel#AnotherTestClass']
+    class_plan = TemplatePlan.compile(objects).get_class_plan(
+        'https://wegenenverkeer.data.vlaanderen.be/ns/onderdeel#AnotherTestClass')
+
+    def fail_to_cast(*args, **kwargs):
+        raise AssertionError('the values are rendered')
+
+    monkeypatch.setattr(csv_template_writer_module.pc, 'cast', fail_to_cast)
+    file_path = CsvTemplateWriter.write_file(table=table, file_path=tmp_path / 'template.csv', class_plan=class_plan,
+                                             add_attribute_info=True, add_deprecated=True, dummy_data_rows=0)
+
+    lines = file_path.read_text(encoding='utf-8').splitlines()
+    assert len(lines) == 3
+    assert lines[1].split(';')[CsvTemplateWriter.get_headers(table).index('deprecatedString')] == 'DEPRECATED'
+    assert lines[2].startswith('typeURI;assetId.identificator;assetId.toegekendDoor;')
@@ -0,0 +1,109 @@
+import datetime
+import random
+from pathlib import Path
+
+from otlmow_model.OtlmowModel.BaseClasses.BooleanField import BooleanField
+from otlmow_model.OtlmowModel.BaseClasses.DateTimeField import DateTimeField
+from otlmow_model.OtlmowModel.BaseClasses.IntegerField import IntegerField
+from otlmow_model.OtlmowModel.BaseClasses.LegacyObject import NaamField, NaampadField
+from otlmow_model.OtlmowModel.BaseClasses.OTLObject import dynamic_create_instance_from_uri
+from otlmow_model.OtlmowModel.BaseClasses.StringField import StringField
+from otlmow_model.OtlmowModel.BaseClasses.TimeField import TimeField
+from otlmow_model.OtlmowModel.BaseClasses.URIField import URIField
+from otlmow_model.OtlmowModel.BaseClasses.WKTField import WKTField
+
+from otlmow_template.DummyDataGenerator import DummyDataGenerator
+from otlmow_template.SubsetTemplateCreator import SubsetTemplateCreator
+
+current_dir = Path(__file__).parent
+model_directory_path = Path(__file__).parent.parent / 'TestModel'
+all_cases_uri = 'https://wegenenverkeer.data.vlaanderen.be/ns/onderdeel#AllCasesTestClass'
+
+
+class OwnRulesStringField(StringField):
+    @classmethod
+    def create_dummy_data(cls) -> str:
+        return f'own_{random.randint(0, 10 ** 9)}'
+
+
+def test_generate_column_per_field_type():
+    generator = DummyDataGenerator(seed=1)
+
+    strings = generator.generate_column(StringField, 500)
+    assert all(s.startswith('dummy_') and 4 <= len(s) - 6 <= 10 for s in strings)
+    uris = generator.generate_column(URIField, 10)
+    assert all(u.startswith('http://') and u.endswith('.dummy') for u in uris)
+    integers = generator.generate_column(IntegerField, 500)
+    assert all(-100 <= i <= 100 for i in integers)
+    assert set(generator.generate_column(BooleanField, 100)) == {True, False}
+    datetimes = generator.generate_column(DateTimeField, 100)
+    assert all(datetime.datetime(2000, 1, 1) <= d < datetime.datetime(2020, 1, 1) for d in datetimes)
+    assert all(isinstance(t, datetime.time) for t in generator.generate_column(TimeField, 10))
+    assert generator.generate_column(WKTField, 2) == ['POINT Z (200000 200000 0)'] * 2
+
+
+def test_generate_column_for_keuzelijst_uses_options_in_use():
+    instance = dynamic_create_instance_from_uri(all_cases_uri, model_directory=model_directory_path)
+    generator = DummyDataGenerator(seed=1)
+
+    values = generator.generate_column(instance._testKeuzelijst.field, 1000)
+
+    # only waarde-4 has the status ingebruik
+    assert set(values) == {'waarde-4'}
+
+
+def test_same_seed_generates_same_values():
+    first = DummyDataGenerator.for_class(seed=42, class_uri=all_cases_uri).generate_column(StringField, 50)
+    second = DummyDataGenerator.for_class(seed=42, class_uri=all_cases_uri).generate_column(StringField, 50)
+    other_class = DummyDataGenerator.for_class(seed=42, class_uri='other').generate_column(StringField, 50)
+
+    assert first == second
+    assert first != other_class
+
+
+def test_fields_with_own_rules_draw_from_the_generator():
+    random.seed(7)
+    global_state = random.getstate()
+
+    first = DummyDataGenerator(seed=42).generate_column(OwnRulesStringField, 20)
+    second = DummyDataGenerator(seed=42).generate_column(OwnRulesStringField, 20)
+
+    # the rules of the base class are used, the global random generator is left alone
+    assert all(value.startswith('dummy_') for value in first)
+    assert first == second
+    assert first != DummyDataGenerator(seed=43).generate_column(OwnRulesStringField, 20)
+    assert random.getstate() == global_state
+
+
+def test_generate_column_for_naam_fields():
+    generator = DummyDataGenerator(seed=1)
+
+    assert generator.generate_column(NaamField, 2) == ['dummy', 'dummy']
+    assert generator.generate_column(NaampadField, 2) == ['dummy/dummy', 'dummy/dummy']
+
+
+def test_fill_attribute_fills_complex_and_list_attributes():
+    instance = dynamic_create_instance_from_uri(all_cases_uri, model_directory=model_directory_path)
+    generator = DummyDataGenerator(seed=3)
+
+    for attr in instance:
+        generator.fill_attribute(attr)
+
+    assert instance.testStringField.startswith('dummy_')
+    assert len(instance.testStringFieldMetKard) == 1
+    assert instance.testComplexType.testStringField.startswith('dummy_')
+    assert instance.testKwantWrd.waarde is not None
+
+
+def test_generate_objects_with_seed_is_reproducible():
+    def generate(seed):
+        objects = SubsetTemplateCreator.generate_objects_for_template(
+            subset_path=current_dir / 'OTL_AllCasesTestClass.db', class_uris_filter=None,
+            filter_attributes_by_subset=True, dummy_data_rows=20, add_geometry=True, ignore_relations=True,
+            model_directory=model_directory_path, seed=seed)
+        return [o.to_dict() for o in objects]
+
+    first = generate(seed=7)
+
+    assert first == generate(seed=7)
+    assert first != generate(seed=8)
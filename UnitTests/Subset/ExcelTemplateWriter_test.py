@@ -0,0 +1,56 @@
+import zipfile
+from pathlib import Path
+
+import pytest
+from otlmow_converter.OtlmowConverter import OtlmowConverter
+
+from otlmow_template.ExcelTemplateWriter import ExcelTemplateWriter
+from otlmow_template.SubsetTemplateCreator import SubsetTemplateCreator
+
+current_dir = Path(__file__).parent
+model_directory_path = Path(__file__).parent.parent / 'TestModel'
+
+
+def generate_objects() -> list:
+    return SubsetTemplateCreator.generate_objects_for_template(
+        subset_path=current_dir / 'OTL_AllCasesTestClass.db', class_uris_filter=None,
+        filter_attributes_by_subset=True, dummy_data_rows=3, add_geometry=True, ignore_relations=False,
+        model_directory=model_directory_path, seed=1)
+
+
+def test_create_workbook_has_a_sheet_per_type():
+    workbook = ExcelTemplateWriter.create_workbook(sequence_of_objects=generate_objects())
+
+    assert workbook.sheetnames == ['onderdeel#AllCasesTestClass', 'onderdeel#AnotherTestClass',
+                                   'onderdeel#DeprecatedTestClass', 'onderdeel#Bevestiging', 'onderdeel#Voedt']
+    assert workbook['onderdeel#AnotherTestClass'].max_row == 4
+
+
+def test_create_workbook_from_an_iterator():
+    workbook = ExcelTemplateWriter.create_workbook(sequence_of_objects=iter(generate_objects()))
+    assert 'onderdeel#AllCasesTestClass' in workbook.sheetnames
+
+    with pytest.raises(ValueError):
+        ExcelTemplateWriter.create_workbook(sequence_of_objects=iter([]))
+    with pytest.raises(ValueError):
+        ExcelTemplateWriter.create_workbook(sequence_of_objects=[])
+
+
+def test_write_excel_template_is_identical_to_writing_and_altering(tmp_path):
+    objects = generate_objects()
+    altered_path = tmp_path / 'altered.xlsx'
+    written_path = tmp_path / 'written.xlsx'
+    options = dict(add_attribute_info=True, generate_choice_list=True, dummy_data_rows=3, add_deprecated=True,
+                   abbreviate_excel_sheettitles=False)
+
+    OtlmowConverter.from_objects_to_file(file_path=altered_path, sequence_of_objects=objects,
+                                         model_directory=model_directory_path)
+    SubsetTemplateCreator.alter_excel_template(instances=objects, file_path=altered_path, **options)
+    SubsetTemplateCreator.write_excel_template(objects=objects, file_path=written_path, **options)
+
+    with zipfile.ZipFile(altered_path) as altered_file, zipfile.ZipFile(written_path) as written_file:
+        assert altered_file.namelist() == written_file.namelist()
+        for part_name in altered_file.namelist():
+            # the properties contain the time of creation
+            if part_name != 'docProps/core.xml':
+                assert altered_file.read(part_name) == written_file.read(part_name), part_name
@@ -0,0 +1,72 @@
+import inspect
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import otlmow_model
+
+from otlmow_template.GenerationContext import GenerationContext
+from otlmow_template.SubsetTemplateCreator import SubsetTemplateCreator
+
+current_dir = Path(__file__).parent
+model_directory_path = Path(__file__).parent.parent / 'TestModel'
+all_cases_uri = 'https://wegenenverkeer.data.vlaanderen.be/ns/onderdeel#AllCasesTestClass'
+another_uri = 'https://wegenenverkeer.data.vlaanderen.be/ns/onderdeel#AnotherTestClass'
+onderdeel_ns = 'https://wegenenverkeer.data.vlaanderen.be/ns/onderdeel#'
+installatie_ns = 'https://wegenenverkeer.data.vlaanderen.be/ns/installatie#'
+
+runs_models = [('voorbeeld-slagboom.db', None), ('OTL_AllCasesTestClass.db', model_directory_path)]
+runs_type_uris = [
+    ({installatie_ns + 'Kokerafsluiting', installatie_ns + 'Slagboom', onderdeel_ns + 'Contactor',
+      onderdeel_ns + 'Slagboomarm', onderdeel_ns + 'SlagboomarmVerlichting', onderdeel_ns + 'Slagboomkolom'},
+     {onderdeel_ns + 'Bevestiging', onderdeel_ns + 'HoortBij', onderdeel_ns + 'VoedtAangestuurd'}),
+    ({all_cases_uri, another_uri, onderdeel_ns + 'DeprecatedTestClass'},
+     {onderdeel_ns + 'Bevestiging', onderdeel_ns + 'Voedt'})]
+
+
+def test_create_uses_the_relations_of_the_model():
+    test_model_context = GenerationContext.create(model_directory=model_directory_path)
+    default_context = GenerationContext.create()
+
+    assert test_model_context.is_relation('https://wegenenverkeer.data.vlaanderen.be/ns/onderdeel#Bevestiging')
+    assert not test_model_context.is_relation(all_cases_uri)
+    assert len(default_context.relation_dict) > len(test_model_context.relation_dict)
+    assert test_model_context.asset_id_allocator is not default_context.asset_id_allocator
+
+
+def generate_for_run(run: int) -> list:
+    # the runs alternate between the default model and the test model
+    subset_name, model_directory = runs_models[run % 2]
+    return list(SubsetTemplateCreator.generate_objects_for_template(
+        subset_path=current_dir / subset_name, class_uris_filter=None, dummy_data_rows=run + 1,
+        filter_attributes_by_subset=True, add_geometry=False, ignore_relations=False, model_directory=model_directory,
+        seed=run))
+
+
+def test_concurrent_generations_do_not_share_state():
+    runs = range(12)
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        results = list(executor.map(generate_for_run, runs))
+
+    contexts = [GenerationContext.create(model_directory=model_directory) for _, model_directory in runs_models]
+    model_paths = [Path(next(iter(otlmow_model.__path__))).resolve(), model_directory_path.resolve()]
+    for run, objects in zip(runs, results):
+        context = contexts[run % 2]
+        # the classes come from the model of this run, also when the other model is used at the same time
+        assert all(Path(inspect.getfile(type(o))).resolve().is_relative_to(model_paths[run % 2]) for o in objects)
+        expected_asset_type_uris, expected_relation_type_uris = runs_type_uris[run % 2]
+        assets = [o for o in objects if not context.is_relation(o.typeURI)]
+        relations = [o for o in objects if context.is_relation(o.typeURI)]
+        assert {o.typeURI for o in assets} == expected_asset_type_uris
+        assert len(assets) == (run + 1) * len(expected_asset_type_uris)
+        # only relations of the model of this run
+        assert {o.typeURI for o in relations} == expected_relation_type_uris
+
+        asset_ids = {o.assetId.identificator for o in assets}
+        assert len(asset_ids) == len(assets)
+        # relations only between the assets of this run
+        assert all(o.bronAssetId.identificator in asset_ids and o.doelAssetId.identificator in asset_ids
+                   for o in relations)
+
+    for run in (4, 5):
+        assert [o.assetId.identificator for o in results[run]] == \
+            [o.assetId.identificator for o in generate_for_run(run)]
@@ -0,0 +1,111 @@
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from pathlib import Path
+from zipfile import ZipFile
+
+import openpyxl
+from openpyxl.cell import WriteOnlyCell
+
+from otlmow_template.ParallelExcelTemplateWriter import ParallelExcelTemplateWriter
+from otlmow_template.SubsetTemplateCreator import SubsetTemplateCreator
+
+current_dir = Path(__file__).parent
+model_directory_path = Path(__file__).parent.parent / 'TestModel'
+
+
+def generate_template(file_path: Path, **options) -> None:
+    SubsetTemplateCreator.generate_template_from_subset(
+        subset_path=current_dir / 'OTL_AllCasesTestClass.db', template_file_path=file_path, ignore_relations=False,
+        add_attribute_info=True, add_deprecated=True, model_directory=model_directory_path, seed=3, **options)
+
+
+def read_parts(file_path: Path) -> dict[str, bytes]:
+    # the properties of the document hold the time of creation
+    with ZipFile(file_path) as package:
+        return {name: package.read(name) for name in package.namelist() if name != 'docProps/core.xml'}
+
+
+def test_parallel_template_has_the_parts_of_the_write_only_template(tmp_path):
+    generate_template(tmp_path / 'write_only.xlsx', dummy_data_rows=3, write_only=True)
+    generate_template(tmp_path / 'parallel.xlsx', dummy_data_rows=3, parallel_sheets=True)
+    generate_template(tmp_path / 'streaming.xlsx', dummy_data_rows=3, parallel_sheets=True, streaming=True)
+
+    write_only_parts = read_parts(tmp_path / 'write_only.xlsx')
+    assert 'xl/worksheets/sheet5.xml' in write_only_parts
+    assert read_parts(tmp_path / 'parallel.xlsx') == write_only_parts
+    assert read_parts(tmp_path / 'streaming.xlsx') == write_only_parts
+
+
+def test_parallel_writer_uses_the_given_executor(tmp_path):
+    objects = SubsetTemplateCreator.generate_objects_for_template(
+        subset_path=current_dir / 'OTL_AllCasesTestClass.db', class_uris_filter=None,
+        filter_attributes_by_subset=True, dummy_data_rows=2, add_geometry=True, ignore_relations=True,
+        model_directory=model_directory_path, seed=3)
+    file_path = tmp_path / 'template.xlsx'
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        ParallelExcelTemplateWriter.write(class_batches=[objects], file_path=file_path, add_attribute_info=False,
+                                          generate_choice_list=True, dummy_data_rows=2, add_deprecated=False,
+                                          executor=executor)
+        # the executor is not shut down by the writer
+        assert executor.submit(sum, [1, 2]).result() == 3
+
+    workbook = openpyxl.load_workbook(file_path)
+    assert workbook.sheetnames[-1] == 'Keuzelijsten'
+    sheet = workbook['onderdeel#AllCasesTestClass']
+    assert sheet['A1'].value == 'typeURI'
+    assert sheet['A3'].value == 'https://wegenenverkeer.data.vlaanderen.be/ns/onderdeel#AllCasesTestClass'
+    assert sheet.max_row == 3
+    assert 'Keuzelijst_KlAIMToestand' in workbook.defined_names
+    workbook.close()
+
+
+def save_styled_workbook(number_formats: list[str]) -> ZipFile:
+    # a write-only workbook with a sheet Styled that registers the number formats as cell styles in the given order
+    workbook = openpyxl.Workbook(write_only=True)
+    workbook.create_sheet('Other')
+    sheet = workbook.create_sheet('Styled')
+    row = []
+    for number_format in number_formats:
+        cell = WriteOnlyCell(sheet, 1)
+        cell.number_format = number_format
+        row.append(cell)
+    sheet.append(row)
+    package = BytesIO()
+    workbook.save(package)
+    return ZipFile(package)
+
+
+def test_get_part_names_follows_the_relationships():
+    package = BytesIO()
+    with ZipFile(package, 'w') as package_file:
+        package_file.writestr('xl/workbook.xml', (
+            '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+            'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships"><sheets>'
+            '<sheet name="First" sheetId="1" r:id="rId2"/><sheet name="Second" sheetId="2" r:id="rId1"/>'
+            '</sheets></workbook>'))
+        package_file.writestr('xl/_rels/workbook.xml.rels', (
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            '<Relationship Id="rId1" Target="/xl/worksheets/sheet1.xml" Type="http://schemas.openxmlformats.org/'
+            'officeDocument/2006/relationships/worksheet"/>'
+            '<Relationship Id="rId2" Target="worksheets/sheet2.xml" Type="http://schemas.openxmlformats.org/'
+            'officeDocument/2006/relationships/worksheet"/>'
+            '<Relationship Id="rId3" Target="styles.xml" Type="http://schemas.openxmlformats.org/'
+            'officeDocument/2006/relationships/styles"/></Relationships>'))
+
+    with ZipFile(package) as package_file:
+        part_names, styles_part_name = ParallelExcelTemplateWriter.get_part_names(package=package_file)
+    assert part_names == {'First': 'xl/worksheets/sheet2.xml', 'Second': 'xl/worksheets/sheet1.xml'}
+    assert styles_part_name == 'xl/styles.xml'
+
+
+def test_translate_styles_uses_the_ids_of_the_package():
+    with save_styled_workbook(['@', '0.00']) as package, save_styled_workbook(['0.00', '@']) as sheet_package:
+        part_names, styles_part_name = ParallelExcelTemplateWriter.get_part_names(package=sheet_package)
+        sheet_xml = ParallelExcelTemplateWriter.translate_styles(
+            title='Styled', sheet_xml=sheet_package.read(part_names['Styled']),
+            styles=ParallelExcelTemplateWriter.get_styles(package.read(styles_part_name)),
+            sheet_styles=ParallelExcelTemplateWriter.get_styles(sheet_package.read(styles_part_name)))
+
+    assert b'<c r="A1" s="2"' in sheet_xml
+    assert b'<c r="B1" s="1"' in sheet_xml
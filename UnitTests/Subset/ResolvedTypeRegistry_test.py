@@ -0,0 +1,45 @@
+from pathlib import Path
+
+from otlmow_template.ResolvedTypeRegistry import ResolvedTypeRegistry
+
+model_directory_path = Path(__file__).parent.parent / 'TestModel'
+all_cases_uri = 'https://wegenenverkeer.data.vlaanderen.be/ns/onderdeel#AllCasesTestClass'
+
+
+def test_get_type_resolves_once_and_caches():
+    registry = ResolvedTypeRegistry()
+
+    first = registry.get_type(class_uri=all_cases_uri, model_directory=model_directory_path)
+    second = registry.get_type(class_uri=all_cases_uri, model_directory=model_directory_path)
+
+    assert first is second
+    assert first().typeURI == all_cases_uri
+    statistics = registry.get_statistics()
+    assert statistics['types'] == 1
+    assert statistics['resolutions'] == 1
+    assert statistics['hits'] == 1
+    assert statistics['resolution_seconds'] >= 0.0
+
+
+def test_get_type_is_keyed_by_model_directory():
+    registry = ResolvedTypeRegistry()
+
+    registry.get_type(class_uri=all_cases_uri, model_directory=model_directory_path)
+    registry.get_type(class_uri=all_cases_uri, model_directory=model_directory_path / '.')
+
+    assert registry.get_statistics()['types'] == 1
+
+    registry.get_type(class_uri=all_cases_uri, model_directory=model_directory_path.parent / 'TestModel')
+    assert registry.get_statistics()['hits'] == 2
+
+    assert (registry._get_key(class_uri=all_cases_uri, model_directory=None) !=
+            registry._get_key(class_uri=all_cases_uri, model_directory=model_directory_path))
+
+
+def test_clear_resets_types_and_statistics():
+    registry = ResolvedTypeRegistry()
+    registry.get_type(class_uri=all_cases_uri, model_directory=model_directory_path)
+
+    registry.clear()
+
+    assert registry.get_statistics() == {'types': 0, 'hits': 0, 'resolutions': 0, 'resolution_seconds': 0.0}
@@ -0,0 +1,87 @@
+import sqlite3
+from pathlib import Path
+
+import pytest
+from otlmow_modelbuilder.OSLOCollector import OSLOCollector
+
+from otlmow_template.CollectorDiskCache import COLLECTOR_FIELDS
+from otlmow_template.SubsetLoader import SubsetLoader
+from otlmow_template.SubsetTemplateCreator import SubsetTemplateCreator
+
+current_dir = Path(__file__).parent
+
+slagboom_class_uris = ['https://wegenenverkeer.data.vlaanderen.be/ns/onderdeel#Slagboomarm',
+                       'https://wegenenverkeer.data.vlaanderen.be/ns/onderdeel#SlagboomarmVerlichting']
+
+
+def test_load_classes_only_loads_requested_classes_and_their_attributes():
+    subset_path = current_dir / 'voorbeeld-slagboom.db'
+    full_collector = SubsetTemplateCreator._collect_subset(subset_path)
+
+    collector = SubsetLoader.load_classes(subset_path=subset_path, class_uris=slagboom_class_uris)
+
+    assert [c.objectUri for c in collector.classes] == slagboom_class_uris
+    for oslo_class in collector.classes:
+        assert oslo_class == full_collector.class_dict[oslo_class.objectUri]
+        assert collector.find_attributes_by_class(oslo_class) == full_collector.find_attributes_by_class(oslo_class)
+    assert collector.relations == []
+
+
+def test_load_classes_with_relations_only_loads_relations_between_requested_classes():
+    subset_path = current_dir / 'voorbeeld-slagboom.db'
+    full_collector = SubsetTemplateCreator._collect_subset(subset_path)
+
+    collector = SubsetLoader.load_classes(subset_path=subset_path, class_uris=slagboom_class_uris,
+                                          include_relations=True)
+
+    expected_relations = [r for r in full_collector.relations
+                          if r.bron_uri in slagboom_class_uris and r.doel_uri in slagboom_class_uris]
+    assert collector.relations == expected_relations
+    assert len(collector.relations) > 0
+
+
+def test_lazy_loading_generates_same_objects_as_full_loading():
+    kwargs = {
+        'subset_path': current_dir / 'voorbeeld-slagboom.db', 'class_uris_filter': slagboom_class_uris,
+        'filter_attributes_by_subset': True, 'dummy_data_rows': 2, 'add_geometry': True, 'ignore_relations': False}
+    full_objects = SubsetTemplateCreator.generate_objects_for_template(**kwargs)
+    lazy_objects = SubsetTemplateCreator.generate_objects_for_template(lazy_loading=True, **kwargs)
+
+    def summarize(objects):
+        return sorted((o.typeURI, tuple(sorted(a.naam for a in o if a.waarde is not None))) for o in objects)
+
+    assert summarize(lazy_objects) == summarize(full_objects)
+
+
+def test_load_all_equals_collect_all():
+    subset_path = current_dir / 'voorbeeld-slagboom.db'
+    for include_abstract in (True, False):
+        expected_collector = OSLOCollector(subset_path)
+        expected_collector.collect_all(include_abstract=include_abstract)
+
+        collector = SubsetLoader.load_all(subset_path=subset_path, include_abstract=include_abstract)
+
+        for list_name in COLLECTOR_FIELDS:
+            assert getattr(collector, list_name) == getattr(expected_collector, list_name)
+        assert collector.class_dict == expected_collector.class_dict
+
+
+def test_subset_is_opened_read_only():
+    connection = SubsetLoader._connect(current_dir / 'voorbeeld-slagboom.db')
+    try:
+        with pytest.raises(sqlite3.OperationalError):
+            connection.execute("DELETE FROM OSLOClass")
+    finally:
+        connection.close()
+
+
+def test_generate_template_with_read_only_subset_loading(tmp_path):
+    SubsetTemplateCreator.read_only_subset_loading = True
+    try:
+        csv_path = tmp_path / 'template.csv'
+        SubsetTemplateCreator.generate_template_from_subset(
+            subset_path=current_dir / 'voorbeeld-slagboom.db', template_file_path=csv_path, split_per_type=False,
+            ignore_relations=False)
+        assert csv_path.exists()
+    finally:
+        SubsetTemplateCreator.read_only_subset_loading = False
@@ -1,4 +1,7 @@
+import asyncio
 import gc
+import inspect
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 
 import openpyxl
@@ -246,3 +249,121 @@ def test_subset_with_long_class_name_excel_generic():
     gc.collect()
 
     excel_path.unlink()
+
+
+def test_build_attribute_index_matches_find_attributes_by_class():
+    collector = SubsetTemplateCreator._load_collector_from_subset_path(current_dir / 'OTL_AllCasesTestClass.db')
+
+    attribute_index = SubsetTemplateCreator.build_attribute_index(collector=collector)
+
+    for oslo_class in collector.classes:
+        expected_names = [a.name for a in collector.find_attributes_by_class(oslo_class)]
+        assert attribute_index.get(oslo_class.objectUri, []) == expected_names
+
+
+def summarize_objects(objects):
+    return sorted((o.typeURI, tuple(sorted(a.naam for a in o if a.waarde is not None))) for o in objects)
+
+
+def test_process_executor_generates_same_objects_as_thread_executor():
+    kwargs = {'subset_path': current_dir / 'voorbeeld-slagboom.db', 'class_uris_filter': None,
+              'filter_attributes_by_subset': True, 'dummy_data_rows': 2, 'add_geometry': True,
+              'ignore_relations': False}
+    thread_objects = SubsetTemplateCreator.generate_objects_for_template(**kwargs)
+    process_objects = SubsetTemplateCreator.generate_objects_for_template(executor='process', **kwargs)
+
+    assert summarize_objects(process_objects) == summarize_objects(thread_objects)
+
+
+def test_injected_executor_is_used_and_not_shut_down():
+    kwargs = {'subset_path': current_dir / 'OTL_AllCasesTestClass.db', 'class_uris_filter': None,
+              'filter_attributes_by_subset': True, 'dummy_data_rows': 3, 'add_geometry': True,
+              'ignore_relations': True, 'model_directory': model_directory_path}
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        first_objects = SubsetTemplateCreator.generate_objects_for_template(executor=executor, **kwargs)
+        second_objects = SubsetTemplateCreator.generate_objects_for_template(executor=executor, **kwargs)
+
+    thread_objects = SubsetTemplateCreator.generate_objects_for_template(**kwargs)
+    assert summarize_objects(first_objects) == summarize_objects(thread_objects)
+    assert summarize_objects(second_objects) == summarize_objects(thread_objects)
+
+
+def test_unknown_executor_raises_value_error():
+    with pytest.raises(ValueError):
+        SubsetTemplateCreator.generate_objects_for_template(
+            subset_path=current_dir / 'OTL_AllCasesTestClass.db', class_uris_filter=None,
+            filter_attributes_by_subset=True, dummy_data_rows=1, add_geometry=True, ignore_relations=True,
+            executor='fiber')
+
+
+def test_clone_prototype_generates_rows_with_prototype_values():
+    objects = SubsetTemplateCreator.generate_objects_for_template(
+        subset_path=current_dir / 'OTL_AllCasesTestClass.db', model_directory=model_directory_path,
+        class_uris_filter=['https://wegenenverkeer.data.vlaanderen.be/ns/onderdeel#AllCasesTestClass'],
+        filter_attributes_by_subset=True, dummy_data_rows=50, add_geometry=True, ignore_relations=True,
+        clone_prototype=True)
+
+    assert len(objects) == 50
+    assert len({o.assetId.identificator for o in objects}) == 50
+    prototype_dict = objects[0].to_dict()
+    del prototype_dict['assetId']['identificator']
+    for clone in objects[1:]:
+        clone_dict = clone.to_dict()
+        del clone_dict['assetId']['identificator']
+        assert clone_dict == prototype_dict
+
+    # changing a clone does not change the prototype
+    objects[1].testComplexType.testStringField = 'changed'
+    assert objects[0].testComplexType.testStringField != 'changed'
+
+
+def test_clone_prototype_with_randomized_values():
+    objects = SubsetTemplateCreator.generate_objects_for_template(
+        subset_path=current_dir / 'OTL_AllCasesTestClass.db', model_directory=model_directory_path,
+        class_uris_filter=['https://wegenenverkeer.data.vlaanderen.be/ns/onderdeel#AllCasesTestClass'],
+        filter_attributes_by_subset=True, dummy_data_rows=20, add_geometry=True, ignore_relations=True,
+        clone_prototype=True, randomize_clones=True)
+
+    assert len({o.testStringField for o in objects}) > 1
+    assert all(o.testComplexType.testStringField == objects[0].testComplexType.testStringField for o in objects)
+
+
+class CountingThreadPoolExecutor(ThreadPoolExecutor):
+    def __init__(self):
+        super().__init__(max_workers=1)
+        self.submitted = 0
+
+    def submit(self, *args, **kwargs):
+        self.submitted += 1
+        return super().submit(*args, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_async_generation_runs_blocking_phases_in_offload_executor(tmp_path):
+    heartbeats = []
+
+    async def heartbeat():
+        while True:
+            heartbeats.append(asyncio.get_running_loop().time())
+            await asyncio.sleep(0.005)
+
+    heartbeat_task = asyncio.create_task(heartbeat())
+    with CountingThreadPoolExecutor() as offload_executor:
+        await SubsetTemplateCreator.generate_template_from_subset_async(
+            subset_path=current_dir / 'OTL_AllCasesTestClass.db', template_file_path=tmp_path / 'template.xlsx',
+            model_directory=model_directory_path, dummy_data_rows=20, offload_executor=offload_executor)
+        heartbeat_task.cancel()
+
+        # the whole generation runs as a single call of generate_template_from_subset
+        assert offload_executor.submitted == 1
+    # the event loop kept running the other task while the template was generated
+    assert len(heartbeats) > 4
+    assert (tmp_path / 'template.xlsx').exists()
+
+
+def test_async_generation_has_the_signature_of_the_sync_generation():
+    sync_parameters = inspect.signature(SubsetTemplateCreator.generate_template_from_subset).parameters
+    async_parameters = dict(inspect.signature(SubsetTemplateCreator.generate_template_from_subset_async).parameters)
+    async_parameters.pop('offload_executor')
+
+    assert list(async_parameters.values()) == list(sync_parameters.values())
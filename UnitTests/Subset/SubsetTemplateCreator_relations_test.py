@@ -357,3 +357,19 @@ def test_subset_slagboom_relations_2_non_related_selected_classes_2_rows():
     gc.collect()
 
     excel_path.unlink()
+
+
+def test_build_relation_index_matches_find_all_concrete_relations():
+    collector = SubsetTemplateCreator._load_collector_from_subset_path(current_dir / 'voorbeeld-slagboom.db')
+    class_uris = [c.objectUri for c in collector.classes if c.abstract == 0]
+
+    relation_index = SubsetTemplateCreator.build_relation_index(collector=collector, class_uris=class_uris)
+
+    for class_uri in class_uris:
+        expected = [(r.doel_uri, r.richting, r.objectUri)
+                    for r in collector.find_all_concrete_relations(objectUri=class_uri) if r.bron_uri == class_uri]
+        indexed = relation_index.get(class_uri, [])
+        assert [(doel_uri, richting, relation_uri) for _, doel_uri, richting, relation_uri in indexed] == expected
+        for relation_type, _, _, relation_uri in indexed:
+            if relation_type is not None:
+                assert relation_type.typeURI == relation_uri
@@ -0,0 +1,66 @@
+from pathlib import Path
+
+import openpyxl
+
+from otlmow_template.SubsetTemplateCreator import SubsetTemplateCreator
+
+current_dir = Path(__file__).parent
+model_directory_path = Path(__file__).parent.parent / 'TestModel'
+all_cases_uri = 'https://wegenenverkeer.data.vlaanderen.be/ns/onderdeel#AllCasesTestClass'
+
+
+def read_workbook(file_path: Path) -> dict[str, list[tuple]]:
+    workbook = openpyxl.load_workbook(file_path)
+    sheets = {sheet.title: [tuple(cell.value for cell in row) for row in sheet.iter_rows()] for sheet in workbook}
+    workbook.close()
+    return sheets
+
+
+def test_iter_objects_for_template_yields_the_objects_per_class():
+    objects = SubsetTemplateCreator.generate_objects_for_template(
+        subset_path=current_dir / 'OTL_AllCasesTestClass.db', class_uris_filter=None,
+        filter_attributes_by_subset=True, dummy_data_rows=3, add_geometry=True, ignore_relations=False,
+        model_directory=model_directory_path, seed=4)
+
+    class_batches = list(SubsetTemplateCreator.iter_objects_for_template(
+        subset_path=current_dir / 'OTL_AllCasesTestClass.db', class_uris_filter=None,
+        filter_attributes_by_subset=True, dummy_data_rows=3, add_geometry=True, ignore_relations=False,
+        model_directory=model_directory_path, seed=4))
+
+    assert all(len({o.typeURI for o in class_batch}) == 1 for class_batch in class_batches)
+    streamed_objects = [o for class_batch in class_batches for o in class_batch]
+    assert sorted(o.to_dict()['assetId']['identificator'] for o in streamed_objects) == sorted(
+        o.to_dict()['assetId']['identificator'] for o in objects)
+    assert [o.to_dict() for o in streamed_objects if o.typeURI == all_cases_uri] == [
+        o.to_dict() for o in objects if o.typeURI == all_cases_uri]
+
+
+def test_streaming_xlsx_template_is_identical(tmp_path):
+    file_paths = []
+    for streaming in (False, True):
+        file_path = tmp_path / f'template_{streaming}.xlsx'
+        SubsetTemplateCreator.generate_template_from_subset(
+            subset_path=current_dir / 'OTL_AllCasesTestClass.db', template_file_path=file_path, dummy_data_rows=4,
+            ignore_relations=False, add_attribute_info=True, add_deprecated=True,
+            model_directory=model_directory_path, seed=2, streaming=streaming)
+        file_paths.append(file_path)
+
+    regular_sheets = read_workbook(file_paths[0])
+    assert 'onderdeel#Bevestiging' in regular_sheets
+    assert read_workbook(file_paths[1]) == regular_sheets
+
+
+def test_streaming_csv_template_per_class_is_identical(tmp_path):
+    for streaming in (False, True):
+        (tmp_path / str(streaming)).mkdir()
+        SubsetTemplateCreator.generate_template_from_subset(
+            subset_path=current_dir / 'OTL_AllCasesTestClass.db', template_file_path=tmp_path / str(streaming) /
+            'template.csv', dummy_data_rows=4, ignore_relations=False, add_attribute_info=True,
+            model_directory=model_directory_path, seed=2, streaming=streaming)
+
+    regular_files = sorted(p.name for p in (tmp_path / 'False').iterdir())
+    assert len(regular_files) > 3
+    assert sorted(p.name for p in (tmp_path / 'True').iterdir()) == regular_files
+    for file_name in regular_files:
+        assert (tmp_path / 'True' / file_name).read_text(encoding='utf-8') == (
+            tmp_path / 'False' / file_name).read_text(encoding='utf-8')
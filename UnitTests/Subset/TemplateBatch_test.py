@@ -0,0 +1,30 @@
+from pathlib import Path
+
+from otlmow_template.SubsetTemplateCreator import SubsetTemplateCreator
+from otlmow_template.TemplateBatch import TemplateJob
+
+current_dir = Path(__file__).parent
+model_directory_path = Path(__file__).parent.parent / 'TestModel'
+
+
+def test_generate_templates_from_subsets_reports_every_job(tmp_path):
+    options = {'model_directory': model_directory_path, 'dummy_data_rows': 2}
+    jobs = [
+        TemplateJob(subset_path=current_dir / 'OTL_AllCasesTestClass.db', template_file_path=tmp_path / 'first.xlsx',
+                    options=options),
+        TemplateJob(subset_path=current_dir / 'does_not_exist.db', template_file_path=tmp_path / 'missing.xlsx',
+                    options=options),
+        TemplateJob(subset_path=current_dir / 'OTL_AllCasesTestClass.db', template_file_path=tmp_path / 'second.csv',
+                    options={**options, 'split_per_type': False}),
+    ]
+
+    results = SubsetTemplateCreator.generate_templates_from_subsets(jobs=jobs, max_workers=2)
+
+    assert [result.job for result in results] == jobs
+    assert [result.success for result in results] == [True, False, True]
+    assert all(result.duration_seconds > 0 for result in results)
+    assert results[0].error is None
+    assert results[1].error is not None
+    assert (tmp_path / 'first.xlsx').exists()
+    assert (tmp_path / 'second.csv').exists()
+    assert not (tmp_path / 'missing.xlsx').exists()
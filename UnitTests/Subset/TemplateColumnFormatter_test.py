@@ -0,0 +1,79 @@
+from pathlib import Path
+
+import openpyxl
+import pytest
+
+from otlmow_template.SubsetTemplateCreator import SubsetTemplateCreator
+from otlmow_template.TemplateColumnFormatter import TemplateColumnFormatter
+from otlmow_template.TemplatePlan import AGENT_URI
+
+current_dir = Path(__file__).parent
+model_directory_path = Path(__file__).parent.parent / 'TestModel'
+
+
+@pytest.mark.parametrize('write_only', [False, True])
+def test_columns_are_formatted_and_validated_up_to_max_row(tmp_path, write_only):
+    file_path = tmp_path / 'template.xlsx'
+    SubsetTemplateCreator.generate_template_from_subset(
+        subset_path=current_dir / 'OTL_AllCasesTestClass.db', template_file_path=file_path, ignore_relations=False,
+        add_attribute_info=True, add_deprecated=True, model_directory=model_directory_path, seed=3,
+        dummy_data_rows=2, max_row=10000, write_only=write_only)
+
+    workbook = openpyxl.load_workbook(file_path)
+    sheet = workbook['onderdeel#AnotherTestClass']
+    headers = [cell.value for cell in sheet[3]]
+    # only the dummy data rows have cells, the formatting of the other rows is set per column
+    assert sheet.max_row == 5
+    text_column = openpyxl.utils.get_column_letter(headers.index('assetId.identificator') + 1)
+    assert sheet.column_dimensions[text_column].number_format == '@'
+    assert sheet[f'{text_column}4'].number_format == '@'
+    assert sheet.column_dimensions['A'].number_format == 'General'
+
+    validations = {dv.formula1: str(dv.sqref) for dv in sheet.data_validations.dataValidation}
+    assert validations['"https://wegenenverkeer.data.vlaanderen.be/ns/onderdeel#AnotherTestClass"'] == 'A4:A10000'
+    assert all(cell_range.endswith('10000') for sqref in validations.values() for cell_range in sqref.split())
+    colored_ranges = str(next(iter(sheet.conditional_formatting)).sqref).split()
+    assert validations['"TRUE,FALSE,-"'] in colored_ranges
+    workbook.close()
+
+
+@pytest.mark.parametrize('write_only', [False, True])
+def test_choice_list_validations_are_merged_and_refer_to_named_ranges(tmp_path, write_only):
+    file_path = tmp_path / 'template.xlsx'
+    SubsetTemplateCreator.generate_template_from_subset(
+        subset_path=current_dir / 'OTL_AllCasesTestClass.db', template_file_path=file_path, ignore_relations=False,
+        model_directory=model_directory_path, seed=3, write_only=write_only)
+
+    workbook = openpyxl.load_workbook(file_path)
+    choice_lists = {cell.value: cell.column_letter for cell in workbook['Keuzelijsten'][1]}
+    range_name = TemplateColumnFormatter.get_choice_list_range_name('KlTestKeuzelijst')
+    assert workbook.defined_names[range_name].attr_text == \
+        f'Keuzelijsten!${choice_lists["KlTestKeuzelijst"]}$2:${choice_lists["KlTestKeuzelijst"]}$7'
+
+    sheet = workbook['onderdeel#AllCasesTestClass']
+    formulas = [dv.formula1 for dv in sheet.data_validations.dataValidation]
+    assert len(formulas) == len(set(formulas))
+    validations = {dv.formula1: str(dv.sqref).split() for dv in sheet.data_validations.dataValidation}
+    assert len(validations[range_name]) == 2
+    assert len(validations['"TRUE,FALSE,-"']) == 4
+    # the sheets share the named range of a choice list
+    shared_range_name = TemplateColumnFormatter.get_choice_list_range_name('KlAIMToestand')
+    assert shared_range_name in validations
+    other_sheet = workbook['onderdeel#AnotherTestClass']
+    assert shared_range_name in [dv.formula1 for dv in other_sheet.data_validations.dataValidation]
+    workbook.close()
+
+
+def test_get_sheet_title():
+    type_uri = 'https://wegenenverkeer.data.vlaanderen.be/ns/onderdeel#AllCasesTestClass'
+    assert TemplateColumnFormatter.get_sheet_title(type_uri=type_uri, abbreviate_excel_sheettitles=False) == \
+        'onderdeel#AllCasesTestClass'
+    assert TemplateColumnFormatter.get_sheet_title(type_uri=type_uri, abbreviate_excel_sheettitles=True) == \
+        'ond#AllCasesTestClass'
+    assert TemplateColumnFormatter.get_sheet_title(type_uri=AGENT_URI, abbreviate_excel_sheettitles=True) == 'Agent'
+    long_type_uri = 'https://wegenenverkeer.data.vlaanderen.be/ns/installatie#SlagboomarmVerlichtingMetEenLangeNaam'
+    # like the regular templates, the title is only cut off at 31 characters when it is abbreviated
+    assert TemplateColumnFormatter.get_sheet_title(type_uri=long_type_uri, abbreviate_excel_sheettitles=False) == \
+        'installatie#SlagboomarmVerlichtingMetEenLangeNaam'
+    assert TemplateColumnFormatter.get_sheet_title(type_uri=long_type_uri, abbreviate_excel_sheettitles=True) == \
+        'ins#SlagboomarmVerlichtingMetEe'
@@ -0,0 +1,117 @@
+import shutil
+import sqlite3
+from pathlib import Path
+
+import openpyxl
+
+from otlmow_template.SubsetTemplateCreator import SubsetTemplateCreator
+from otlmow_template.TemplateManifest import TemplateManifest
+
+current_dir = Path(__file__).parent
+model_directory_path = Path(__file__).parent.parent / 'TestModel'
+all_cases_uri = 'https://wegenenverkeer.data.vlaanderen.be/ns/onderdeel#AllCasesTestClass'
+another_uri = 'https://wegenenverkeer.data.vlaanderen.be/ns/onderdeel#AnotherTestClass'
+deprecated_uri = 'https://wegenenverkeer.data.vlaanderen.be/ns/onderdeel#DeprecatedTestClass'
+
+
+def copy_subset(tmp_path: Path) -> Path:
+    subset_path = tmp_path / 'subset.db'
+    shutil.copyfile(current_dir / 'OTL_AllCasesTestClass.db', subset_path)
+    return subset_path
+
+
+def execute_on_subset(subset_path: Path, query: str, params: tuple = ()) -> None:
+    connection = sqlite3.connect(subset_path)
+    connection.execute(query, params)
+    connection.commit()
+    connection.close()
+
+
+def read_workbook(file_path: Path) -> dict[str, list[tuple]]:
+    workbook = openpyxl.load_workbook(file_path)
+    sheets = {sheet.title: [tuple(cell.value for cell in row) for row in sheet.iter_rows()] for sheet in workbook}
+    workbook.close()
+    return sheets
+
+
+def test_regenerate_xlsx_template_rebuilds_only_the_changed_classes(tmp_path):
+    subset_path = copy_subset(tmp_path)
+    template_path = tmp_path / 'template.xlsx'
+
+    changes = SubsetTemplateCreator.regenerate_template_from_subset(
+        subset_path=subset_path, template_file_path=template_path, dummy_data_rows=2,
+        model_directory=model_directory_path, seed=3)
+    assert sorted(changes.added) == [all_cases_uri, another_uri, deprecated_uri]
+    assert TemplateManifest.get_manifest_path(template_path).exists()
+    first_sheets = read_workbook(template_path)
+
+    assert SubsetTemplateCreator.regenerate_template_from_subset(
+        subset_path=subset_path, template_file_path=template_path, dummy_data_rows=2,
+        model_directory=model_directory_path, seed=3).is_empty
+
+    execute_on_subset(subset_path, 'UPDATE OSLOAttributen SET definition_nl = ? WHERE class_uri = ?',
+                      ('changed definition', another_uri))
+    execute_on_subset(subset_path, 'DELETE FROM OSLOClass WHERE uri = ?', (deprecated_uri,))
+    changes = SubsetTemplateCreator.regenerate_template_from_subset(
+        subset_path=subset_path, template_file_path=template_path, dummy_data_rows=2,
+        model_directory=model_directory_path, seed=3)
+
+    assert changes.changed == [another_uri]
+    assert changes.removed == [deprecated_uri]
+    assert changes.added == []
+    sheets = read_workbook(template_path)
+    assert list(sheets) == ['onderdeel#AllCasesTestClass', 'onderdeel#AnotherTestClass', 'Keuzelijsten']
+    assert sheets['onderdeel#AllCasesTestClass'] == first_sheets['onderdeel#AllCasesTestClass']
+    assert sheets['Keuzelijsten'] == first_sheets['Keuzelijsten']
+    identificators = [row[1] for sheet in ('onderdeel#AllCasesTestClass', 'onderdeel#AnotherTestClass')
+                      for row in sheets[sheet][1:] if row[1] is not None]
+    assert len(identificators) == 4
+    assert len(set(identificators)) == 4
+
+    workbook = openpyxl.load_workbook(template_path)
+    another_sheet = workbook['onderdeel#AnotherTestClass']
+    assert another_sheet.data_validations.dataValidation
+    workbook.close()
+
+
+def test_regenerate_csv_template_removes_the_files_of_removed_classes(tmp_path):
+    subset_path = copy_subset(tmp_path)
+    template_path = tmp_path / 'template.csv'
+    SubsetTemplateCreator.regenerate_template_from_subset(
+        subset_path=subset_path, template_file_path=template_path, dummy_data_rows=2,
+        model_directory=model_directory_path, add_attribute_info=True)
+    all_cases_path = SubsetTemplateCreator.get_csv_file_path_for_type(template_path, all_cases_uri)
+    all_cases_content = all_cases_path.read_text(encoding='utf-8')
+
+    execute_on_subset(subset_path, 'DELETE FROM OSLOClass WHERE uri = ?', (deprecated_uri,))
+    execute_on_subset(subset_path, 'UPDATE OSLOAttributen SET definition_nl = ? WHERE class_uri = ?',
+                      ('changed definition', another_uri))
+    changes = SubsetTemplateCreator.regenerate_template_from_subset(
+        subset_path=subset_path, template_file_path=template_path, dummy_data_rows=2,
+        model_directory=model_directory_path, add_attribute_info=True)
+
+    assert changes.removed == [deprecated_uri]
+    assert not SubsetTemplateCreator.get_csv_file_path_for_type(template_path, deprecated_uri).exists()
+    assert all_cases_path.read_text(encoding='utf-8') == all_cases_content
+    another_content = SubsetTemplateCreator.get_csv_file_path_for_type(template_path, another_uri).read_text(
+        encoding='utf-8')
+    assert another_content.startswith('De URI van het object')
+    # the regenerated class continues after the identificators of the first run
+    assert 'dummy_aaag' in another_content
+    assert 'dummy_aaaa' not in another_content
+
+
+def test_regenerate_with_other_options_rebuilds_the_whole_template(tmp_path):
+    subset_path = copy_subset(tmp_path)
+    template_path = tmp_path / 'template.xlsx'
+    SubsetTemplateCreator.regenerate_template_from_subset(
+        subset_path=subset_path, template_file_path=template_path, dummy_data_rows=1,
+        model_directory=model_directory_path)
+
+    changes = SubsetTemplateCreator.regenerate_template_from_subset(
+        subset_path=subset_path, template_file_path=template_path, dummy_data_rows=3,
+        model_directory=model_directory_path)
+
+    assert sorted(changes.changed) == [all_cases_uri, another_uri, deprecated_uri]
+    rows = read_workbook(template_path)['onderdeel#AnotherTestClass']
+    assert len([row for row in rows if row[0] is not None]) == 4
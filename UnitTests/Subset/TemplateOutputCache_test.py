@@ -0,0 +1,108 @@
+from pathlib import Path
+
+import pytest
+
+from otlmow_template.SubsetTemplateCreator import SubsetTemplateCreator
+from otlmow_template.TemplateOutputCache import TemplateOutputCache
+
+current_dir = Path(__file__).parent
+model_directory_path = Path(__file__).parent.parent / 'TestModel'
+
+
+@pytest.fixture
+def output_cache(tmp_path):
+    SubsetTemplateCreator.enable_template_output_cache(cache_directory=tmp_path / 'cache')
+    yield SubsetTemplateCreator.template_output_cache
+    SubsetTemplateCreator.disable_template_output_cache()
+
+
+def test_cache_key_depends_on_options():
+    subset_path = current_dir / 'OTL_AllCasesTestClass.db'
+    template_path = Path('template.xlsx')
+    key = TemplateOutputCache.get_cache_key(subset_path=subset_path, template_file_path=template_path,
+                                            dummy_data_rows=1, class_uris_filter=['b', 'a'])
+
+    assert key == TemplateOutputCache.get_cache_key(subset_path=subset_path, template_file_path=template_path,
+                                                    dummy_data_rows=1, class_uris_filter=['a', 'b'])
+    assert key != TemplateOutputCache.get_cache_key(subset_path=subset_path, template_file_path=template_path,
+                                                    dummy_data_rows=2, class_uris_filter=['a', 'b'])
+    assert key != TemplateOutputCache.get_cache_key(subset_path=subset_path, template_file_path=Path('template.csv'),
+                                                    dummy_data_rows=1, class_uris_filter=['a', 'b'])
+    assert key != TemplateOutputCache.get_cache_key(subset_path=subset_path, template_file_path=template_path,
+                                                    dummy_data_rows=1, class_uris_filter=['a', 'b'],
+                                                    abbreviate_excel_sheettitles=True)
+
+
+def test_cached_excel_template_is_restored(tmp_path, output_cache):
+    kwargs = {'subset_path': current_dir / 'OTL_AllCasesTestClass.db', 'model_directory': model_directory_path,
+              'add_attribute_info': True}
+    first_path = tmp_path / 'first.xlsx'
+    SubsetTemplateCreator.generate_template_from_subset(template_file_path=first_path, **kwargs)
+    second_path = tmp_path / 'second.xlsx'
+    SubsetTemplateCreator.generate_template_from_subset(template_file_path=second_path, **kwargs)
+
+    assert second_path.read_bytes() == first_path.read_bytes()
+    statistics = SubsetTemplateCreator.get_template_output_cache_statistics()
+    assert statistics['hits'] == 1
+    assert statistics['misses'] == 1
+
+
+def test_cached_csv_template_split_per_type_restores_all_files(tmp_path, output_cache):
+    kwargs = {'subset_path': current_dir / 'OTL_AllCasesTestClass.db', 'model_directory': model_directory_path,
+              'split_per_type': True}
+    SubsetTemplateCreator.generate_template_from_subset(template_file_path=tmp_path / 'first.csv', **kwargs)
+    first_files = sorted(p.name[len('first'):] for p in tmp_path.glob('first_*.csv'))
+
+    SubsetTemplateCreator.generate_template_from_subset(template_file_path=tmp_path / 'second.csv', **kwargs)
+    second_files = sorted(p.name[len('second'):] for p in tmp_path.glob('second_*.csv'))
+
+    assert len(first_files) == 3
+    assert second_files == first_files
+    for suffix in first_files:
+        assert (tmp_path / f'second{suffix}').read_bytes() == (tmp_path / f'first{suffix}').read_bytes()
+    assert output_cache.get_statistics()['hits'] == 1
+
+
+@pytest.mark.asyncio
+async def test_cached_template_is_restored_async(tmp_path, output_cache):
+    kwargs = {'subset_path': current_dir / 'OTL_AllCasesTestClass.db', 'model_directory': model_directory_path}
+    await SubsetTemplateCreator.generate_template_from_subset_async(template_file_path=tmp_path / 'a.xlsx', **kwargs)
+    await SubsetTemplateCreator.generate_template_from_subset_async(template_file_path=tmp_path / 'b.xlsx', **kwargs)
+
+    assert (tmp_path / 'b.xlsx').read_bytes() == (tmp_path / 'a.xlsx').read_bytes()
+    assert output_cache.get_statistics()['hits'] == 1
+
+
+def test_hard_linked_template_shares_the_cached_file(tmp_path):
+    cache = TemplateOutputCache(cache_directory=tmp_path / 'cache', use_hard_links=True)
+    template_path = tmp_path / 'template.xlsx'
+    template_path.write_bytes(b'template')
+    cache.store(cache_key='key', template_file_path=template_path, created_file_paths=[template_path])
+
+    restored_path = tmp_path / 'restored.xlsx'
+    assert cache.restore(cache_key='key', template_file_path=restored_path)
+    assert restored_path.read_bytes() == b'template'
+    assert restored_path.stat().st_ino == (tmp_path / 'cache' / 'key' / '.xlsx').stat().st_ino
+
+
+def test_eviction_keeps_cache_within_max_size(tmp_path):
+    cache = TemplateOutputCache(cache_directory=tmp_path / 'cache', max_size_bytes=10)
+    for index in range(3):
+        template_path = tmp_path / f'template_{index}.csv'
+        template_path.write_bytes(b'12345678')
+        cache.store(cache_key=f'key_{index}', template_file_path=template_path, created_file_paths=[template_path])
+
+    assert not cache.restore(cache_key='key_0', template_file_path=tmp_path / 'restored.csv')
+    assert cache.restore(cache_key='key_2', template_file_path=tmp_path / 'restored.csv')
+    assert cache.get_statistics()['evictions'] == 2
+
+
+@pytest.mark.asyncio
+async def test_sync_and_async_generation_share_cache_entries(tmp_path, output_cache):
+    kwargs = {'subset_path': current_dir / 'OTL_AllCasesTestClass.db', 'model_directory': model_directory_path}
+    SubsetTemplateCreator.generate_template_from_subset(template_file_path=tmp_path / 'sync.xlsx', **kwargs)
+    await SubsetTemplateCreator.generate_template_from_subset_async(template_file_path=tmp_path / 'async.xlsx',
+                                                                    **kwargs)
+
+    assert (tmp_path / 'async.xlsx').read_bytes() == (tmp_path / 'sync.xlsx').read_bytes()
+    assert output_cache.get_statistics()['hits'] == 1
@@ -0,0 +1,97 @@
+from pathlib import Path
+
+from openpyxl.reader.excel import load_workbook
+from otlmow_converter.OtlmowConverter import OtlmowConverter
+
+from otlmow_template.CsvTemplateWriter import CsvTemplateWriter
+from otlmow_template.ExcelTemplateWriter import ExcelTemplateWriter
+from otlmow_template.SubsetTemplateCreator import SubsetTemplateCreator
+from otlmow_template.TemplatePlan import TemplatePlan
+
+current_dir = Path(__file__).parent
+model_directory_path = Path(__file__).parent.parent / 'TestModel'
+
+all_cases_uri = 'https://wegenenverkeer.data.vlaanderen.be/ns/onderdeel#AllCasesTestClass'
+
+
+def test_compile_plan_columns():
+    plan = SubsetTemplateCreator.compile_template_plan(
+        subset_path=current_dir / 'OTL_AllCasesTestClass.db', model_directory=model_directory_path,
+        class_uris_filter=[all_cases_uri])
+
+    class_plan = plan.classes[all_cases_uri]
+    assert class_plan.headers[:3] == ['typeURI', 'assetId.identificator', 'assetId.toegekendDoor']
+    assert class_plan.headers[3:] == sorted(class_plan.headers[3:])
+    assert class_plan.row_count == 1
+
+    boolean_column = class_plan.get_column('testBooleanField')
+    assert boolean_column.native_type == 'bool'
+    assert boolean_column.validation == 'boolean'
+
+    keuzelijst_column = class_plan.get_column('testKeuzelijst')
+    assert keuzelijst_column.validation == 'choice_list'
+    assert keuzelijst_column.choice_list_name == 'KlTestKeuzelijst'
+    assert keuzelijst_column.choice_list_options == ['waarde-1', 'waarde-2', 'waarde-3', 'waarde-4', 'waarde-5']
+
+    string_column = class_plan.get_column('testStringField')
+    assert string_column.is_string
+    assert string_column.definition == 'Test attribuut voor StringField'
+    assert not string_column.deprecated
+
+
+def test_plan_save_and_load(tmp_path):
+    plan_path = tmp_path / 'plan.json'
+    plan = SubsetTemplateCreator.compile_template_plan(
+        subset_path=current_dir / 'OTL_AllCasesTestClass.db', model_directory=model_directory_path,
+        plan_file_path=plan_path)
+
+    loaded_plan = TemplatePlan.load(plan_path)
+
+    assert loaded_plan == plan
+    assert loaded_plan.classes[all_cases_uri].get_column('testKeuzelijst').has_choice_list
+
+
+def generate_all_cases_objects(dummy_data_rows: int) -> list:
+    return SubsetTemplateCreator.generate_objects_for_template(
+        subset_path=current_dir / 'OTL_AllCasesTestClass.db', model_directory=model_directory_path,
+        class_uris_filter=None, filter_attributes_by_subset=True, dummy_data_rows=dummy_data_rows, add_geometry=True,
+        ignore_relations=False, seed=3)
+
+
+def test_plan_compiled_from_tables_equals_plan_compiled_from_objects():
+    # exporting the objects alters them, so every plan is compiled from objects of its own
+    expected_plan = TemplatePlan.compile(generate_all_cases_objects(dummy_data_rows=3))
+
+    prototypes = {}
+    table_dict = ExcelTemplateWriter.get_tables_per_type(TemplatePlan.iter_recording_prototypes(
+        generate_all_cases_objects(dummy_data_rows=3), prototypes))
+    assert ExcelTemplateWriter.compile_template_plan(table_dict=table_dict, prototypes=prototypes).classes == \
+        expected_plan.classes
+
+    prototypes = {}
+    tables = CsvTemplateWriter.get_tables(TemplatePlan.iter_recording_prototypes(
+        generate_all_cases_objects(dummy_data_rows=3), prototypes), split_per_type=True)
+    assert CsvTemplateWriter.compile_template_plan(tables=tables, prototypes=prototypes).classes == \
+        expected_plan.classes
+
+
+def test_excel_template_rendered_from_loaded_plan(tmp_path):
+    objects = SubsetTemplateCreator.generate_objects_for_template(
+        subset_path=current_dir / 'OTL_AllCasesTestClass.db', model_directory=model_directory_path,
+        class_uris_filter=[all_cases_uri], filter_attributes_by_subset=True, dummy_data_rows=1, add_geometry=True,
+        ignore_relations=True)
+    plan_path = tmp_path / 'plan.json'
+    TemplatePlan.compile(objects).save(plan_path)
+
+    template_path = tmp_path / 'template.xlsx'
+    OtlmowConverter.from_objects_to_file(file_path=template_path, sequence_of_objects=objects)
+    SubsetTemplateCreator.alter_excel_template(
+        instances=[], file_path=template_path, add_attribute_info=True, generate_choice_list=True,
+        dummy_data_rows=1, add_deprecated=False, abbreviate_excel_sheettitles=False,
+        template_plan=TemplatePlan.load(plan_path))
+
+    wb = load_workbook(template_path)
+    sheet = wb['onderdeel#AllCasesTestClass']
+    assert sheet['A1'].value == 'De URI van het object volgens https://www.w3.org/2001/XMLSchema#anyURI .'
+    assert 'Keuzelijsten' in wb.sheetnames
+    assert len(sheet.data_validations.dataValidation) > 2
@@ -0,0 +1,90 @@
+from pathlib import Path
+
+import openpyxl
+
+from otlmow_template.SubsetTemplateCreator import SubsetTemplateCreator
+from otlmow_template.TemplateColumnFormatter import DEFAULT_MAX_ROW
+
+current_dir = Path(__file__).parent
+model_directory_path = Path(__file__).parent.parent / 'TestModel'
+
+
+def generate_template(file_path: Path, **options) -> None:
+    SubsetTemplateCreator.generate_template_from_subset(
+        subset_path=current_dir / 'OTL_AllCasesTestClass.db', template_file_path=file_path, ignore_relations=False,
+        add_attribute_info=True, add_deprecated=True, model_directory=model_directory_path, seed=3, **options)
+
+
+def read_values(file_path: Path) -> dict[str, list[tuple]]:
+    workbook = openpyxl.load_workbook(file_path)
+    sheets = {sheet.title: [tuple(cell.value for cell in row) for row in sheet.iter_rows()
+                            if any(cell.value is not None for cell in row)] for sheet in workbook}
+    workbook.close()
+    return sheets
+
+
+def test_write_only_template_has_the_values_of_the_regular_template(tmp_path):
+    generate_template(tmp_path / 'regular.xlsx', dummy_data_rows=3)
+    generate_template(tmp_path / 'write_only.xlsx', dummy_data_rows=3, write_only=True)
+    generate_template(tmp_path / 'streaming.xlsx', dummy_data_rows=3, write_only=True, streaming=True)
+
+    regular_values = read_values(tmp_path / 'regular.xlsx')
+    assert list(regular_values)[-1] == 'Keuzelijsten'
+    assert read_values(tmp_path / 'write_only.xlsx') == regular_values
+    assert read_values(tmp_path / 'streaming.xlsx') == regular_values
+
+
+def test_write_only_template_has_styles_and_validations(tmp_path):
+    file_path = tmp_path / 'template.xlsx'
+    generate_template(file_path, dummy_data_rows=0, write_only=True)
+
+    workbook = openpyxl.load_workbook(file_path)
+    sheet = workbook['onderdeel#AnotherTestClass']
+    # attribute info, deprecated row and header
+    assert sheet['A1'].fill.fgColor.rgb == '00808080'
+    assert 'DEPRECATED' in [cell.value for cell in sheet[2]]
+    assert sheet['A3'].value == 'typeURI'
+    assert sheet.max_row == 3
+    assert sheet.column_dimensions['A'].width == 25
+
+    validations = {dv.formula1: str(dv.sqref) for dv in sheet.data_validations.dataValidation}
+    assert validations['"TRUE,FALSE,-"'].endswith(f'4:H{DEFAULT_MAX_ROW}')
+    choice_list_validation = next(formula for formula in validations if formula.startswith('Keuzelijst_'))
+    colored_ranges = str(next(iter(sheet.conditional_formatting)).sqref).split()
+    assert validations[choice_list_validation] in colored_ranges
+    assert workbook['Keuzelijsten']['A2'].value == '-'
+    workbook.close()
+
+
+def read_formats(file_path: Path) -> dict[str, tuple]:
+    workbook = openpyxl.load_workbook(file_path)
+    sheets = {sheet.title: (sheet.sheet_format.defaultColWidth,
+                            [(cell.fill.fgColor.rgb, cell.alignment.wrapText, cell.number_format)
+                             for row in sheet.iter_rows() for cell in row])
+              for sheet in workbook if sheet.title != 'Keuzelijsten'}
+    workbook.close()
+    return sheets
+
+
+def test_write_only_template_has_the_formats_of_the_regular_template(tmp_path):
+    generate_template(tmp_path / 'regular.xlsx', dummy_data_rows=2)
+    generate_template(tmp_path / 'write_only.xlsx', dummy_data_rows=2, write_only=True)
+
+    regular_formats = read_formats(tmp_path / 'regular.xlsx')
+    assert regular_formats['onderdeel#AllCasesTestClass'][0] == 25
+    assert read_formats(tmp_path / 'write_only.xlsx') == regular_formats
+
+
+def test_write_only_template_has_the_sheet_titles_of_the_regular_template(tmp_path):
+    for file_name, options in (('regular.xlsx', {}), ('write_only.xlsx', {'write_only': True})):
+        SubsetTemplateCreator.generate_template_from_subset(
+            subset_path=current_dir / 'voorbeeld-slagboom.db', template_file_path=tmp_path / file_name, **options)
+
+    workbook = openpyxl.load_workbook(tmp_path / 'regular.xlsx', read_only=True)
+    regular_titles = workbook.sheetnames
+    workbook.close()
+    # the title of this class is longer than 31 characters, it is only cut off when it is abbreviated
+    assert 'onderdeel#SlagboomarmVerlichting' in regular_titles
+    workbook = openpyxl.load_workbook(tmp_path / 'write_only.xlsx', read_only=True)
+    assert workbook.sheetnames == regular_titles
+    workbook.close()
@@ -0,0 +1,46 @@
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from otlmow_template.SubsetTemplateCreator import SubsetTemplateCreator
+
+HEARTBEAT_INTERVAL = 0.01
+
+
+async def heartbeat(lags: list[float], stop: asyncio.Event):
+    # measures how late the event loop wakes up this task: the lag that every other request would see
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        expected = loop.time() + HEARTBEAT_INTERVAL
+        await asyncio.sleep(HEARTBEAT_INTERVAL)
+        lags.append(max(0.0, loop.time() - expected))
+
+
+async def main(subset_path: Path, template_name: str, dummy_data_rows: int):
+    lags = []
+    stop = asyncio.Event()
+    heartbeat_task = asyncio.create_task(heartbeat(lags=lags, stop=stop))
+
+    start_time = time.perf_counter()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        await SubsetTemplateCreator.generate_template_from_subset_async(
+            subset_path=subset_path, template_file_path=Path(temp_dir) / template_name,
+            dummy_data_rows=dummy_data_rows, ignore_relations=False)
+    duration = time.perf_counter() - start_time
+
+    stop.set()
+    await heartbeat_task
+    lags.sort()
+    print(f'{template_name}: generated in {duration:.2f} seconds, {len(lags)} heartbeats')
+    print(f'event loop lag: median {lags[len(lags) // 2] * 1000:.1f} ms, '
+          f'p99 {lags[int(len(lags) * 0.99)] * 1000:.1f} ms, max {lags[-1] * 1000:.1f} ms')
+
+
+if __name__ == '__main__':
+    # usage: python benchmark_async.py [subset_path] [dummy_data_rows]
+    subset = Path(sys.argv[1]) if len(sys.argv) > 1 else Path('UnitTests/Subset/voorbeeld-slagboom.db')
+    rows = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    asyncio.run(main(subset_path=subset, template_name='benchmark.xlsx', dummy_data_rows=rows))
+    asyncio.run(main(subset_path=subset, template_name='benchmark.csv', dummy_data_rows=rows))
@@ -0,0 +1,118 @@
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from openpyxl import Workbook, load_workbook
+from openpyxl.formatting.rule import FormulaRule
+from openpyxl.utils import get_column_letter
+from openpyxl.worksheet.datavalidation import DataValidation
+
+from otlmow_template.SubsetTemplateCreator import SubsetTemplateCreator
+from otlmow_template.TemplateColumnFormatter import TemplateColumnFormatter, CHOICE_LIST_FILL, DEFAULT_MAX_ROW
+from otlmow_template.TemplatePlan import ClassPlan
+
+SUBSET_PATHS = [Path('UnitTests/Subset/voorbeeld-slagboom.db'), Path('UnitTests/Subset/camera_steun_2.14.db')]
+FIRST_DATA_ROW = 2
+
+
+def add_choice_list(workbook: Workbook, name: str, options: list[str], choice_list_dict: dict,
+                    define_range: bool) -> None:
+    # a column in the Keuzelijsten sheet with the name, '-' and the options of the choice list
+    column_letter = get_column_letter(len(choice_list_dict) + 1)
+    keuzelijsten_sheet = workbook['Keuzelijsten']
+    for row_nr, value in enumerate([name, '-', *options], start=1):
+        keuzelijsten_sheet[f'{column_letter}{row_nr}'] = value
+    choice_list_dict[name] = column_letter
+    if define_range:
+        TemplateColumnFormatter.define_choice_list_range(workbook=workbook, choice_list_name=name,
+                                                         column_letter=column_letter, option_count=len(options))
+
+
+def add_validations_per_column(sheet, class_plan: ClassPlan, choice_list_dict: dict) -> None:
+    # the validations before they were merged: one per column, the choice lists refer to their cells directly
+    boolean_validation = DataValidation(type='list', formula1='"TRUE,FALSE,-"', allow_blank=True)
+    data_validations = [boolean_validation]
+    choice_list_ranges = []
+    for column_nr, column in enumerate(class_plan.columns, start=1):
+        column_letter = get_column_letter(column_nr)
+        cell_range = f'{column_letter}{FIRST_DATA_ROW}:{column_letter}{DEFAULT_MAX_ROW}'
+        if column.validation in ('boolean', 'choice_list'):
+            choice_list_ranges.append(cell_range)
+        if column.validation == 'type_uri':
+            data_validation = DataValidation(type='list', formula1=f'"{class_plan.type_uri}"', allow_blank=True)
+        elif column.validation == 'boolean':
+            boolean_validation.add(cell_range)
+            continue
+        elif column.validation == 'choice_list':
+            choice_list_letter = choice_list_dict[column.choice_list_name]
+            data_validation = DataValidation(
+                type='list', allow_blank=True,
+                formula1=f'Keuzelijsten!${choice_list_letter}$2:'
+                         f'${choice_list_letter}${len(column.choice_list_options) + 2}')
+        else:
+            continue
+        data_validation.add(cell_range)
+        data_validations.append(data_validation)
+
+    for data_validation in data_validations:
+        if data_validation.sqref:
+            sheet.data_validations.append(data_validation)
+    if choice_list_ranges:
+        sheet.conditional_formatting.add(' '.join(choice_list_ranges),
+                                         FormulaRule(formula=['TRUE'], fill=CHOICE_LIST_FILL))
+
+
+def build_workbook(class_plans: list[ClassPlan], sheet_count: int, merge_validations: bool) -> Workbook:
+    workbook = Workbook()
+    workbook.active.title = 'Keuzelijsten'
+    choice_list_dict = {}
+    for sheet_nr in range(sheet_count):
+        class_plan = class_plans[sheet_nr % len(class_plans)]
+        for column in class_plan.columns:
+            if column.validation == 'choice_list' and column.choice_list_name not in choice_list_dict:
+                add_choice_list(workbook=workbook, name=column.choice_list_name, options=column.choice_list_options,
+                                choice_list_dict=choice_list_dict, define_range=merge_validations)
+        # the classes are repeated, so the sheets are numbered to keep their titles unique
+        sheet = workbook.create_sheet(f'{sheet_nr}_{class_plan.type_uri.split("#")[-1]}'[:31])
+        sheet.append(class_plan.headers)
+        if merge_validations:
+            TemplateColumnFormatter.add_column_ranges(sheet=sheet, type_uri=class_plan.type_uri,
+                                                      columns=class_plan.columns, generate_choice_list=True,
+                                                      first_data_row=FIRST_DATA_ROW)
+        else:
+            add_validations_per_column(sheet=sheet, class_plan=class_plan, choice_list_dict=choice_list_dict)
+    return workbook
+
+
+def main(sheet_count: int, merge_validations: bool):
+    class_plans = []
+    for subset_path in SUBSET_PATHS:
+        class_plans.extend(SubsetTemplateCreator.compile_template_plan(subset_path=subset_path).classes.values())
+    workbook = build_workbook(class_plans=class_plans, sheet_count=sheet_count, merge_validations=merge_validations)
+    validation_count = sum(len(sheet.data_validations.dataValidation) for sheet in workbook.worksheets)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file_path = Path(temp_dir) / 'benchmark.xlsx'
+        start_time = time.perf_counter()
+        workbook.save(file_path)
+        save_duration = time.perf_counter() - start_time
+        file_size = os.path.getsize(file_path)
+
+        start_time = time.perf_counter()
+        load_workbook(file_path).close()
+        load_duration = time.perf_counter() - start_time
+
+    label = 'merged, named ranges' if merge_validations else 'per column, cell ranges'
+    print(f'{label}: {sheet_count} sheets, {validation_count} validations, {file_size / 1024:.0f} KiB, '
+          f'saved in {save_duration:.2f} seconds, loaded in {load_duration:.2f} seconds')
+
+
+if __name__ == '__main__':
+    # usage: python benchmark_validations.py [sheet_count]
+    # compares the validations before (per column, referring to the cells of the choice lists) and after merging
+    # them (per sheet, referring to the named ranges of the choice lists)
+    sheets = int(sys.argv[1]) if len(sys.argv) > 1 else 240
+    main(sheet_count=sheets, merge_validations=False)
+    main(sheet_count=sheets, merge_validations=True)
@@ -0,0 +1,46 @@
+import string
+import threading
+
+from otlmow_model.OtlmowModel.BaseClasses.OTLObject import OTLObject
+
+from otlmow_template.TemplatePlan import AGENT_URI
+
+
+class AssetIdAllocator:
+    """
+    Thread-safe allocator of identificators that are unique within a run, like 'dummy_aaab' for the second one.
+    """
+
+    def __init__(self, prefix: str = 'dummy_', min_length: int = 4, start: int = 0):
+        self.prefix = prefix
+        self.min_length = min_length
+        self._counter = start
+        self._lock = threading.Lock()
+
+    @property
+    def next_number(self) -> int:
+        """The number of the next identificator. Pass it as start to continue where this allocator stopped."""
+        with self._lock:
+            return self._counter
+
+    def allocate(self) -> str:
+        with self._lock:
+            number = self._counter
+            self._counter += 1
+
+        letters = string.ascii_letters
+        encoded = ''
+        while True:
+            number, remainder = divmod(number, len(letters))
+            encoded = letters[remainder] + encoded
+            if number == 0:
+                break
+        # padding with the 'zero' letter keeps the identificators unique
+        return self.prefix + encoded.rjust(self.min_length, letters[0])
+
+    def assign(self, otl_object: OTLObject) -> None:
+        """Sets a newly allocated identificator as assetId.identificator (agentId.identificator for an Agent)."""
+        if otl_object.typeURI == AGENT_URI:
+            otl_object.agentId.identificator = self.allocate()
+        else:
+            otl_object.assetId.identificator = self.allocate()
@@ -0,0 +1,130 @@
+import dataclasses
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Optional
+
+from otlmow_modelbuilder.OSLOCollector import OSLOCollector
+from otlmow_modelbuilder.SQLDataClasses.GeneralInfoRecord import GeneralInfoRecord
+from otlmow_modelbuilder.SQLDataClasses.Inheritance import Inheritance
+from otlmow_modelbuilder.SQLDataClasses.OSLOAttribuut import OSLOAttribuut
+from otlmow_modelbuilder.SQLDataClasses.OSLOClass import OSLOClass
+from otlmow_modelbuilder.SQLDataClasses.OSLODatatypeComplex import OSLODatatypeComplex
+from otlmow_modelbuilder.SQLDataClasses.OSLODatatypeComplexAttribuut import OSLODatatypeComplexAttribuut
+from otlmow_modelbuilder.SQLDataClasses.OSLODatatypePrimitive import OSLODatatypePrimitive
+from otlmow_modelbuilder.SQLDataClasses.OSLODatatypePrimitiveAttribuut import OSLODatatypePrimitiveAttribuut
+from otlmow_modelbuilder.SQLDataClasses.OSLODatatypeUnion import OSLODatatypeUnion
+from otlmow_modelbuilder.SQLDataClasses.OSLODatatypeUnionAttribuut import OSLODatatypeUnionAttribuut
+from otlmow_modelbuilder.SQLDataClasses.OSLOEnumeration import OSLOEnumeration
+from otlmow_modelbuilder.SQLDataClasses.OSLORelatie import OSLORelatie
+from otlmow_modelbuilder.SQLDataClasses.OSLOTypeLink import OSLOTypeLink
+
+from otlmow_template.HelperFunctions import hash_file, get_package_version
+
+# the lists filled by OSLOCollector.collect_all() and the dataclass of their records
+COLLECTOR_FIELDS = {
+    'classes': OSLOClass,
+    'attributes': OSLOAttribuut,
+    'inheritances': Inheritance,
+    'primitive_datatypes': OSLODatatypePrimitive,
+    'primitive_datatype_attributen': OSLODatatypePrimitiveAttribuut,
+    'complex_datatypes': OSLODatatypeComplex,
+    'complex_datatype_attributen': OSLODatatypeComplexAttribuut,
+    'union_datatypes': OSLODatatypeUnion,
+    'union_datatype_attributen': OSLODatatypeUnionAttribuut,
+    'enumerations': OSLOEnumeration,
+    'typeLinks': OSLOTypeLink,
+    'relations': OSLORelatie,
+    'general_info': GeneralInfoRecord,
+}
+
+CACHE_FILE_SUFFIX = '.collector.json'
+
+
+class CollectorDiskCache:
+    """
+    On-disk LRU cache of the records of collected subsets, keyed by the content hash of the subset file and the
+    version of otlmow-modelbuilder.
+    """
+
+    def __init__(self, cache_directory: Path, max_size_bytes: int = 512 * 1024 * 1024):
+        self.cache_directory = Path(cache_directory)
+        self.max_size_bytes = max_size_bytes
+        self.cache_directory.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def get_cache_key(self, subset_path: Path, include_abstract: bool = True) -> str:
+        modelbuilder_version = get_package_version('otlmow_modelbuilder')
+        return f'{hash_file(subset_path)}_{modelbuilder_version}_{int(include_abstract)}'
+
+    def _get_entry_path(self, cache_key: str) -> Path:
+        return self.cache_directory / f'{cache_key}{CACHE_FILE_SUFFIX}'
+
+    def load(self, subset_path: Path, include_abstract: bool = True, cache_key: str = None
+             ) -> Optional[OSLOCollector]:
+        """Returns the collector stored for this subset file or None when there is no (valid) entry."""
+        if cache_key is None:
+            cache_key = self.get_cache_key(subset_path=subset_path, include_abstract=include_abstract)
+        entry_path = self._get_entry_path(cache_key)
+        try:
+            with open(entry_path, encoding='utf-8') as file:
+                collector = self.deserialize_collector(records=json.load(file), subset_path=subset_path)
+        except FileNotFoundError:
+            return None
+        except (TypeError, ValueError, KeyError, AttributeError) as ex:
+            # also an entry of records with other fields than the current dataclasses
+            logging.warning(f'Removing corrupt collector cache entry {entry_path}: {ex}')
+            entry_path.unlink(missing_ok=True)
+            return None
+
+        # touching the entry marks it as recently used for the eviction
+        os.utime(entry_path)
+        return collector
+
+    def store(self, subset_path: Path, collector: OSLOCollector, include_abstract: bool = True,
+              cache_key: str = None) -> None:
+        if cache_key is None:
+            cache_key = self.get_cache_key(subset_path=subset_path, include_abstract=include_abstract)
+        entry_path = self._get_entry_path(cache_key)
+        temp_path = entry_path.with_name(f'{entry_path.name}.{os.getpid()}.{threading.get_ident()}.tmp')
+        with open(temp_path, 'w', encoding='utf-8') as file:
+            json.dump(self.serialize_collector(collector), file)
+        os.replace(temp_path, entry_path)
+        self.evict()
+
+    def evict(self) -> None:
+        """Removes the least recently used entries until the cache fits within max_size_bytes."""
+        with self._lock:
+            entries = []
+            for entry_path in self.cache_directory.glob(f'*{CACHE_FILE_SUFFIX}'):
+                try:
+                    stat = entry_path.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry_path))
+            total_size = sum(size for _, size, _ in entries)
+            for _, size, entry_path in sorted(entries, key=lambda e: e[0]):
+                if total_size <= self.max_size_bytes:
+                    break
+                entry_path.unlink(missing_ok=True)
+                total_size -= size
+
+    def clear(self) -> None:
+        with self._lock:
+            for entry_path in self.cache_directory.glob(f'*{CACHE_FILE_SUFFIX}'):
+                entry_path.unlink(missing_ok=True)
+
+    @classmethod
+    def serialize_collector(cls, collector: OSLOCollector) -> dict[str, list[dict]]:
+        return {field_name: [dataclasses.asdict(record) for record in getattr(collector, field_name) or []]
+                for field_name in COLLECTOR_FIELDS}
+
+    @classmethod
+    def deserialize_collector(cls, records: dict[str, list[dict]], subset_path: Path) -> OSLOCollector:
+        collector = OSLOCollector(subset_path)
+        for field_name, data_class in COLLECTOR_FIELDS.items():
+            setattr(collector, field_name, [data_class(**record) for record in records[field_name]])
+        collector.class_dict = {c.objectUri: c for c in collector.classes}
+        return collector
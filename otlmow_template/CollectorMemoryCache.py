@@ -0,0 +1,89 @@
+import dataclasses
+import os
+import sys
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+from otlmow_modelbuilder.OSLOCollector import OSLOCollector
+
+from otlmow_template.CollectorDiskCache import COLLECTOR_FIELDS
+
+
+def estimate_collector_size(collector: OSLOCollector) -> int:
+    """Returns an estimate of the memory used by the records of a collector, in bytes."""
+    size = 0
+    for field_name in COLLECTOR_FIELDS:
+        records = getattr(collector, field_name) or []
+        size += sys.getsizeof(records)
+        for record in records:
+            size += sys.getsizeof(record)
+            size += sum(sys.getsizeof(getattr(record, f.name)) for f in dataclasses.fields(record))
+    return size
+
+
+class CollectorMemoryCache:
+    """
+    In-process LRU cache of OSLOCollector instances, keyed by the path, mtime and size of the subset file.
+    The cached collectors are shared, so treat them as read-only.
+    """
+
+    def __init__(self, max_entries: int = 32, max_size_bytes: int = 1024 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_size_bytes = max_size_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[tuple, tuple[OSLOCollector, int]] = OrderedDict()
+        self._size_bytes = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def get_cache_key(cls, subset_path: Path, include_abstract: bool = True) -> tuple:
+        resolved_path = Path(subset_path).resolve()
+        stat = os.stat(resolved_path)
+        return str(resolved_path), stat.st_mtime_ns, stat.st_size, include_abstract
+
+    def get(self, cache_key: tuple) -> Optional[OSLOCollector]:
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(cache_key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, cache_key: tuple, collector: OSLOCollector) -> None:
+        size = estimate_collector_size(collector)
+        with self._lock:
+            if cache_key in self._entries:
+                self._size_bytes -= self._entries.pop(cache_key)[1]
+            if size > self.max_size_bytes:
+                return
+            self._entries[cache_key] = (collector, size)
+            self._size_bytes += size
+            while len(self._entries) > self.max_entries or self._size_bytes > self.max_size_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._size_bytes -= evicted_size
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size_bytes = 0
+
+    def get_statistics(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_ratio': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'size_bytes': self._size_bytes,
+                'max_entries': self.max_entries,
+                'max_size_bytes': self.max_size_bytes
+            }
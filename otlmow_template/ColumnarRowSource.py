@@ -0,0 +1,169 @@
+from typing import Iterator, Optional
+
+from otlmow_converter.DotnotationDictConverter import DotnotationDictConverter
+from otlmow_converter.DotnotationHelper import DotnotationHelper
+from otlmow_model.OtlmowModel.BaseClasses.OTLObject import OTLObject, get_attribute_by_name
+
+from otlmow_template.AssetIdAllocator import AssetIdAllocator
+from otlmow_template.DummyDataGenerator import DummyDataGenerator
+from otlmow_template.PrototypeCloner import PrototypeCloner
+from otlmow_template.TemplatePlan import ClassPlan, TemplatePlan
+
+CARDINALITY_INDICATOR = '[]'
+SEPARATOR = '.'
+CONSTANT_ATTRIBUTES = {'geometry', 'isActief'}
+
+
+class ColumnarRowSource:
+    """
+    Generates the dummy rows of a class as columns of values, based on a single prototype of the class, without
+    creating an OTLObject per row.
+    """
+
+    def __init__(self, class_plan: ClassPlan, constant_values: dict, fields: dict, id_header: str,
+                 union_branches: list[list[list[str]]] = None):
+        self.class_plan = class_plan
+        self.constant_values = constant_values
+        self.fields = fields
+        self.id_header = id_header
+        self.union_branches = [] if union_branches is None else union_branches
+
+    @property
+    def type_uri(self) -> str:
+        return self.class_plan.type_uri
+
+    @property
+    def headers(self) -> list[str]:
+        return self.class_plan.headers
+
+    @classmethod
+    def from_prototype(cls, prototype: OTLObject) -> 'ColumnarRowSource':
+        prototype_values = DotnotationDictConverter.to_dict(prototype, cast_list=True)
+        # the headers of every branch of the unions are taken from a clone of the prototype per branch
+        variants = cls._create_union_variants(prototype=prototype, headers=list(prototype_values))
+        class_plan = TemplatePlan.compile([prototype, *variants]).classes[prototype.typeURI]
+        id_header = class_plan.headers[1]
+
+        # the headers are resolved on a new instance, as resolving them fills the attributes along the way
+        instance = type(prototype)()
+        constant_values = {}
+        fields = {}
+        for header in class_plan.headers:
+            if header == id_header:
+                continue
+            attribute = None
+            if header != 'typeURI':
+                try:
+                    attribute = DotnotationHelper.get_attribute_by_dotnotation(instance, header)
+                except AttributeError:
+                    attribute = None
+            if attribute is None or attribute.naam in CONSTANT_ATTRIBUTES or attribute.naam == 'naampad':
+                constant_values[header] = prototype_values.get(header)
+            else:
+                fields[header] = attribute
+        return cls(class_plan=class_plan, constant_values=constant_values, fields=fields, id_header=id_header,
+                   union_branches=cls._get_union_branches(instance=instance, headers=class_plan.headers))
+
+    def generate_columns(self, count: int, dummy_data_generator: DummyDataGenerator,
+                         asset_id_allocator: AssetIdAllocator, as_text: bool = False) -> dict[str, list]:
+        """
+        Returns a column of count values per header. The values keep their type (e.g. for XLSX), unless as_text:
+        then they are the strings that the converter would write for the same values (e.g. for CSV).
+        """
+        columns = {self.id_header: [asset_id_allocator.allocate() for _ in range(count)]}
+        for header, attribute in self.fields.items():
+            values = dummy_data_generator.generate_column(attribute.field, count)
+            if as_text:
+                values = [self._to_text(value, attribute.field) for value in values]
+            columns[header] = values
+        for header, value in self.constant_values.items():
+            columns[header] = [self._to_text(value) if as_text else value] * count
+
+        # naampad is derived from naam, like OTLAttribuut.fill_with_dummy_data()
+        if 'naampad' in columns and 'naam' in columns:
+            columns['naampad'] = [None if naam is None else f'dummy/{naam}' for naam in columns['naam']]
+
+        for branches in self.union_branches:
+            branch_per_row = dummy_data_generator.random.choices(range(len(branches)), k=count)
+            for branch_nr, branch_headers in enumerate(branches):
+                for header in branch_headers:
+                    columns[header] = [value if row_branch_nr == branch_nr else None
+                                       for value, row_branch_nr in zip(columns[header], branch_per_row)]
+        return columns
+
+    def iter_row_chunks(self, row_count: int, chunk_size: int, asset_id_allocator: AssetIdAllocator,
+                        seed: Optional[int] = None, headers: list[str] = None, as_text: bool = False
+                        ) -> Iterator[list[list]]:
+        """
+        Yields the rows in chunks of at most chunk_size rows, as lists of values in the order of headers (defaults
+        to the headers of the class), see generate_columns(). Only one chunk of values is kept in memory.
+        """
+        if headers is None:
+            headers = self.headers
+        for chunk, chunk_start in enumerate(range(0, row_count, chunk_size)):
+            count = min(chunk_size, row_count - chunk_start)
+            dummy_data_generator = DummyDataGenerator.for_class(seed=seed, class_uri=self.type_uri,
+                                                                batch_size=count, chunk=chunk)
+            columns = self.generate_columns(count=count, dummy_data_generator=dummy_data_generator,
+                                            asset_id_allocator=asset_id_allocator, as_text=as_text)
+            empty_column = [None] * count
+            yield [list(row) for row in zip(*(columns.get(header, empty_column) for header in headers))]
+
+    @classmethod
+    def _create_union_variants(cls, prototype: OTLObject, headers: list[str]) -> list[OTLObject]:
+        """Returns a clone of the prototype for every branch of every union in the headers of the prototype."""
+        union_headers = set()
+        for header in headers:
+            parts = header.split(SEPARATOR)
+            union_headers.update(SEPARATOR.join(parts[:part_nr]) for part_nr in range(1, len(parts)))
+        variants = []
+        for union_header in sorted(union_headers):
+            union_attribute = cls._get_union_attribute(instance=prototype, header=union_header)
+            if union_attribute is None:
+                continue
+            for branch in union_attribute.field.waardeObject():
+                variant = PrototypeCloner.clone(prototype)
+                variant_attribute = DotnotationHelper.get_attribute_by_dotnotation(variant, union_header)
+                waarden_object = variant_attribute.field.waardeObject()
+                waarden_object._parent = variant_attribute
+                DummyDataGenerator().fill_attribute(get_attribute_by_name(waarden_object, branch.naam))
+                variant_attribute.set_waarde(
+                    waarden_object if variant_attribute.kardinaliteit_max == '1' else [waarden_object])
+                variants.append(variant)
+        return variants
+
+    @classmethod
+    def _get_union_branches(cls, instance: OTLObject, headers: list[str]) -> list[list[list[str]]]:
+        """Returns the headers of every branch of every union in the headers."""
+        unions = {}
+        for header in headers:
+            parts = header.split(SEPARATOR)
+            for part_nr in range(1, len(parts)):
+                union_header = SEPARATOR.join(parts[:part_nr])
+                if union_header not in unions:
+                    unions[union_header] = None
+                    if cls._get_union_attribute(instance=instance, header=union_header) is not None:
+                        unions[union_header] = {}
+                if unions[union_header] is not None:
+                    branch = parts[part_nr].replace(CARDINALITY_INDICATOR, '')
+                    unions[union_header].setdefault(branch, []).append(header)
+        return [list(branches.values()) for branches in unions.values() if branches is not None and len(branches) > 1]
+
+    @classmethod
+    def _get_union_attribute(cls, instance: OTLObject, header: str):
+        try:
+            attribute = DotnotationHelper.get_attribute_by_dotnotation(instance, header)
+        except AttributeError:
+            return None
+        if attribute.field.waardeObject is None or \
+                not getattr(attribute.field.waardeObject(), '_is_union_waarden_object', False):
+            return None
+        return attribute
+
+    @classmethod
+    def _to_text(cls, value, field=None) -> Optional[str]:
+        if value is None or isinstance(value, str):
+            return value
+        if field is not None:
+            value = field.value_default(value)
+        return value if isinstance(value, str) else str(value)
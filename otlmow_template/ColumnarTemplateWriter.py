@@ -0,0 +1,90 @@
+import csv
+from pathlib import Path
+from typing import Optional
+
+from openpyxl.workbook import Workbook
+
+from otlmow_template.AssetIdAllocator import AssetIdAllocator
+from otlmow_template.ColumnarRowSource import ColumnarRowSource
+from otlmow_template.TemplateColumnFormatter import TemplateColumnFormatter
+from otlmow_template.TemplatePlan import TYPE_URI_DEFINITION, ClassPlan
+
+DEFAULT_CHUNK_SIZE = 5000
+
+
+class ColumnarTemplateWriter:
+    """
+    Writes the rows of ColumnarRowSources to CSV or XLSX files, one chunk at a time, without styling or validations.
+    """
+
+    @classmethod
+    def write_csv(cls, row_sources: list[ColumnarRowSource], file_path: Path, row_count: int,
+                  chunk_size: int = DEFAULT_CHUNK_SIZE, seed: Optional[int] = None, add_attribute_info: bool = False,
+                  add_deprecated: bool = False, asset_id_allocator: AssetIdAllocator = None, delimiter: str = ';'
+                  ) -> Path:
+        """Writes the rows of the row sources to a single CSV file, with the combined headers of all classes."""
+        if asset_id_allocator is None:
+            asset_id_allocator = AssetIdAllocator()
+        if len(row_sources) == 1:
+            headers = row_sources[0].headers
+        else:
+            headers = cls._get_combined_headers(row_sources)
+
+        with open(file_path, 'w', newline='', encoding='utf-8') as file:
+            csv_writer = csv.writer(file, delimiter=delimiter, quotechar='"', quoting=csv.QUOTE_MINIMAL)
+            csv_writer.writerows(cls._get_header_rows(
+                class_plans=[row_source.class_plan for row_source in row_sources], headers=headers,
+                add_attribute_info=add_attribute_info, add_deprecated=add_deprecated))
+            for row_source in row_sources:
+                for rows in row_source.iter_row_chunks(row_count=row_count, chunk_size=chunk_size, seed=seed,
+                                                       asset_id_allocator=asset_id_allocator, headers=headers,
+                                                       as_text=True):
+                    csv_writer.writerows(rows)
+        return file_path
+
+    @classmethod
+    def write_xlsx(cls, row_sources: list[ColumnarRowSource], file_path: Path, row_count: int,
+                   chunk_size: int = DEFAULT_CHUNK_SIZE, seed: Optional[int] = None, add_attribute_info: bool = False,
+                   add_deprecated: bool = False, abbreviate_excel_sheettitles: bool = False) -> Path:
+        """Writes the rows of every row source to its own sheet of a single XLSX file."""
+        asset_id_allocator = AssetIdAllocator()
+        workbook = Workbook(write_only=True)
+        for row_source in row_sources:
+            sheet = workbook.create_sheet(TemplateColumnFormatter.get_sheet_title(
+                type_uri=row_source.type_uri, abbreviate_excel_sheettitles=abbreviate_excel_sheettitles))
+            for row in cls._get_header_rows(class_plans=[row_source.class_plan], headers=row_source.headers,
+                                            add_attribute_info=add_attribute_info, add_deprecated=add_deprecated):
+                sheet.append(row)
+            for rows in row_source.iter_row_chunks(row_count=row_count, chunk_size=chunk_size, seed=seed,
+                                                   asset_id_allocator=asset_id_allocator):
+                for row in rows:
+                    sheet.append(row)
+        workbook.save(file_path)
+        workbook.close()
+        return file_path
+
+    @classmethod
+    def _get_combined_headers(cls, row_sources: list[ColumnarRowSource]) -> list[str]:
+        first_headers = ['typeURI', 'assetId.identificator', 'assetId.toegekendDoor']
+        other_headers = {header for row_source in row_sources for header in row_source.headers}
+        return first_headers + sorted(other_headers - set(first_headers))
+
+    @classmethod
+    def _get_header_rows(cls, class_plans: list[ClassPlan], headers: list[str], add_attribute_info: bool,
+                         add_deprecated: bool) -> list[list[str]]:
+        columns = {}
+        for class_plan in class_plans:
+            for column in class_plan.columns:
+                columns.setdefault(column.header, column)
+
+        rows = []
+        if add_attribute_info:
+            rows.append([TYPE_URI_DEFINITION if header == 'typeURI' else
+                         getattr(columns.get(header), 'definition', '') for header in headers])
+        if add_deprecated:
+            deprecated_row = ['DEPRECATED' if getattr(columns.get(header), 'deprecated', False) else ''
+                              for header in headers]
+            if any(deprecated_row):
+                rows.append(deprecated_row)
+        rows.append(list(headers))
+        return rows
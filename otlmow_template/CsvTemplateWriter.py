@@ -0,0 +1,139 @@
+import csv
+from pathlib import Path
+from typing import Iterable, Optional
+
+import pyarrow as pa
+import pyarrow.compute as pc
+from otlmow_converter.FileFormats.CsvExporter import csv_settings
+from otlmow_converter.FileFormats.PyArrowConverter import PyArrowConverter
+from otlmow_model.OtlmowModel.BaseClasses.OTLObject import OTLObject
+
+from otlmow_template.TemplatePlan import TYPE_URI_DEFINITION, ClassPlan, TemplatePlan
+
+
+class CsvTemplateWriter:
+    """
+    Writes CSV templates in a single pass, with the same result as exporting the objects with OtlmowConverter
+    and altering the files with SubsetTemplateCreator.alter_csv_file().
+    """
+
+    @classmethod
+    def get_tables(cls, sequence_of_objects: Iterable[OTLObject], split_per_type: bool, **kwargs
+                   ) -> dict[Optional[str], pa.Table]:
+        """
+        Returns a table per shortened type URI (or a single table with key None if not split_per_type), with the
+        settings and keyword arguments of the CSV exporter.
+        """
+        dotnotation_settings = csv_settings['dotnotation']
+        options = dict(
+            separator=kwargs.get('separator', dotnotation_settings['separator']),
+            cardinality_separator=kwargs.get('cardinality_separator', dotnotation_settings['cardinality_separator']),
+            cardinality_indicator=kwargs.get('cardinality_indicator', dotnotation_settings['cardinality_indicator']),
+            waarde_shortcut=kwargs.get('waarde_shortcut', dotnotation_settings['waarde_shortcut']),
+            cast_list=kwargs.get('cast_list', csv_settings['cast_list']),
+            cast_datetime=kwargs.get('cast_datetime', csv_settings['cast_datetime']),
+            allow_non_otl_conform_attributes=kwargs.get('allow_non_otl_conform_attributes',
+                                                        csv_settings['allow_non_otl_conform_attributes']),
+            warn_for_non_otl_conform_attributes=kwargs.get('warn_for_non_otl_conform_attributes',
+                                                           csv_settings['warn_for_non_otl_conform_attributes']))
+        if not split_per_type:
+            return {None: PyArrowConverter.convert_objects_to_single_table(
+                list_of_objects=sequence_of_objects, avoid_multiple_types_in_single_column=True, **options)}
+        return PyArrowConverter.convert_objects_to_multiple_tables(list_of_objects=sequence_of_objects, **options)
+
+    @classmethod
+    def compile_template_plan(cls, tables: dict[Optional[str], pa.Table], prototypes: dict[str, OTLObject]
+                              ) -> TemplatePlan:
+        """Compiles the plan of the tables (see get_tables), see TemplatePlan.compile_from_headers()."""
+        headers_per_type = {}
+        row_counts = {}
+        for table in tables.values():
+            type_uris = table.column('typeURI')
+            for type_uri in pc.unique(type_uris).to_pylist():
+                typed_table = table.filter(pc.equal(type_uris, type_uri))
+                headers_per_type[type_uri] = [
+                    name for name, column in zip(typed_table.schema.names, typed_table.columns)
+                    if column.null_count < typed_table.num_rows]
+                row_counts[type_uri] = typed_table.num_rows
+        return TemplatePlan.compile_from_headers(headers_per_type=headers_per_type, row_counts=row_counts,
+                                                 prototypes=prototypes)
+
+    @classmethod
+    def write_files(cls, tables: dict[Optional[str], pa.Table], file_path: Path, template_plan: TemplatePlan,
+                    add_attribute_info: bool, add_deprecated: bool, dummy_data_rows: int, delimiter: str = None
+                    ) -> list[Path]:
+        """
+        Writes a file per table (see get_tables), with the plan of its type.
+
+        :return: the paths of the created files
+        """
+        created_file_paths = []
+        for short_uri, table in tables.items():
+            if short_uri is None:
+                class_plan = next(iter(template_plan.classes.values()))
+            else:
+                class_plan = template_plan.get_class_plan(table.column('typeURI')[0].as_py())
+            created_file_paths.append(cls.write_file(
+                table=table, file_path=cls.get_file_path_for_table(file_path, short_uri), class_plan=class_plan,
+                add_attribute_info=add_attribute_info, add_deprecated=add_deprecated,
+                dummy_data_rows=dummy_data_rows, delimiter=delimiter))
+        return created_file_paths
+
+    @classmethod
+    def get_file_path_for_table(cls, file_path: Path, short_uri: Optional[str]) -> Path:
+        """Returns the path of the file of a table, named like the CSV exporter names the files per type."""
+        if short_uri is None:
+            return file_path
+        return file_path.parent / f'{file_path.stem}_{short_uri.replace("#", "_")}{file_path.suffix}'
+
+    @classmethod
+    def write_file(cls, table: pa.Table, file_path: Path, class_plan: ClassPlan, add_attribute_info: bool,
+                   add_deprecated: bool, dummy_data_rows: int, delimiter: str = None) -> Path:
+        """Writes the table to a CSV template: the attribute-info and deprecated rows, the header and the dummy rows."""
+        if not delimiter:
+            delimiter = csv_settings['delimiter'] or ';'
+        headers = cls.get_headers(table)
+        with open(file_path, 'w', newline='', encoding='utf-8') as file:
+            csv_writer = csv.writer(file, delimiter=delimiter, quotechar='"', quoting=csv.QUOTE_MINIMAL)
+            csv_writer.writerows(cls.get_header_rows(headers=headers, class_plan=class_plan,
+                                                     add_attribute_info=add_attribute_info,
+                                                     add_deprecated=add_deprecated))
+            if dummy_data_rows != 0:
+                empty_column = [None] * table.num_rows
+                csv_writer.writerows(zip(*(
+                    pc.cast(table.column(header), pa.string()).to_pylist() if header in table.schema.names
+                    else empty_column for header in headers)))
+        return file_path
+
+    @classmethod
+    def get_headers(cls, table: pa.Table) -> list[str]:
+        """Returns the headers of the table in the order of the CSV exporter, including missing identificators."""
+        names = table.schema.names
+        id_name = 'agentId' if 'agentId.identificator' in names else 'assetId'
+        first_headers = ['typeURI', f'{id_name}.identificator', f'{id_name}.toegekendDoor']
+        return first_headers + sorted(name for name in names if name not in first_headers)
+
+    @classmethod
+    def get_header_rows(cls, headers: list[str], class_plan: ClassPlan, add_attribute_info: bool,
+                        add_deprecated: bool) -> list[list[str]]:
+        """Returns the attribute-info row, the deprecated row (if any column is deprecated) and the header row."""
+        attribute_info_row = []
+        deprecated_row = []
+        for header in headers:
+            column = None if header == 'typeURI' else class_plan.get_column(header)
+            if header == 'typeURI':
+                attribute_info_row.append(TYPE_URI_DEFINITION)
+            elif column is None or not column.resolved:
+                attribute_info_row.append('')
+            else:
+                attribute_info_row.append(column.definition)
+            deprecated_row.append('DEPRECATED' if column is not None and column.resolved and column.deprecated
+                                  else '')
+
+        rows = []
+        if add_attribute_info:
+            rows.append(attribute_info_row)
+        if add_deprecated and any(deprecated_row):
+            rows.append(deprecated_row)
+        rows.append(headers)
+        return rows
@@ -0,0 +1,155 @@
+import datetime
+import random
+import string
+from typing import Optional
+
+from otlmow_model.OtlmowModel.BaseClasses.OTLObject import get_attribute_by_name
+
+NAAMPAD_URI = 'https://wegenenverkeer.data.vlaanderen.be/ns/implementatieelement#NaampadObject.naampad'
+GEOMETRY_VALUES = {
+    'POINT Z': 'POINT Z (200000 200000 0)',
+    'LINESTRING Z': 'LINESTRING Z (200000 200000 0, 200001 200001 1)',
+    'POLYGON Z': 'POLYGON Z ((200000 200000 0, 200001 200001 1, 200002 200002 2, 200000 200000 0))'
+}
+FIELD_KINDS = {'KeuzelijstField', 'NaamField', 'NaampadField', 'StringField', 'URIField', 'IntegerField',
+               'NonNegIntegerField', 'FloatOrDecimalField', 'BooleanField', 'DateField', 'DateTimeField', 'TimeField',
+               'WKTField'}
+DEFAULT_BATCH_SIZE = 100
+MAX_BATCH_SIZE = 10000
+
+
+class DummyDataGenerator:
+    """
+    Seeded generator of dummy data, like OTLAttribuut.fill_with_dummy_data(), that draws the values of a whole
+    column at once. Use for_class() to get a generator per class.
+    """
+
+    def __init__(self, seed=None, batch_size: int = DEFAULT_BATCH_SIZE):
+        self.random = random.Random(seed)
+        self.batch_size = max(1, min(batch_size, MAX_BATCH_SIZE))
+        self._columns = {}
+        self._generators = {
+            'StringField': self._generate_strings,
+            'URIField': self._generate_uris,
+            'IntegerField': lambda count: self.random.choices(range(-100, 101), k=count),
+            'NonNegIntegerField': lambda count: self.random.choices(range(0, 101), k=count),
+            'FloatOrDecimalField': lambda count: [round(self.random.random() * 100, 2) for _ in range(count)],
+            'BooleanField': lambda count: self.random.choices([True, False], k=count),
+            'DateField': self._generate_dates,
+            'DateTimeField': self._generate_datetimes,
+            'TimeField': self._generate_times,
+            'WKTField': lambda count: ['POINT Z (200000 200000 0)'] * count,
+            # the fields of the model that have their own rules in create_dummy_data()
+            'NaamField': lambda count: ['dummy'] * count,
+            'NaampadField': lambda count: ['dummy/dummy'] * count
+        }
+
+    @classmethod
+    def for_class(cls, seed, class_uri: str, batch_size: int = DEFAULT_BATCH_SIZE, chunk: int = 0
+                  ) -> 'DummyDataGenerator':
+        """Returns a generator for a class, seeded with a seed derived from seed, class_uri and chunk."""
+        derived_seed = None if seed is None else f'{seed}|{class_uri}|{chunk}'
+        return cls(seed=derived_seed, batch_size=batch_size)
+
+    def generate_column(self, field, count: int) -> list:
+        """Generates count dummy values for the given field (type)."""
+        field_kind = self._get_field_kind(field)
+        if field_kind == 'KeuzelijstField':
+            return self._generate_choice_list_values(field, count)
+        if field_kind is None:
+            # fields of another kind are left to their own rules
+            return [field.create_dummy_data() for _ in range(count)]
+        return self._generators[field_kind](count)
+
+    def next_value(self, attribute):
+        column = self._columns.get(attribute.objectUri)
+        if not column:
+            column = self.generate_column(attribute.field, self.batch_size)
+            # reversed, so the values are taken in order with pop()
+            column.reverse()
+            self._columns[attribute.objectUri] = column
+        return column.pop()
+
+    def fill_attribute(self, attribute) -> None:
+        """Fills the attribute with dummy data, like OTLAttribuut.fill_with_dummy_data()."""
+        if attribute.readonly:
+            return
+
+        if attribute.field.waardeObject is None:
+            if attribute.naam == 'geometry':
+                value = GEOMETRY_VALUES.get(attribute.owner._geometry_types[0])
+                if value is not None:
+                    attribute.set_waarde(value)
+                return
+            if attribute.objectUri == NAAMPAD_URI:
+                naam_attr = get_attribute_by_name(attribute.owner, 'naam')
+                if naam_attr is not None and naam_attr.waarde is not None:
+                    value = f'dummy/{naam_attr.waarde}'
+                else:
+                    value = 'dummy/dummy'
+            else:
+                value = self.next_value(attribute)
+            if value is None or attribute.kardinaliteit_max == '1':
+                attribute.set_waarde(value)
+            else:
+                attribute.set_waarde([value])
+            return
+
+        waarden_object = attribute.field.waardeObject()
+        waarden_object._parent = attribute
+        if getattr(waarden_object, '_is_union_waarden_object', False):
+            self.fill_attribute(self.random.choice(list(waarden_object)))
+        else:
+            for sub_attribute in waarden_object:
+                self.fill_attribute(sub_attribute)
+
+        if attribute.kardinaliteit_max != '1':
+            attribute.set_waarde([waarden_object])
+        else:
+            attribute.set_waarde(waarden_object)
+
+    @classmethod
+    def _get_field_kind(cls, field) -> Optional[str]:
+        # by class name, as a model loaded from a model directory has its own field classes, the closest known class
+        # decides, so other subclasses with their own create_dummy_data() follow the rules of their base class
+        for field_class in field.__mro__:
+            if field_class.__name__ in FIELD_KINDS:
+                return field_class.__name__
+        return None
+
+    def _generate_choice_list_values(self, field, count: int) -> list:
+        values = [option.invulwaarde for option in field.options.values() if option.status == 'ingebruik']
+        if not values:
+            return [None] * count
+        return self.random.choices(values, k=count)
+
+    def _generate_random_strings(self, min_length: int, max_length: int, count: int) -> list[str]:
+        lengths = self.random.choices(range(min_length, max_length + 1), k=count)
+        letters = self.random.choices(string.ascii_letters, k=sum(lengths))
+        strings = []
+        start = 0
+        for length in lengths:
+            strings.append(''.join(letters[start:start + length]))
+            start += length
+        return strings
+
+    def _generate_strings(self, count: int) -> list[str]:
+        return ['dummy_' + s for s in self._generate_random_strings(min_length=4, max_length=10, count=count)]
+
+    def _generate_uris(self, count: int) -> list[str]:
+        return [f'http://{s}.dummy' for s in self._generate_random_strings(min_length=5, max_length=15, count=count)]
+
+    def _generate_dates(self, count: int) -> list[datetime.date]:
+        start = datetime.date(2000, 1, 1)
+        days = (datetime.date(2020, 1, 1) - start).days
+        return [start + datetime.timedelta(days=d) for d in self.random.choices(range(days), k=count)]
+
+    def _generate_datetimes(self, count: int) -> list[datetime.datetime]:
+        start = datetime.datetime(2000, 1, 1)
+        delta = datetime.datetime(2020, 1, 1) - start
+        seconds = delta.days * 24 * 60 * 60 + delta.seconds
+        return [start + datetime.timedelta(seconds=s) for s in self.random.choices(range(seconds), k=count)]
+
+    def _generate_times(self, count: int) -> list[datetime.time]:
+        return [datetime.time(hour=s // 3600, minute=s // 60 % 60, second=s % 60)
+                for s in self.random.choices(range(24 * 60 * 60), k=count)]
@@ -0,0 +1,93 @@
+from typing import Iterable
+
+from openpyxl.workbook import Workbook
+from openpyxl.worksheet.worksheet import Worksheet
+from otlmow_converter.FileFormats.DotnotationTableConverter import DotnotationTableConverter
+from otlmow_converter.FileFormats.ExcelExporter import ExcelExporter, xlsx_settings
+from otlmow_model.OtlmowModel.BaseClasses.OTLObject import OTLObject
+
+from otlmow_template.TemplatePlan import TemplatePlan
+
+
+class ExcelTemplateWriter:
+    """
+    Builds the sheets of an Excel template in memory like the Excel exporter of otlmow_converter, without saving
+    the workbook, so the sheets can be altered before it is saved once.
+    """
+
+    @classmethod
+    def create_workbook(cls, sequence_of_objects: Iterable[OTLObject], **kwargs) -> Workbook:
+        """
+        Creates a workbook with a sheet per type, like OtlmowConverter.from_objects_to_file() for an .xlsx file.
+        The objects are iterated once, so they can be given by a generator.
+        """
+        table_dict = cls.get_tables_per_type(sequence_of_objects=sequence_of_objects, **kwargs)
+        # checked on the tables, as an iterator is not empty until it is consumed
+        if not table_dict:
+            raise ValueError('There are no asset data to export to Excel')
+        return cls.create_workbook_from_tables(table_dict=table_dict, **kwargs)
+
+    @classmethod
+    def create_workbook_from_tables(cls, table_dict: dict[str, list[dict]], **kwargs) -> Workbook:
+        """Creates a workbook with a sheet per table (see get_tables_per_type)."""
+        workbook = Workbook()
+        if cls.add_sheets_from_tables(workbook=workbook, table_dict=table_dict, **kwargs):
+            del workbook['Sheet']
+        return workbook
+
+    @classmethod
+    def add_sheets(cls, workbook: Workbook, sequence_of_objects: Iterable[OTLObject], **kwargs) -> list[Worksheet]:
+        """Adds a sheet per type of the objects to the workbook and returns the added sheets."""
+        return cls.add_sheets_from_tables(
+            workbook=workbook, table_dict=cls.get_tables_per_type(sequence_of_objects=sequence_of_objects, **kwargs),
+            **kwargs)
+
+    @classmethod
+    def add_sheets_from_tables(cls, workbook: Workbook, table_dict: dict[str, list[dict]], **kwargs
+                               ) -> list[Worksheet]:
+        """Adds a sheet per table (see get_tables_per_type) to the workbook and returns the added sheets."""
+        sheets = []
+        for class_name, table_data in table_dict.items():
+            if ExcelExporter.create_sheet_by_name(
+                    wb=workbook, class_name=class_name, table_data=table_data,
+                    abbreviate_excel_sheettitles=kwargs.get('abbreviate_excel_sheettitles', False)):
+                sheets.append(workbook.worksheets[-1])
+
+        # an empty string is loaded again as an empty inline string cell, which is only written when it is styled
+        for sheet in sheets:
+            for row in sheet.iter_rows():
+                for cell in row:
+                    if cell.value == '':
+                        cell.value = None
+                        cell.data_type = 'inlineStr'
+        return sheets
+
+    @classmethod
+    def get_tables_per_type(cls, sequence_of_objects: Iterable[OTLObject], **kwargs) -> dict[str, list[dict]]:
+        """
+        Returns the table of every type of the objects, with the settings and keyword arguments of the Excel
+        exporter (see DotnotationTableConverter.get_tables_per_type_from_data).
+        """
+        dotnotation_settings = xlsx_settings['dotnotation']
+        return DotnotationTableConverter.get_tables_per_type_from_data(
+            sequence_of_objects=sequence_of_objects, values_as_string=True,
+            cardinality_separator=kwargs.get('cardinality_separator', dotnotation_settings['cardinality_separator']),
+            cardinality_indicator=kwargs.get('cardinality_indicator', dotnotation_settings['cardinality_indicator']),
+            waarde_shortcut=kwargs.get('waarde_shortcut', dotnotation_settings['waarde_shortcut']),
+            cast_list=kwargs.get('cast_list', xlsx_settings['cast_list']),
+            cast_datetime=kwargs.get('cast_datetime', xlsx_settings['cast_datetime']),
+            allow_non_otl_conform_attributes=kwargs.get('allow_non_otl_conform_attributes',
+                                                        xlsx_settings['allow_non_otl_conform_attributes']),
+            warn_for_non_otl_conform_attributes=kwargs.get('warn_for_non_otl_conform_attributes',
+                                                           xlsx_settings['warn_for_non_otl_conform_attributes']))
+
+    @classmethod
+    def compile_template_plan(cls, table_dict: dict[str, list[dict]], prototypes: dict[str, OTLObject]
+                              ) -> TemplatePlan:
+        """Compiles the plan of the tables (see get_tables_per_type), before they are turned into rows."""
+        typed_tables = {table_data[1]['typeURI']: table_data for table_data in table_dict.values()
+                        if len(table_data) > 1}
+        return TemplatePlan.compile_from_headers(
+            headers_per_type={type_uri: list(table_data[0]) for type_uri, table_data in typed_tables.items()},
+            row_counts={type_uri: len(table_data) - 1 for type_uri, table_data in typed_tables.items()},
+            prototypes=prototypes)
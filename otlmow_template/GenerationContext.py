@@ -0,0 +1,31 @@
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+from otlmow_model.OtlmowModel.Helpers.generated_lists import get_hardcoded_relation_dict
+
+from otlmow_template.AssetIdAllocator import AssetIdAllocator
+
+
+@dataclass
+class GenerationContext:
+    """
+    The state of a single generation run: the model, its relation classes, the attributes per class of the subset
+    and the allocator of the identificators.
+    """
+    model_directory: Optional[Path] = None
+    relation_dict: dict = field(default_factory=dict)
+    attribute_index: Optional[dict] = None
+    asset_id_allocator: AssetIdAllocator = field(default_factory=AssetIdAllocator)
+    seed: Optional[int] = None
+
+    @classmethod
+    def create(cls, model_directory: Path = None, attribute_index: dict = None, seed: Optional[int] = None
+               ) -> 'GenerationContext':
+        """Creates the context of a run with the relation classes of the model in model_directory."""
+        return cls(model_directory=model_directory,
+                   relation_dict=get_hardcoded_relation_dict(model_directory=model_directory),
+                   attribute_index=attribute_index, seed=seed)
+
+    def is_relation(self, class_uri: str) -> bool:
+        return class_uri in self.relation_dict
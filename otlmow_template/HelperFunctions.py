@@ -0,0 +1,19 @@
+import hashlib
+from importlib.metadata import version, PackageNotFoundError
+from pathlib import Path
+
+
+def get_package_version(package_name: str) -> str:
+    try:
+        return version(package_name)
+    except PackageNotFoundError:
+        return 'unknown'
+
+
+def hash_file(file_path: Path, chunk_size: int = 1024 * 1024) -> str:
+    """Returns the sha256 hex digest of the content of a file."""
+    file_hash = hashlib.sha256()
+    with open(file_path, 'rb') as file:
+        while chunk := file.read(chunk_size):
+            file_hash.update(chunk)
+    return file_hash.hexdigest()
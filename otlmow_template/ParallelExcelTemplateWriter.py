@@ -0,0 +1,214 @@
+import posixpath
+import re
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from functools import partial
+from io import BytesIO
+from pathlib import Path
+from typing import Iterable, Optional
+from xml.etree import ElementTree
+from zipfile import ZipFile, ZIP_DEFLATED
+
+from openpyxl.workbook import Workbook
+from otlmow_converter.Exceptions.UnknownExcelError import UnknownExcelError
+from otlmow_model.OtlmowModel.BaseClasses.OTLObject import OTLObject
+
+from otlmow_template.ExcelTemplateWriter import ExcelTemplateWriter
+from otlmow_template.TemplateColumnFormatter import DEFAULT_MAX_ROW
+from otlmow_template.TemplatePlan import ClassPlan, TemplatePlan
+from otlmow_template.WriteOnlyExcelTemplateWriter import WriteOnlyExcelTemplateWriter
+
+SPREADSHEET_NAMESPACE = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+RELATIONSHIPS_NAMESPACE = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+PACKAGE_RELATIONSHIPS_NAMESPACE = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+STYLES_RELATIONSHIP_TYPE = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles'
+# the tags of the sheet XML that refer to a cell style or to a differential style, the text of the cells is escaped
+STYLED_TAG = re.compile(rb'<(?:c|row|col)\s[^>]*>')
+STYLE_ATTRIBUTE = re.compile(rb'(\s(?:s|style)=")(\d+)(")')
+DXF_TAG = re.compile(rb'<cfRule\s[^>]*>')
+DXF_ATTRIBUTE = re.compile(rb'(\sdxfId=")(\d+)(")')
+
+
+class ParallelExcelTemplateWriter:
+    """
+    Writes the same Excel template as WriteOnlyExcelTemplateWriter, but builds the XML of every class sheet in a
+    worker process and puts it in a skeleton of the workbook written by the calling process.
+    """
+
+    @classmethod
+    def write(cls, class_batches: Iterable[list[OTLObject]], file_path: Path, add_attribute_info: bool,
+              generate_choice_list: bool, dummy_data_rows: int, add_deprecated: bool,
+              abbreviate_excel_sheettitles: bool = False, template_plan: TemplatePlan = None,
+              max_row: int = DEFAULT_MAX_ROW, executor: Optional[Executor] = None, **kwargs) -> tuple[Path]:
+        """
+        Writes a sheet per type of the objects in the class batches and the Keuzelijsten sheet, see
+        WriteOnlyExcelTemplateWriter.write().
+
+        :param executor: Executor that builds the sheets, defaults to None (a process per core for this call)
+        :return: the path of the created file
+        """
+        process_pool = None
+        if executor is None:
+            process_pool = ProcessPoolExecutor()
+            executor = process_pool
+
+        workbook = Workbook(write_only=True)
+        choice_list_dict = {}
+        choice_list_options = {}
+        sheet_futures: dict[str, Future] = {}
+        try:
+            for class_batch in class_batches:
+                prototypes = {}
+                table_dict = ExcelTemplateWriter.get_tables_per_type(
+                    sequence_of_objects=TemplatePlan.iter_recording_prototypes(class_batch, prototypes), **kwargs)
+                del class_batch
+                batch_plan = ExcelTemplateWriter.compile_template_plan(table_dict=table_dict, prototypes=prototypes)
+                if template_plan is not None:
+                    template_plan.classes.update(batch_plan.classes)
+                for table_data in table_dict.values():
+                    if len(table_data) < 2:
+                        continue
+                    type_uri = table_data[1]['typeURI']
+                    class_plan = batch_plan.get_class_plan(type_uri)
+                    if class_plan is None:
+                        raise UnknownExcelError(
+                            f'When creating a template, no instance could be created for {type_uri}')
+                    options = dict(class_plan=class_plan, add_attribute_info=add_attribute_info,
+                                   generate_choice_list=generate_choice_list, add_deprecated=add_deprecated,
+                                   abbreviate_excel_sheettitles=abbreviate_excel_sheettitles, max_row=max_row)
+                    # the header and first row suffice for the skeleton to have the choice lists and the styles of
+                    # the sheet, they are copied as converting the table into rows alters them
+                    sheet = WriteOnlyExcelTemplateWriter.write_sheet(
+                        workbook=workbook, table_data=[dict(row) for row in table_data[:2]],
+                        choice_list_dict=choice_list_dict, choice_list_options=choice_list_options,
+                        dummy_data_rows=dummy_data_rows, **options)
+                    sheet_futures[sheet.title] = executor.submit(
+                        cls.build_sheet_part, table_data=table_data, choice_list_dict=dict(choice_list_dict),
+                        dummy_data_rows=dummy_data_rows, **options)
+
+            WriteOnlyExcelTemplateWriter.write_choice_list_sheet(workbook=workbook,
+                                                                 choice_list_options=choice_list_options)
+            skeleton = BytesIO()
+            workbook.save(skeleton)
+            workbook.close()
+            built_sheets = {title: sheet_future.result() for title, sheet_future in sheet_futures.items()}
+        finally:
+            if process_pool is not None:
+                process_pool.shutdown(cancel_futures=True)
+
+        with ZipFile(skeleton) as skeleton_file:
+            part_names, styles_part_name = cls.get_part_names(package=skeleton_file)
+            styles = cls.get_styles(skeleton_file.read(styles_part_name))
+        sheet_parts = {part_names[title]: cls.translate_styles(title=title, sheet_xml=sheet_xml, styles=styles,
+                                                               sheet_styles=cls.get_styles(styles_xml))
+                       for title, (sheet_xml, styles_xml) in built_sheets.items()}
+        cls.assemble_package(skeleton=skeleton, sheet_parts=sheet_parts, file_path=file_path)
+        return (file_path,)
+
+    @classmethod
+    def build_sheet_part(cls, table_data: list[dict], class_plan: ClassPlan, choice_list_dict: dict,
+                         add_attribute_info: bool, generate_choice_list: bool, dummy_data_rows: int,
+                         add_deprecated: bool, abbreviate_excel_sheettitles: bool, max_row: int) -> tuple[bytes, bytes]:
+        """
+        Builds the sheet of a single type in a workbook of its own and returns the XML of the sheet and of the styles
+        of the workbook. All the choice lists of the sheet must be in choice_list_dict.
+        """
+        workbook = Workbook(write_only=True)
+        WriteOnlyExcelTemplateWriter.write_sheet(
+            workbook=workbook, table_data=table_data, class_plan=class_plan, choice_list_dict=choice_list_dict,
+            choice_list_options={}, add_attribute_info=add_attribute_info, generate_choice_list=generate_choice_list,
+            dummy_data_rows=dummy_data_rows, add_deprecated=add_deprecated,
+            abbreviate_excel_sheettitles=abbreviate_excel_sheettitles, max_row=max_row)
+        package = BytesIO()
+        workbook.save(package)
+        workbook.close()
+        with ZipFile(package) as package_file:
+            part_names, styles_part_name = cls.get_part_names(package=package_file)
+            return package_file.read(next(iter(part_names.values()))), package_file.read(styles_part_name)
+
+    @classmethod
+    def get_part_names(cls, package: ZipFile) -> tuple[dict[str, str], str]:
+        """Returns the names of the sheet parts of the package by the title of their sheet and of the styles part."""
+        workbook = ElementTree.fromstring(package.read('xl/workbook.xml'))
+        relationships = ElementTree.fromstring(package.read('xl/_rels/workbook.xml.rels'))
+        # the targets are either absolute or relative to the folder of the workbook part
+        targets = {relationship.get('Id'): relationship.get('Target')
+                   for relationship in relationships.iter(f'{PACKAGE_RELATIONSHIPS_NAMESPACE}Relationship')}
+        targets = {relationship_id: target[1:] if target.startswith('/') else posixpath.normpath(f'xl/{target}')
+                   for relationship_id, target in targets.items()}
+        part_names = {sheet.get('name'): targets[sheet.get(f'{RELATIONSHIPS_NAMESPACE}id')]
+                      for sheet in workbook.iter(f'{SPREADSHEET_NAMESPACE}sheet')}
+        styles_part_name = next(targets[relationship.get('Id')] for relationship in relationships
+                                if relationship.get('Type') == STYLES_RELATIONSHIP_TYPE)
+        return part_names, styles_part_name
+
+    @classmethod
+    def get_styles(cls, styles_xml: bytes) -> tuple[list[tuple], list[bytes]]:
+        """
+        Returns the content of the cell styles and of the differential styles (of the conditional formats) of a
+        styles part by their id, so the same styles can be found in another workbook.
+        """
+        style_sheet = ElementTree.fromstring(styles_xml)
+        for element in style_sheet.iter():
+            element.tail = None
+        number_formats = {number_format.get('numFmtId'): number_format.get('formatCode')
+                          for number_format in style_sheet.iter(f'{SPREADSHEET_NAMESPACE}numFmt')}
+        fonts, fills, borders, differential_styles = (
+            [ElementTree.tostring(child) for child in style_sheet.findall(f'{SPREADSHEET_NAMESPACE}{name}/*')]
+            for name in ('fonts', 'fills', 'borders', 'dxfs'))
+        cell_styles = []
+        for cell_style in style_sheet.findall(f'{SPREADSHEET_NAMESPACE}cellXfs/*'):
+            attributes = dict(cell_style.attrib)
+            number_format_id = attributes.pop('numFmtId', '0')
+            cell_styles.append((fonts[int(attributes.pop('fontId', 0))], fills[int(attributes.pop('fillId', 0))],
+                                borders[int(attributes.pop('borderId', 0))],
+                                number_formats.get(number_format_id, number_format_id),
+                                tuple(sorted(attributes.items())),
+                                tuple(ElementTree.tostring(child) for child in cell_style)))
+        return cell_styles, differential_styles
+
+    @classmethod
+    def translate_styles(cls, title: str, sheet_xml: bytes, styles: tuple[list[tuple], list[bytes]],
+                         sheet_styles: tuple[list[tuple], list[bytes]]) -> bytes:
+        """
+        Replaces the ids of the cell styles and differential styles in the XML of a sheet, built with sheet_styles, by
+        the ids of the same styles in styles.
+        """
+        style_ids, dxf_ids = (cls.get_id_translation(title=title, styles=package_styles, sheet_styles=own_styles)
+                              for package_styles, own_styles in zip(styles, sheet_styles))
+        if style_ids:
+            sheet_xml = STYLED_TAG.sub(partial(cls._translate_ids, pattern=STYLE_ATTRIBUTE, ids=style_ids), sheet_xml)
+        if dxf_ids:
+            sheet_xml = DXF_TAG.sub(partial(cls._translate_ids, pattern=DXF_ATTRIBUTE, ids=dxf_ids), sheet_xml)
+        return sheet_xml
+
+    @classmethod
+    def get_id_translation(cls, title: str, styles: list, sheet_styles: list) -> dict[bytes, bytes]:
+        """Returns the id in styles of every style in sheet_styles that has another id there."""
+        style_ids = {}
+        for style_id, style in enumerate(styles):
+            style_ids.setdefault(style, style_id)
+        translation = {}
+        for sheet_style_id, style in enumerate(sheet_styles):
+            if style not in style_ids:
+                raise UnknownExcelError(f'The sheet {title} has a style that is not in the template')
+            if style_ids[style] != sheet_style_id:
+                translation[str(sheet_style_id).encode()] = str(style_ids[style]).encode()
+        return translation
+
+    @classmethod
+    def _translate_ids(cls, tag: re.Match, pattern: re.Pattern, ids: dict[bytes, bytes]) -> bytes:
+        return pattern.sub(partial(cls._translate_id, ids=ids), tag[0])
+
+    @classmethod
+    def _translate_id(cls, attribute: re.Match, ids: dict[bytes, bytes]) -> bytes:
+        return attribute[1] + ids.get(attribute[2], attribute[2]) + attribute[3]
+
+    @classmethod
+    def assemble_package(cls, skeleton: BytesIO, sheet_parts: dict[str, bytes], file_path: Path) -> None:
+        """Writes the package of the skeleton to file_path, with the parts in sheet_parts replaced."""
+        with ZipFile(skeleton) as skeleton_file, ZipFile(file_path, 'w', ZIP_DEFLATED) as package_file:
+            for part in skeleton_file.infolist():
+                if part.filename in sheet_parts:
+                    package_file.writestr(part, sheet_parts[part.filename])
+                else:
+                    package_file.writestr(part, skeleton_file.read(part.filename))
@@ -0,0 +1,47 @@
+from otlmow_model.OtlmowModel.BaseClasses.OTLObject import OTLObject, OTLAttribuut
+
+
+class PrototypeCloner:
+    """
+    Clones generated objects attribute by attribute, without the conversion and validation of set_waarde().
+    copy.deepcopy() can not be used, as the attributes hold closures bound to their attribute.
+    """
+
+    @classmethod
+    def clone(cls, prototype: OTLObject) -> OTLObject:
+        clone = type(prototype)()
+        cls._copy_attribute_values(source=prototype, target=clone)
+        return clone
+
+    @classmethod
+    def _copy_attribute_values(cls, source, target) -> None:
+        target_vars = vars(target)
+        for key, source_attribute in vars(source).items():
+            # _parent refers back to the attribute that holds a waarden object
+            if key == '_parent' or not cls._is_attribute(source_attribute) or source_attribute.readonly:
+                continue
+            target_attribute = target_vars[key]
+            target_attribute.mark_to_be_cleared = source_attribute.mark_to_be_cleared
+            value = source_attribute.waarde
+            if value is None:
+                continue
+
+            if source_attribute.field.waardeObject is None:
+                target_attribute.waarde = list(value) if isinstance(value, list) else value
+            elif isinstance(value, list):
+                target_attribute.waarde = [cls._clone_waarden_object(waarden_object, parent=target_attribute)
+                                           for waarden_object in value]
+            else:
+                target_attribute.waarde = cls._clone_waarden_object(value, parent=target_attribute)
+
+    @classmethod
+    def _is_attribute(cls, value) -> bool:
+        # compares by name, as a model loaded from a model directory has its own OTLAttribuut class
+        return type(value).__name__ == OTLAttribuut.__name__
+
+    @classmethod
+    def _clone_waarden_object(cls, waarden_object, parent: OTLAttribuut):
+        clone = type(waarden_object)()
+        clone._parent = parent
+        cls._copy_attribute_values(source=waarden_object, target=clone)
+        return clone
@@ -0,0 +1,117 @@
+import hashlib
+import importlib
+import importlib.machinery
+import importlib.util
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+from otlmow_model.OtlmowModel.BaseClasses.OTLObject import OTLObject, set_value_by_dictitem
+from otlmow_model.OtlmowModel.Exceptions.CouldNotCreateInstanceError import CouldNotCreateInstanceError
+from otlmow_model.OtlmowModel.Helpers.GenericHelper import get_titlecase_from_ns
+from otlmow_model.OtlmowModel.Helpers.generated_lists import get_hardcoded_class_dict
+
+DEFAULT_MODEL_PACKAGE = 'otlmow_model.OtlmowModel'
+MODEL_PACKAGE_PREFIX = '_otlmow_template_model_'
+
+
+class ResolvedTypeRegistry:
+    """
+    Cache of the classes of the model per (model_directory, class URI). The OtlmowModel package of every model
+    directory is imported under a name of its own, so the classes of different models never replace each other.
+    """
+
+    def __init__(self):
+        self._types = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.resolutions = 0
+        self.resolution_seconds = 0.0
+
+    @classmethod
+    def _get_key(cls, class_uri: str, model_directory: Optional[Path]) -> tuple:
+        return None if model_directory is None else str(Path(model_directory).resolve()), class_uri
+
+    def get_type(self, class_uri: str, model_directory: Path = None) -> type:
+        key = self._get_key(class_uri=class_uri, model_directory=model_directory)
+        type_ = self._types.get(key)
+        if type_ is not None:
+            with self._lock:
+                self.hits += 1
+            return type_
+
+        start = time.perf_counter()
+        type_ = self._import_type(class_uri=class_uri, model_directory=None if key[0] is None else Path(key[0]))
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            self._types[key] = type_
+            self.resolutions += 1
+            self.resolution_seconds += elapsed
+        return type_
+
+    def create_instance_from_dict(self, input_dict: dict, model_directory: Path = None) -> OTLObject:
+        """Creates an instance of the class of the typeURI in input_dict, like OTLObject.from_dict()."""
+        instance = self.get_type(class_uri=input_dict['typeURI'], model_directory=model_directory)()
+        for key, value in input_dict.items():
+            if key != 'typeURI':
+                set_value_by_dictitem(instance, key, value)
+        return instance
+
+    def clear(self) -> None:
+        with self._lock:
+            self._types.clear()
+            self.hits = 0
+            self.resolutions = 0
+            self.resolution_seconds = 0.0
+
+    def get_statistics(self) -> dict:
+        with self._lock:
+            return {
+                'types': len(self._types),
+                'hits': self.hits,
+                'resolutions': self.resolutions,
+                'resolution_seconds': self.resolution_seconds
+            }
+
+    def _import_type(self, class_uri: str, model_directory: Optional[Path]) -> type:
+        try:
+            class_dict_entry = get_hardcoded_class_dict(model_directory=model_directory).get(class_uri)
+        except FileNotFoundError as e:
+            raise CouldNotCreateInstanceError(
+                f'{e}\nMake sure you are directing to the (parent) directory where OtlmowModel is located in.') from e
+        if class_dict_entry is None:
+            raise CouldNotCreateInstanceError(
+                f'Class URI {class_uri} is not found in the class dictionary of the model')
+        namespace, class_name = class_dict_entry['ns'], class_dict_entry['name']
+        namespace_path = '' if namespace == '' else f'{get_titlecase_from_ns(namespace)}.'
+        package_name = self._get_model_package(model_directory=model_directory)
+        try:
+            module = importlib.import_module(f'{package_name}.Classes.{namespace_path}{class_name}')
+        except ModuleNotFoundError as e:
+            raise CouldNotCreateInstanceError(
+                f'When dynamically creating an object of class {class_name}, the import failed.') from e
+        return getattr(module, class_name)
+
+    def _get_model_package(self, model_directory: Optional[Path]) -> str:
+        """Returns the name under which the OtlmowModel package of the model directory is imported."""
+        if model_directory is None:
+            return DEFAULT_MODEL_PACKAGE
+        # derived from the directory, so it is the same in every process
+        package_name = MODEL_PACKAGE_PREFIX + hashlib.sha1(str(model_directory).encode()).hexdigest()[:16]
+        with self._lock:
+            if package_name not in sys.modules:
+                package_path = model_directory / 'OtlmowModel'
+                init_path = package_path / '__init__.py'
+                if init_path.exists():
+                    spec = importlib.util.spec_from_file_location(
+                        package_name, init_path, submodule_search_locations=[str(package_path)])
+                else:
+                    spec = importlib.machinery.ModuleSpec(package_name, None, is_package=True)
+                    spec.submodule_search_locations = [str(package_path)]
+                package = importlib.util.module_from_spec(spec)
+                sys.modules[package_name] = package
+                if spec.loader is not None:
+                    spec.loader.exec_module(package)
+        return package_name
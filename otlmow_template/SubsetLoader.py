@@ -0,0 +1,142 @@
+import sqlite3
+from pathlib import Path
+
+from otlmow_modelbuilder.OSLOCollector import OSLOCollector
+from otlmow_modelbuilder.SQLDataClasses.GeneralInfoRecord import GeneralInfoRecord
+from otlmow_modelbuilder.SQLDataClasses.Inheritance import Inheritance
+from otlmow_modelbuilder.SQLDataClasses.OSLOAttribuut import OSLOAttribuut
+from otlmow_modelbuilder.SQLDataClasses.OSLOClass import OSLOClass
+from otlmow_modelbuilder.SQLDataClasses.OSLODatatypeComplex import OSLODatatypeComplex
+from otlmow_modelbuilder.SQLDataClasses.OSLODatatypeComplexAttribuut import OSLODatatypeComplexAttribuut
+from otlmow_modelbuilder.SQLDataClasses.OSLODatatypePrimitive import OSLODatatypePrimitive
+from otlmow_modelbuilder.SQLDataClasses.OSLODatatypePrimitiveAttribuut import OSLODatatypePrimitiveAttribuut
+from otlmow_modelbuilder.SQLDataClasses.OSLODatatypeUnion import OSLODatatypeUnion
+from otlmow_modelbuilder.SQLDataClasses.OSLODatatypeUnionAttribuut import OSLODatatypeUnionAttribuut
+from otlmow_modelbuilder.SQLDataClasses.OSLOEnumeration import OSLOEnumeration
+from otlmow_modelbuilder.SQLDataClasses.OSLORelatie import OSLORelatie
+from otlmow_modelbuilder.SQLDataClasses.OSLOTypeLink import OSLOTypeLink
+
+MMAP_SIZE = 256 * 1024 * 1024
+
+CLASS_COLUMNS = "label_nl, name, uri, definition_nl, usagenote_nl, abstract, deprecated_version"
+ATTRIBUTE_COLUMNS = ("name, label_nl, definition_nl, class_uri, kardinaliteit_min, kardinaliteit_max, uri, type, "
+                     "overerving, constraints, readonly, usagenote_nl, deprecated_version")
+DATATYPE_COLUMNS = "name, uri, definition_nl, label_nl, usagenote_nl, deprecated_version"
+
+# collector list name, record dataclass and query, in the same order and form as OSLOCollector.collect_all()
+BULK_QUERIES = [
+    ('inheritances', Inheritance,
+     "SELECT base_name, base_uri, class_uri, class_name, deprecated_version FROM InternalBaseClass "
+     "ORDER BY base_uri, class_uri"),
+    ('primitive_datatypes', OSLODatatypePrimitive,
+     f"SELECT {DATATYPE_COLUMNS} FROM OSLODatatypePrimitive ORDER BY uri"),
+    ('primitive_datatype_attributen', OSLODatatypePrimitiveAttribuut,
+     f"SELECT {ATTRIBUTE_COLUMNS} FROM OSLODatatypePrimitiveAttributen ORDER BY uri"),
+    ('complex_datatypes', OSLODatatypeComplex,
+     f"SELECT {DATATYPE_COLUMNS} FROM OSLODatatypeComplex ORDER BY uri"),
+    ('complex_datatype_attributen', OSLODatatypeComplexAttribuut,
+     f"SELECT {ATTRIBUTE_COLUMNS} FROM OSLODatatypeComplexAttributen ORDER BY uri"),
+    ('union_datatypes', OSLODatatypeUnion,
+     f"SELECT {DATATYPE_COLUMNS} FROM OSLODatatypeUnion ORDER BY uri"),
+    ('union_datatype_attributen', OSLODatatypeUnionAttribuut,
+     f"SELECT {ATTRIBUTE_COLUMNS} FROM OSLODatatypeUnionAttributen ORDER BY uri"),
+    ('enumerations', OSLOEnumeration,
+     "SELECT name, uri, usagenote_nl, definition_nl, label_nl, codelist, deprecated_version FROM OSLOEnumeration "
+     "ORDER BY uri"),
+    ('typeLinks', OSLOTypeLink,
+     "SELECT item_uri, item_tabel, deprecated_version FROM TypeLinkTabel ORDER BY item_uri"),
+    ('relations', OSLORelatie,
+     "SELECT * FROM OSLORelaties ORDER BY uri, bron_uri, doel_uri"),
+    ('general_info', GeneralInfoRecord,
+     "SELECT Parameter, Waarde FROM GeneralInfo"),
+]
+
+
+class SubsetLoader:
+    """
+    Loads (parts of) a subset file into an OSLOCollector, with the queries of otlmow-modelbuilder. The subset is
+    opened read-only and memory-mapped, so many processes can read it at the same time.
+    """
+
+    @classmethod
+    def _connect(cls, subset_path: Path) -> sqlite3.Connection:
+        subset_path = Path(subset_path).resolve()
+        if not subset_path.is_file():
+            raise FileNotFoundError(f"{subset_path} is not a valid path. File does not exist.")
+        connection = sqlite3.connect(f'{subset_path.as_uri()}?mode=ro&immutable=1', uri=True,
+                                     check_same_thread=False)
+        connection.execute(f'PRAGMA mmap_size={MMAP_SIZE}')
+        return connection
+
+    @classmethod
+    def _create_empty_collector(cls, subset_path: Path) -> OSLOCollector:
+        collector = OSLOCollector(subset_path)
+        for list_name, _, _ in BULK_QUERIES:
+            setattr(collector, list_name, [])
+        return collector
+
+    @classmethod
+    def load_all(cls, subset_path: Path, include_abstract: bool = True) -> OSLOCollector:
+        """
+        Creates a collector holding the complete subset, like OSLOCollector.collect_all().
+
+        :param subset_path: Path to the subset file
+        :param include_abstract: Whether to include the attributes that are inherited from abstract classes
+        :return: a filled OSLOCollector
+        """
+        collector = cls._create_empty_collector(subset_path)
+        overerving_in_query = '' if include_abstract else 'overerving = 0 AND '
+        connection = cls._connect(subset_path)
+        try:
+            class_rows = connection.execute(f"SELECT {CLASS_COLUMNS} FROM OSLOClass ORDER BY uri").fetchall()
+            attribute_rows = connection.execute(
+                f"SELECT {ATTRIBUTE_COLUMNS} FROM OSLOAttributen "
+                f"WHERE {overerving_in_query}name <> 'typeURI' AND uri NOT LIKE '%?%' "
+                "ORDER BY uri").fetchall()
+            for list_name, data_class, query in BULK_QUERIES:
+                setattr(collector, list_name, [data_class(*row) for row in connection.execute(query).fetchall()])
+        finally:
+            connection.close()
+
+        collector.classes = [OSLOClass(*row) for row in class_rows]
+        collector.class_dict = {c.objectUri: c for c in collector.classes}
+        collector.attributes = [OSLOAttribuut(*row) for row in attribute_rows]
+        return collector
+
+    @classmethod
+    def load_classes(cls, subset_path: Path, class_uris: [str], include_relations: bool = False) -> OSLOCollector:
+        """
+        Creates a collector that only holds the given classes, their attributes and the relations between them.
+
+        :param subset_path: Path to the subset file
+        :param class_uris: URIs of the classes to load
+        :param include_relations: Whether to load the relations between the given classes
+        :return: a partially filled OSLOCollector
+        """
+        class_uris = sorted(set(class_uris))
+        placeholders = ', '.join('?' * len(class_uris))
+        collector = cls._create_empty_collector(subset_path)
+
+        connection = cls._connect(subset_path)
+        try:
+            class_rows = connection.execute(
+                f"SELECT {CLASS_COLUMNS} FROM OSLOClass WHERE uri IN ({placeholders}) "
+                "ORDER BY uri", class_uris).fetchall()
+            attribute_rows = connection.execute(
+                f"SELECT {ATTRIBUTE_COLUMNS} FROM OSLOAttributen WHERE class_uri IN ({placeholders}) "
+                "AND name <> 'typeURI' AND uri NOT LIKE '%?%' "
+                "ORDER BY uri", class_uris).fetchall()
+            relation_rows = []
+            if include_relations:
+                relation_rows = connection.execute(
+                    "SELECT * "
+                    f"FROM OSLORelaties WHERE bron_uri IN ({placeholders}) AND doel_uri IN ({placeholders}) "
+                    "ORDER BY uri, bron_uri, doel_uri", class_uris + class_uris).fetchall()
+        finally:
+            connection.close()
+
+        collector.classes = [OSLOClass(*row) for row in class_rows]
+        collector.class_dict = {c.objectUri: c for c in collector.classes}
+        collector.attributes = [OSLOAttribuut(*row) for row in attribute_rows]
+        collector.relations = [OSLORelatie(*row) for row in relation_rows]
+        return collector
@@ -2,34 +2,58 @@ import asyncio
 import concurrent
 import contextlib
 import csv
+import functools
 import logging
 import os
+import time
 from asyncio import sleep
 from collections import defaultdict
-from concurrent.futures import ThreadPoolExecutor, as_completed, ALL_COMPLETED
+from concurrent.futures import ThreadPoolExecutor, as_completed, ALL_COMPLETED, Executor, ProcessPoolExecutor
+from itertools import chain
 from pathlib import Path
+from typing import Iterable, Iterator, Optional, Union
 
-from openpyxl.cell import Cell
 from openpyxl.reader.excel import load_workbook
 from openpyxl.styles import PatternFill, Alignment
-from openpyxl.utils import get_column_letter
 from openpyxl.workbook import Workbook
-from openpyxl.worksheet.datavalidation import DataValidation
-from openpyxl.worksheet.dimensions import DimensionHolder, ColumnDimension
 from openpyxl.worksheet.worksheet import Worksheet
 from otlmow_converter.DotnotationHelper import DotnotationHelper
 from otlmow_converter.Exceptions.UnknownExcelError import UnknownExcelError
 from otlmow_converter.OtlmowConverter import OtlmowConverter
-from otlmow_model.OtlmowModel.BaseClasses.OTLObject import dynamic_create_instance_from_uri, OTLObject, \
-    get_attribute_by_name, dynamic_create_type_from_uri
+from otlmow_model.OtlmowModel.BaseClasses.OTLObject import OTLObject, get_attribute_by_name
+from otlmow_model.OtlmowModel.Exceptions.CouldNotCreateRelationError import CouldNotCreateRelationError
 from otlmow_model.OtlmowModel.Helpers.GenericHelper import get_ns_and_name_from_uri
-from otlmow_model.OtlmowModel.Helpers.RelationCreator import create_betrokkenerelation, create_relation
-from otlmow_model.OtlmowModel.Helpers.generated_lists import get_hardcoded_relation_dict
+from otlmow_model.OtlmowModel.Helpers.RelationValidator import is_valid_relation
 from otlmow_modelbuilder.OSLOCollector import OSLOCollector
 from otlmow_modelbuilder.SQLDataClasses.OSLOClass import OSLOClass
 
+from otlmow_template.AssetIdAllocator import AssetIdAllocator
+from otlmow_template.CollectorDiskCache import CollectorDiskCache
+from otlmow_template.CollectorMemoryCache import CollectorMemoryCache
+from otlmow_template.ColumnarRowSource import ColumnarRowSource
+from otlmow_template.CsvTemplateWriter import CsvTemplateWriter
+from otlmow_template.ColumnarTemplateWriter import ColumnarTemplateWriter, DEFAULT_CHUNK_SIZE as COLUMNAR_CHUNK_SIZE
+from otlmow_template.DummyDataGenerator import DummyDataGenerator
+from otlmow_template.ExcelTemplateWriter import ExcelTemplateWriter
+from otlmow_template.GenerationContext import GenerationContext
+from otlmow_template.ParallelExcelTemplateWriter import ParallelExcelTemplateWriter
+from otlmow_template.PrototypeCloner import PrototypeCloner
+from otlmow_template.ResolvedTypeRegistry import ResolvedTypeRegistry
+from otlmow_template.SubsetLoader import SubsetLoader
+from otlmow_template.TemplateBatch import TemplateJob, TemplateJobResult
+from otlmow_template.TemplateManifest import TemplateManifest, TemplateChanges
+from otlmow_template.TemplateOutputCache import TemplateOutputCache
+from otlmow_template.TemplateColumnFormatter import TemplateColumnFormatter, DEFAULT_MAX_ROW
+from otlmow_template.TemplatePlan import TemplatePlan, ClassPlan, ColumnPlan, AGENT_URI, TYPE_URI_DEFINITION
+from otlmow_template.WriteOnlyExcelTemplateWriter import WriteOnlyExcelTemplateWriter
+
 ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 
+HEEFT_BETROKKENE_URI = 'https://wegenenverkeer.data.vlaanderen.be/ns/onderdeel#HeeftBetrokkene'
+
+# maximum amount of objects of a single class that is generated in one job of a process executor
+PROCESS_CHUNK_SIZE = 100
+
 
 short_to_long_ns = {
     'ond': 'https://wegenenverkeer.data.vlaanderen.be/ns/onderdeel#',
@@ -46,12 +70,122 @@ short_to_long_ns = {
 
 
 class SubsetTemplateCreator:
-    green_fill = PatternFill(start_color="90EE90", fill_type="solid")
+    collector_disk_cache: Optional[CollectorDiskCache] = None
+    collector_memory_cache: Optional[CollectorMemoryCache] = None
+    template_output_cache: Optional[TemplateOutputCache] = None
+    # open subset files read-only, immutable and memory-mapped instead of through OSLOCollector.collect_all()
+    read_only_subset_loading: bool = False
+    # classes of the model resolved by (model_directory, URI), shared by all threads (one per worker process)
+    type_registry: ResolvedTypeRegistry = ResolvedTypeRegistry()
+
+    @classmethod
+    def enable_collector_disk_cache(cls, cache_directory: Path, max_size_bytes: int = 512 * 1024 * 1024) -> None:
+        """
+        Enables the persistent cache of collected subsets.
+
+        :param cache_directory: Directory where the cache entries are stored
+        :param max_size_bytes: Maximum total size of the cache, least recently used entries are evicted first
+        """
+        cls.collector_disk_cache = CollectorDiskCache(cache_directory=cache_directory, max_size_bytes=max_size_bytes)
+
+    @classmethod
+    def disable_collector_disk_cache(cls) -> None:
+        cls.collector_disk_cache = None
+
+    @classmethod
+    def enable_collector_memory_cache(cls, max_entries: int = 32, max_size_bytes: int = 1024 * 1024 * 1024) -> None:
+        """
+        Enables the in-process LRU cache of collected subsets, see get_collector_memory_cache_statistics().
+
+        :param max_entries: Maximum amount of collected subsets kept in memory
+        :param max_size_bytes: Maximum estimated size of the collected subsets kept in memory
+        """
+        cls.collector_memory_cache = CollectorMemoryCache(max_entries=max_entries, max_size_bytes=max_size_bytes)
+
+    @classmethod
+    def disable_collector_memory_cache(cls) -> None:
+        cls.collector_memory_cache = None
+
+    @classmethod
+    def get_collector_memory_cache_statistics(cls) -> Optional[dict]:
+        if cls.collector_memory_cache is None:
+            return None
+        return cls.collector_memory_cache.get_statistics()
+
+    @classmethod
+    def enable_template_output_cache(cls, cache_directory: Path, max_size_bytes: int = 1024 * 1024 * 1024,
+                                     use_hard_links: bool = False) -> None:
+        """
+        Enables the cache of finished templates.
+
+        :param cache_directory: Directory where the cached templates are stored
+        :param max_size_bytes: Maximum total size of the cache, least recently used entries are evicted first
+        :param use_hard_links: Whether to hard-link the cached files instead of copying them, defaults to False
+        """
+        cls.template_output_cache = TemplateOutputCache(cache_directory=cache_directory, max_size_bytes=max_size_bytes,
+                                                        use_hard_links=use_hard_links)
+
+    @classmethod
+    def disable_template_output_cache(cls) -> None:
+        cls.template_output_cache = None
+
+    @classmethod
+    def get_template_output_cache_statistics(cls) -> Optional[dict]:
+        if cls.template_output_cache is None:
+            return None
+        return cls.template_output_cache.get_statistics()
+
+    @classmethod
+    def get_type_resolution_statistics(cls) -> dict:
+        """
+        Returns the statistics of the type registry: the amount of resolved types, the amount of lookups that were
+        served from the registry and the total time spent resolving URIs to classes.
+        """
+        return cls.type_registry.get_statistics()
+
+    @classmethod
+    def _load_collector_from_subset_path(cls, subset_path: Path, include_abstract: bool = True) -> OSLOCollector:
+        memory_cache = cls.collector_memory_cache
+        if memory_cache is None:
+            return cls._load_collector_from_disk_cache_or_subset(
+                subset_path=subset_path, include_abstract=include_abstract)
+
+        memory_cache_key = memory_cache.get_cache_key(subset_path=subset_path, include_abstract=include_abstract)
+        collector = memory_cache.get(memory_cache_key)
+        if collector is None:
+            collector = cls._load_collector_from_disk_cache_or_subset(
+                subset_path=subset_path, include_abstract=include_abstract)
+            memory_cache.put(memory_cache_key, collector)
+        return collector
+
+    @classmethod
+    def _load_collector_from_disk_cache_or_subset(cls, subset_path: Path, include_abstract: bool = True
+                                                  ) -> OSLOCollector:
+        disk_cache = cls.collector_disk_cache
+        if disk_cache is None:
+            return cls._collect_subset(subset_path=subset_path, include_abstract=include_abstract)
+
+        cache_key = disk_cache.get_cache_key(subset_path=subset_path, include_abstract=include_abstract)
+        collector = disk_cache.load(subset_path=subset_path, cache_key=cache_key)
+        if collector is None:
+            collector = cls._collect_subset(subset_path=subset_path, include_abstract=include_abstract)
+            disk_cache.store(subset_path=subset_path, collector=collector, cache_key=cache_key)
+        return collector
+
+    @classmethod
+    def _load_collector_for_template(cls, subset_path: Path, class_uris_filter: [str], ignore_relations: bool,
+                                     lazy_loading: bool) -> OSLOCollector:
+        if lazy_loading and class_uris_filter is not None:
+            return SubsetLoader.load_classes(subset_path=subset_path, class_uris=class_uris_filter,
+                                             include_relations=not ignore_relations)
+        return cls._load_collector_from_subset_path(subset_path=subset_path)
 
     @classmethod
-    def _load_collector_from_subset_path(cls, subset_path: Path) -> OSLOCollector:
+    def _collect_subset(cls, subset_path: Path, include_abstract: bool = True) -> OSLOCollector:
+        if cls.read_only_subset_loading:
+            return SubsetLoader.load_all(subset_path=subset_path, include_abstract=include_abstract)
         collector = OSLOCollector(subset_path)
-        collector.collect_all(include_abstract=True)
+        collector.collect_all(include_abstract=include_abstract)
         return collector
 
     @classmethod
@@ -68,7 +202,17 @@ class SubsetTemplateCreator:
             add_deprecated: bool = False,
             generate_choice_list: bool = True,
             split_per_type: bool = True,
-            model_directory: Path = None, **kwargs):
+            model_directory: Path = None,
+            lazy_loading: bool = False,
+            executor: Union[str, Executor] = 'thread',
+            clone_prototype: bool = False,
+            randomize_clones: bool = False,
+            seed: Optional[int] = None,
+            streaming: bool = False,
+            write_only: bool = False,
+            parallel_sheets: bool = False,
+            max_row: int = DEFAULT_MAX_ROW,
+            offload_executor: Optional[Executor] = None, **kwargs):
         """
         Generate a template from a subset file, async version.
         Await this function!
@@ -81,40 +225,32 @@ class SubsetTemplateCreator:
         :param dummy_data_rows: Amount of dummy data rows to add to the template, defaults to 1
         :param add_geometry: Whether to include the geometry attribute in the template, defaults to True
         :param add_attribute_info: Whether to add attribute information to the template (colored grey in Excel), defaults to False
-        :param add_deprecated: Whether to add a deprecated row to the template (colored red in Excel), defaults to False
+        :param add_deprecated: Whether to tag deprecated attributes in the template, defaults to False
         :param generate_choice_list: Whether to generate a choice list in the template (only for Excel), defaults to True
         :param split_per_type: Whether to split the template into a file per type (only for CSV), defaults to True
         :param model_directory: Path to the model directory, defaults to None
+        :param lazy_loading: Whether to only load the classes in class_uris_filter (and their attributes and relations) from the subset instead of the whole subset, defaults to False
+        :param executor: How to distribute the classes when generating the objects: 'thread', 'process' (a process per core) or an Executor instance, defaults to 'thread'
+        :param clone_prototype: Whether to generate one object per class and clone it for the other dummy data rows, defaults to False
+        :param randomize_clones: Whether to generate new simple dummy values for the clones (only with clone_prototype), defaults to False
+        :param seed: Seed for the dummy data, the same seed generates the same dummy data, defaults to None (random dummy data)
+        :param streaming: Whether to generate and write the objects class by class instead of generating all objects first, to keep at most one class of objects in memory (see iter_objects_for_template), defaults to False
+        :param write_only: Whether to write an Excel template row by row with openpyxl's write-only mode instead of building the whole workbook in memory (see WriteOnlyExcelTemplateWriter), combine with streaming to keep the memory flat regardless of the number of classes, defaults to False
+        :param parallel_sheets: Whether to build the sheets of an Excel template like write_only, but each in a worker process, and assemble them into a single file (see ParallelExcelTemplateWriter), defaults to False
+        :param max_row: The last row of the data validations and of the formatting of the columns (only for Excel), defaults to 1000
+        :param offload_executor: Executor that runs the generation, defaults to None (the default executor of the event loop)
 
         :return: None
         """
-        # generate objects to write to file
-        objects = await cls.generate_objects_for_template_async(
-            subset_path=subset_path, ignore_relations=ignore_relations, class_uris_filter=class_uris_filter,
-            add_geometry=add_geometry, filter_attributes_by_subset=filter_attributes_by_subset,
-            dummy_data_rows=dummy_data_rows, model_directory=model_directory)
-
-        abbreviate_excel_after = False
-        if kwargs.get('abbreviate_excel_sheettitles') == True:
-            kwargs['abbreviate_excel_sheettitles'] = False
-            abbreviate_excel_after = True
-
-        # write the file
-        await OtlmowConverter.from_objects_to_file_async(
-            file_path=template_file_path, sequence_of_objects=objects, split_per_type=split_per_type, **kwargs)
-
-        # alter the file if needed
-        extension = template_file_path.suffix.lower()
-        if extension == '.xlsx':
-            await cls.alter_excel_template_async(
-                generate_choice_list=generate_choice_list, file_path=template_file_path, dummy_data_rows=dummy_data_rows,
-                instances=objects, add_deprecated=add_deprecated, add_attribute_info=add_attribute_info,
-                abbreviate_excel_sheettitles=abbreviate_excel_after)
-
-        elif extension == '.csv':
-            await cls.alter_csv_template_async(
-                split_per_type=split_per_type, file_path=template_file_path, dummy_data_rows=dummy_data_rows,
-                instances=objects, add_deprecated=add_deprecated, add_attribute_info=add_attribute_info)
+        await cls._run_in_executor(
+            offload_executor, cls.generate_template_from_subset, subset_path=subset_path,
+            template_file_path=template_file_path, ignore_relations=ignore_relations,
+            filter_attributes_by_subset=filter_attributes_by_subset, class_uris_filter=class_uris_filter,
+            dummy_data_rows=dummy_data_rows, add_geometry=add_geometry, add_attribute_info=add_attribute_info,
+            add_deprecated=add_deprecated, generate_choice_list=generate_choice_list, split_per_type=split_per_type,
+            model_directory=model_directory, lazy_loading=lazy_loading, executor=executor,
+            clone_prototype=clone_prototype, randomize_clones=randomize_clones, seed=seed, streaming=streaming,
+            write_only=write_only, parallel_sheets=parallel_sheets, max_row=max_row, **kwargs)
 
     @classmethod
     def generate_template_from_subset(
@@ -130,7 +266,16 @@ class SubsetTemplateCreator:
             add_deprecated: bool = False,
             generate_choice_list: bool = True,
             split_per_type: bool = True,
-            model_directory: Path = None, **kwargs):
+            model_directory: Path = None,
+            lazy_loading: bool = False,
+            executor: Union[str, Executor] = 'thread',
+            clone_prototype: bool = False,
+            randomize_clones: bool = False,
+            seed: Optional[int] = None,
+            streaming: bool = False,
+            write_only: bool = False,
+            parallel_sheets: bool = False,
+            max_row: int = DEFAULT_MAX_ROW, **kwargs):
         """
          Generate a template from a subset file.
 
@@ -146,227 +291,983 @@ class SubsetTemplateCreator:
          :param generate_choice_list: Whether to generate a choice list in the template (only for Excel), defaults to True
          :param split_per_type: Whether to split the template into a file per type (only for CSV), defaults to True
          :param model_directory: Path to the model directory, defaults to None
+         :param lazy_loading: Whether to only load the classes in class_uris_filter (and their attributes and relations) from the subset instead of the whole subset, defaults to False
+         :param executor: How to distribute the classes when generating the objects: 'thread', 'process' (a process per core) or an Executor instance, defaults to 'thread'
+         :param clone_prototype: Whether to generate one object per class and clone it for the other dummy data rows, defaults to False
+         :param randomize_clones: Whether to generate new simple dummy values for the clones (only with clone_prototype), defaults to False
+         :param seed: Seed for the dummy data, the same seed generates the same dummy data, defaults to None (random dummy data)
+         :param streaming: Whether to generate and write the objects class by class instead of generating all objects first, to keep at most one class of objects in memory (see iter_objects_for_template), defaults to False
+         :param write_only: Whether to write an Excel template row by row with openpyxl's write-only mode instead of building the whole workbook in memory (see WriteOnlyExcelTemplateWriter), combine with streaming to keep the memory flat regardless of the number of classes, defaults to False
+         :param parallel_sheets: Whether to build the sheets of an Excel template like write_only, but each in a worker process, and assemble them into a single file (see ParallelExcelTemplateWriter), defaults to False
+         :param max_row: The last row of the data validations and of the formatting of the columns (only for Excel), defaults to 1000
 
          :return: None
          """
+        output_cache = cls.template_output_cache
+        output_cache_key = None
+        if output_cache is not None:
+            output_cache_key = cls._get_output_cache_key(
+                subset_path=subset_path, template_file_path=template_file_path, model_directory=model_directory,
+                ignore_relations=ignore_relations, filter_attributes_by_subset=filter_attributes_by_subset,
+                class_uris_filter=class_uris_filter, dummy_data_rows=dummy_data_rows, add_geometry=add_geometry,
+                add_attribute_info=add_attribute_info, add_deprecated=add_deprecated,
+                generate_choice_list=generate_choice_list, split_per_type=split_per_type,
+                clone_prototype=clone_prototype, randomize_clones=randomize_clones, seed=seed, write_only=write_only,
+                parallel_sheets=parallel_sheets, max_row=max_row, **kwargs)
+            if output_cache.restore(cache_key=output_cache_key, template_file_path=template_file_path):
+                return
+
+        # the sheet titles are abbreviated after altering the sheets, which needs the full titles
+        abbreviate_excel_after = kwargs.pop('abbreviate_excel_sheettitles', False) == True
+        extension = template_file_path.suffix.lower()
+
         # generate objects to write to file
-        objects = cls.generate_objects_for_template(
-            subset_path=subset_path, ignore_relations=ignore_relations, class_uris_filter=class_uris_filter,
-            add_geometry=add_geometry, filter_attributes_by_subset=filter_attributes_by_subset,
-            dummy_data_rows=dummy_data_rows, model_directory=model_directory)
+        if streaming:
+            class_batches = cls.iter_objects_for_template(
+                subset_path=subset_path, ignore_relations=ignore_relations, class_uris_filter=class_uris_filter,
+                add_geometry=add_geometry, filter_attributes_by_subset=filter_attributes_by_subset,
+                dummy_data_rows=dummy_data_rows, model_directory=model_directory, lazy_loading=lazy_loading,
+                executor=executor, clone_prototype=clone_prototype, randomize_clones=randomize_clones, seed=seed)
+            created_file_paths = None
+            if extension == '.csv' and split_per_type:
+                created_file_paths = cls.write_csv_template_per_class(
+                    class_batches=class_batches, file_path=template_file_path, add_attribute_info=add_attribute_info,
+                    add_deprecated=add_deprecated, dummy_data_rows=dummy_data_rows, model_directory=model_directory,
+                    **kwargs)
+            elif extension == '.xlsx' and (write_only or parallel_sheets):
+                excel_writer = ParallelExcelTemplateWriter if parallel_sheets else WriteOnlyExcelTemplateWriter
+                created_file_paths = excel_writer.write(
+                    class_batches=class_batches, file_path=template_file_path,
+                    generate_choice_list=generate_choice_list, dummy_data_rows=dummy_data_rows,
+                    add_deprecated=add_deprecated, add_attribute_info=add_attribute_info,
+                    abbreviate_excel_sheettitles=abbreviate_excel_after, max_row=max_row, **kwargs)
+            if created_file_paths is not None:
+                if output_cache_key is not None:
+                    output_cache.store(cache_key=output_cache_key, template_file_path=template_file_path,
+                                       created_file_paths=created_file_paths)
+                return
+            # the converter turns every object into a row as it iterates, so the objects of a class are released
+            # once the next class is generated
+            objects = chain.from_iterable(class_batches)
+        else:
+            objects = cls.generate_objects_for_template(
+                subset_path=subset_path, ignore_relations=ignore_relations, class_uris_filter=class_uris_filter,
+                add_geometry=add_geometry, filter_attributes_by_subset=filter_attributes_by_subset,
+                dummy_data_rows=dummy_data_rows, model_directory=model_directory, lazy_loading=lazy_loading,
+                executor=executor, clone_prototype=clone_prototype, randomize_clones=randomize_clones, seed=seed)
+
+        if extension == '.xlsx' and (write_only or parallel_sheets):
+            excel_writer = ParallelExcelTemplateWriter if parallel_sheets else WriteOnlyExcelTemplateWriter
+            created_file_paths = excel_writer.write(
+                class_batches=[objects], file_path=template_file_path, generate_choice_list=generate_choice_list,
+                dummy_data_rows=dummy_data_rows, add_deprecated=add_deprecated, add_attribute_info=add_attribute_info,
+                abbreviate_excel_sheettitles=abbreviate_excel_after, max_row=max_row, **kwargs)
+        elif extension == '.xlsx':
+            # the workbook is built, altered and saved in a single pass
+            created_file_paths = cls.write_excel_template(
+                objects=objects, file_path=template_file_path, generate_choice_list=generate_choice_list,
+                dummy_data_rows=dummy_data_rows, add_deprecated=add_deprecated, add_attribute_info=add_attribute_info,
+                abbreviate_excel_sheettitles=abbreviate_excel_after, max_row=max_row, **kwargs)
+        elif extension == '.csv':
+            # the files are written with the attribute info and deprecated rows in a single pass
+            created_file_paths = cls.write_csv_template(
+                objects=objects, file_path=template_file_path, split_per_type=split_per_type,
+                dummy_data_rows=dummy_data_rows, add_deprecated=add_deprecated, add_attribute_info=add_attribute_info,
+                **kwargs)
+        else:
+            created_file_paths = OtlmowConverter.from_objects_to_file(
+                file_path=template_file_path, sequence_of_objects=objects, split_per_type=split_per_type,
+                model_directory=model_directory, **kwargs)
+
+        if output_cache_key is not None:
+            output_cache.store(cache_key=output_cache_key, template_file_path=template_file_path,
+                               created_file_paths=created_file_paths)
+
+    @classmethod
+    def _get_output_cache_key(
+            cls, subset_path: Path, template_file_path: Path, model_directory: Path = None,
+            ignore_relations: bool = True, filter_attributes_by_subset: bool = True, class_uris_filter: [str] = None,
+            dummy_data_rows: int = 1, add_geometry: bool = True, add_attribute_info: bool = False,
+            add_deprecated: bool = False, generate_choice_list: bool = True, split_per_type: bool = True,
+            clone_prototype: bool = False, randomize_clones: bool = False, seed: Optional[int] = None,
+            write_only: bool = False, parallel_sheets: bool = False, max_row: int = DEFAULT_MAX_ROW,
+            **kwargs) -> str:
+        """
+        Returns the key of the template in the template output cache. The options that change the template have
+        the defaults of generate_template_from_subset, so the sync and async versions share their entries.
+        """
+        options = dict(
+            ignore_relations=ignore_relations, filter_attributes_by_subset=filter_attributes_by_subset,
+            class_uris_filter=class_uris_filter, dummy_data_rows=dummy_data_rows, add_geometry=add_geometry,
+            add_attribute_info=add_attribute_info, add_deprecated=add_deprecated,
+            generate_choice_list=generate_choice_list, split_per_type=split_per_type, clone_prototype=clone_prototype,
+            randomize_clones=randomize_clones, seed=seed, write_only=write_only, parallel_sheets=parallel_sheets,
+            max_row=max_row, **kwargs)
+        return cls.template_output_cache.get_cache_key(
+            subset_path=subset_path, template_file_path=template_file_path, model_directory=model_directory, **options)
 
-        abbreviate_excel_after = False
-        if kwargs.get('abbreviate_excel_sheettitles') == True:
-            kwargs['abbreviate_excel_sheettitles'] = False
-            abbreviate_excel_after = True
+    @classmethod
+    def generate_templates_from_subsets(cls, jobs: Iterable[TemplateJob], max_workers: Optional[int] = None,
+                                        executor: Optional[Executor] = None) -> list[TemplateJobResult]:
+        """
+        Generates the templates of many subsets in one call, on a pool of threads that share the caches of the
+        process. A job that fails does not stop the other jobs, its error is reported in its result.
+
+        :param jobs: the templates to generate
+        :param max_workers: maximum amount of jobs that run at the same time, defaults to None (the default of ThreadPoolExecutor)
+        :param executor: Executor that generates the objects of every job that does not set its own executor (e.g. a ProcessPoolExecutor that is shared by all jobs), defaults to None (each job uses its own threads)
+
+        :return: a result per job, in the order of the jobs
+        """
+        jobs = list(jobs)
+        for model_directory in {job.options.get('model_directory') for job in jobs}:
+            # a model that can not be loaded is reported by the jobs that use it
+            with contextlib.suppress(Exception):
+                GenerationContext.create(model_directory=model_directory)
 
-        # write the file
-        OtlmowConverter.from_objects_to_file(
-            file_path=template_file_path, sequence_of_objects=objects, split_per_type=split_per_type,
-            model_directory=model_directory, **kwargs)
+        with ThreadPoolExecutor(max_workers=max_workers) as job_executor:
+            return list(job_executor.map(functools.partial(cls._run_template_job, executor=executor), jobs))
 
-        # alter the file if needed
+    @classmethod
+    def _run_template_job(cls, job: TemplateJob, executor: Optional[Executor] = None) -> TemplateJobResult:
+        options = dict(job.options)
+        if executor is not None:
+            options.setdefault('executor', executor)
+        start_time = time.perf_counter()
+        try:
+            cls.generate_template_from_subset(subset_path=job.subset_path, template_file_path=job.template_file_path,
+                                              **options)
+        except Exception as ex:
+            logging.warning(f'Could not generate the template {job.template_file_path} from {job.subset_path}: {ex}')
+            return TemplateJobResult(job=job, success=False, duration_seconds=time.perf_counter() - start_time,
+                                     error=ex)
+        return TemplateJobResult(job=job, success=True, duration_seconds=time.perf_counter() - start_time)
+
+    @classmethod
+    def regenerate_template_from_subset(
+            cls,
+            subset_path: Path,
+            template_file_path: Path,
+            filter_attributes_by_subset: bool = True,
+            class_uris_filter: [str] = None,
+            dummy_data_rows: int = 1,
+            add_geometry: bool = True,
+            add_attribute_info: bool = False,
+            add_deprecated: bool = False,
+            generate_choice_list: bool = True,
+            split_per_type: bool = True,
+            model_directory: Path = None,
+            seed: Optional[int] = None,
+            max_row: int = DEFAULT_MAX_ROW,
+            manifest_path: Path = None, **kwargs) -> TemplateChanges:
+        """
+        Regenerates a template (without relations) after its subset changed, only for the classes that changed
+        since the generation manifest of the previous run. Without a usable manifest, the whole template is generated.
+
+        :param subset_path: Path to the (changed) subset file
+        :param template_file_path: Path to the template file that was generated from the previous subset
+        :param manifest_path: Path to the generation manifest, defaults to None (<template name>.manifest.json next to the template)
+        See generate_template_from_subset for the other parameters.
+
+        :return: the classes that were added, removed and changed
+        """
+        if manifest_path is None:
+            manifest_path = TemplateManifest.get_manifest_path(template_file_path)
+        options = dict(filter_attributes_by_subset=filter_attributes_by_subset, class_uris_filter=class_uris_filter,
+                       dummy_data_rows=dummy_data_rows, add_geometry=add_geometry,
+                       add_attribute_info=add_attribute_info, add_deprecated=add_deprecated,
+                       generate_choice_list=generate_choice_list, split_per_type=split_per_type, seed=seed,
+                       max_row=max_row, **kwargs)
+        options_fingerprint = TemplateManifest.get_options_fingerprint(
+            template_file_path=template_file_path, model_directory=model_directory, **options)
+
+        collector, filtered_class_list, context = cls._prepare_generation(
+            subset_path=subset_path, class_uris_filter=class_uris_filter, ignore_relations=True,
+            model_directory=model_directory, lazy_loading=False, executor='thread', seed=seed)
+        class_uris = [cl.objectUri for cl in filtered_class_list
+                      if cl.abstract == 0 and not context.is_relation(cl.objectUri)]
+        manifest = TemplateManifest(options_fingerprint=options_fingerprint,
+                                    class_fingerprints=TemplateManifest.get_class_fingerprints(collector, class_uris))
+        del collector
+
+        previous_manifest = TemplateManifest.load(manifest_path) if manifest_path.exists() else None
         extension = template_file_path.suffix.lower()
+        # a CSV template split per type consists of the files per type only
+        if (previous_manifest is None or previous_manifest.options_fingerprint != options_fingerprint
+                or extension not in ('.xlsx', '.csv') or (extension == '.xlsx' and not template_file_path.exists())
+                or (extension == '.csv' and not split_per_type)):
+            previous_class_uris = [] if previous_manifest is None else list(previous_manifest.class_fingerprints)
+            changes = TemplateChanges(added=[uri for uri in class_uris if uri not in previous_class_uris],
+                                      removed=[uri for uri in previous_class_uris if uri not in class_uris],
+                                      changed=[uri for uri in class_uris if uri in previous_class_uris])
+            if extension == '.csv' and split_per_type:
+                cls._remove_csv_files_of_classes(file_path=template_file_path, class_uris=changes.removed)
+            cls.generate_template_from_subset(subset_path=subset_path, template_file_path=template_file_path,
+                                              ignore_relations=True, model_directory=model_directory, **options)
+            # an upper bound of the identificators that were allocated
+            manifest.next_identificator = len(class_uris) * max(1, dummy_data_rows)
+            manifest.save(manifest_path)
+            return changes
+
+        changes = previous_manifest.get_changes(manifest.class_fingerprints)
+        manifest.next_identificator = previous_manifest.next_identificator
+        if changes.is_empty:
+            return changes
+
+        objects = []
+        if changes.classes_to_build:
+            # only the classes to build are loaded from the subset
+            objects = cls.generate_objects_for_template(
+                subset_path=subset_path, class_uris_filter=changes.classes_to_build,
+                filter_attributes_by_subset=filter_attributes_by_subset, dummy_data_rows=dummy_data_rows,
+                add_geometry=add_geometry, ignore_relations=True, model_directory=model_directory,
+                lazy_loading=True, seed=seed)
+            asset_id_allocator = AssetIdAllocator(start=manifest.next_identificator)
+            for otl_object in objects:
+                asset_id_allocator.assign(otl_object)
+            manifest.next_identificator = asset_id_allocator.next_number
+
         if extension == '.xlsx':
-            cls.alter_excel_template(
-                generate_choice_list=generate_choice_list, file_path=template_file_path, dummy_data_rows=dummy_data_rows,
-                instances=objects, add_deprecated=add_deprecated, add_attribute_info=add_attribute_info,
-                abbreviate_excel_sheettitles=abbreviate_excel_after)
-        elif extension == '.csv':
-            cls.alter_csv_template(
-                split_per_type=split_per_type, file_path=template_file_path, dummy_data_rows=dummy_data_rows,
-                instances=objects, add_deprecated=add_deprecated, add_attribute_info=add_attribute_info)
+            cls._update_excel_template(
+                file_path=template_file_path, objects=objects, changes=changes, class_uris=class_uris,
+                previous_class_uris=list(previous_manifest.class_fingerprints),
+                add_attribute_info=add_attribute_info, add_deprecated=add_deprecated,
+                generate_choice_list=generate_choice_list, dummy_data_rows=dummy_data_rows, max_row=max_row, **kwargs)
+        else:
+            cls._remove_csv_files_of_classes(file_path=template_file_path,
+                                             class_uris=changes.removed + changes.changed)
+            cls.write_csv_template_per_class(
+                class_batches=iter(cls.fill_class_dict(objects).values()), file_path=template_file_path,
+                add_attribute_info=add_attribute_info, add_deprecated=add_deprecated,
+                dummy_data_rows=dummy_data_rows, model_directory=model_directory, **kwargs)
+        manifest.save(manifest_path)
+        return changes
 
+    @classmethod
+    def _remove_csv_files_of_classes(cls, file_path: Path, class_uris: [str]) -> None:
+        for class_uri in class_uris:
+            cls.get_csv_file_path_for_type(file_path=file_path, type_uri=class_uri).unlink(missing_ok=True)
+
+    @classmethod
+    def _update_excel_template(cls, file_path: Path, objects: [OTLObject], changes: TemplateChanges,
+                               class_uris: [str], previous_class_uris: [str], add_attribute_info: bool,
+                               add_deprecated: bool, generate_choice_list: bool, dummy_data_rows: int,
+                               max_row: int = DEFAULT_MAX_ROW, **kwargs) -> None:
+        """
+        Replaces the sheets of the removed and changed classes of an existing template by sheets of objects and
+        orders the sheets like class_uris, followed by the Keuzelijsten sheet.
+        """
+        abbreviate_excel_sheettitles = kwargs.pop('abbreviate_excel_sheettitles', False) == True
+        workbook = load_workbook(file_path)
+        sheet_per_class = {}
+        for sheet in list(workbook):
+            if sheet.title == 'Keuzelijsten':
+                continue
+            class_uri = cls._find_class_uri_of_sheet(title=sheet.title, class_uris=previous_class_uris)
+            if class_uri in changes.removed or class_uri in changes.changed:
+                workbook.remove(sheet)
+            elif class_uri is not None:
+                sheet_per_class[class_uri] = sheet
+
+        new_sheets = []
+        template_plan = TemplatePlan()
+        if objects:
+            prototypes = {}
+            table_dict = ExcelTemplateWriter.get_tables_per_type(
+                sequence_of_objects=TemplatePlan.iter_recording_prototypes(objects, prototypes), **kwargs)
+            template_plan = ExcelTemplateWriter.compile_template_plan(table_dict=table_dict, prototypes=prototypes)
+            new_sheets = ExcelTemplateWriter.add_sheets_from_tables(workbook=workbook, table_dict=table_dict, **kwargs)
+            for sheet in new_sheets:
+                sheet_per_class[cls._find_class_uri_of_sheet(title=sheet.title,
+                                                             class_uris=changes.classes_to_build)] = sheet
+
+        keuzelijsten_sheet = workbook['Keuzelijsten']
+        choice_list_dict = {cell.value: cell.column_letter for cell in keuzelijsten_sheet[1] if cell.value is not None}
+        for name, column_letter in choice_list_dict.items():
+            # templates of older versions have no named ranges for their choice lists
+            if TemplateColumnFormatter.get_choice_list_range_name(name) not in workbook.defined_names:
+                last_row = max(cell.row for cell in keuzelijsten_sheet[column_letter] if cell.value is not None)
+                TemplateColumnFormatter.define_choice_list_range(workbook=workbook, choice_list_name=name,
+                                                                 column_letter=column_letter,
+                                                                 option_count=last_row - 2)
+        for sheet in new_sheets:
+            cls.alter_excel_sheet(add_attribute_info=add_attribute_info, choice_list_dict=choice_list_dict,
+                                  generate_choice_list=generate_choice_list, dummy_data_rows=dummy_data_rows,
+                                  template_plan=template_plan, sheet=sheet, add_deprecated=add_deprecated,
+                                  workbook=workbook, abbreviate_excel_sheettitle=abbreviate_excel_sheettitles,
+                                  max_row=max_row)
+
+        ordered_sheets = [sheet_per_class[uri] for uri in class_uris if uri in sheet_per_class]
+        ordered_sheets += [sheet for sheet in workbook if sheet not in ordered_sheets]
+        for index, sheet in enumerate(ordered_sheets):
+            workbook.move_sheet(sheet, offset=index - workbook.index(sheet))
+        workbook.active = 0
+        workbook.save(file_path)
+        workbook.close()
+
+    @classmethod
+    def _find_class_uri_of_sheet(cls, title: str, class_uris: [str]) -> Optional[str]:
+        try:
+            class_uri = cls.get_uri_from_sheet_name(title)
+        except ValueError:
+            return None
+        if class_uri in class_uris:
+            return class_uri
+        # the title of the sheet can be truncated to 31 characters
+        return next((uri for uri in class_uris if uri.startswith(class_uri)), None)
+
+    @classmethod
+    def write_csv_template_per_class(cls, class_batches: Iterator[list[OTLObject]], file_path: Path,
+                                     add_attribute_info: bool, add_deprecated: bool, dummy_data_rows: int,
+                                     template_plan: TemplatePlan = None, model_directory: Path = None,
+                                     **kwargs) -> tuple[Path]:
+        """
+        Writes the CSV file of every class batch (see iter_objects_for_template) as soon as it is generated.
+
+        :return: the paths of the created files
+        """
+        created_file_paths = []
+        for class_batch in class_batches:
+            prototypes = {}
+            tables = CsvTemplateWriter.get_tables(
+                sequence_of_objects=TemplatePlan.iter_recording_prototypes(class_batch, prototypes),
+                split_per_type=True, **kwargs)
+            del class_batch
+            batch_plan = CsvTemplateWriter.compile_template_plan(tables=tables, prototypes=prototypes)
+            if template_plan is not None:
+                template_plan.classes.update(batch_plan.classes)
+            created_file_paths.extend(CsvTemplateWriter.write_files(
+                tables=tables, file_path=file_path, template_plan=batch_plan, add_attribute_info=add_attribute_info,
+                add_deprecated=add_deprecated, dummy_data_rows=dummy_data_rows, delimiter=kwargs.get('delimiter')))
+        return tuple(created_file_paths)
 
     @classmethod
     def create_x_objects(cls, oslo_class, add_geometry, collector, filter_attributes_by_subset, model_directory,
-                         amount_objects_to_create):
-        if oslo_class.objectUri in cls.relation_dict:
+                         amount_objects_to_create, attribute_index: dict = None,
+                         asset_id_allocator: AssetIdAllocator = None, clone_prototype: bool = False,
+                         randomize_clones: bool = False, seed: Optional[int] = None, chunk: int = 0,
+                         context: GenerationContext = None):
+        if context is None:
+            context = GenerationContext.create(model_directory=model_directory)
+        if context.is_relation(oslo_class.objectUri):
             return []
 
+        dummy_data_generator = cls._create_dummy_data_generator(
+            class_uri=oslo_class.objectUri, amount_objects_to_create=amount_objects_to_create,
+            clone_prototype=clone_prototype, randomize_clones=randomize_clones, seed=seed, chunk=chunk)
         otl_objects = []
+        prototype = None
         for _ in range(amount_objects_to_create):
+            if prototype is not None:
+                otl_objects.append(cls.create_object_from_prototype(
+                    prototype=prototype, asset_id_allocator=asset_id_allocator, randomize_values=randomize_clones,
+                    dummy_data_generator=dummy_data_generator))
+                continue
             otl_object = cls.generate_object_from_oslo_class(
                 oslo_class=oslo_class, add_geometry=add_geometry, collector=collector,
-                filter_attributes_by_subset=filter_attributes_by_subset, model_directory=model_directory)
+                filter_attributes_by_subset=filter_attributes_by_subset, model_directory=model_directory,
+                attribute_index=attribute_index, asset_id_allocator=asset_id_allocator,
+                dummy_data_generator=dummy_data_generator)
             if otl_object is not None:
                 otl_objects.append(otl_object)
+                if clone_prototype:
+                    prototype = otl_object
+        return otl_objects
+
+    @classmethod
+    def create_object_from_prototype(cls, prototype: OTLObject, asset_id_allocator: AssetIdAllocator = None,
+                                     randomize_values: bool = False,
+                                     dummy_data_generator: DummyDataGenerator = None) -> OTLObject:
+        """
+        Creates a new dummy object as a clone of a generated prototype, with its own identificator and, with
+        randomize_values, its own simple dummy values.
+        """
+        if dummy_data_generator is None:
+            dummy_data_generator = DummyDataGenerator()
+        otl_object = PrototypeCloner.clone(prototype)
+        if randomize_values:
+            attributes = [attr for attr in otl_object
+                          if attr.waarde is not None and not attr.readonly and attr.field.waardeObject is None
+                          and attr.naam not in {'geometry', 'isActief'}]
+            # naampad is derived from naam, so it is cleared first and filled last
+            attributes.sort(key=lambda attr: attr.naam == 'naampad')
+            for attr in attributes:
+                if attr.naam == 'naampad':
+                    attr.waarde = None
+            for attr in attributes:
+                dummy_data_generator.fill_attribute(attr)
+
+        if asset_id_allocator is not None:
+            asset_id_allocator.assign(otl_object)
+        else:
+            id_attribute_name = 'agentId' if otl_object.typeURI == 'http://purl.org/dc/terms/Agent' else 'assetId'
+            with contextlib.suppress(AttributeError):
+                id_attribute = get_attribute_by_name(otl_object, id_attribute_name)
+                dummy_data_generator.fill_attribute(get_attribute_by_name(id_attribute.waarde, 'identificator'))
+        return otl_object
+
+    @classmethod
+    def _create_dummy_data_generator(cls, class_uri: str, amount_objects_to_create: int, clone_prototype: bool,
+                                     randomize_clones: bool, seed: Optional[int], chunk: int = 0
+                                     ) -> DummyDataGenerator:
+        # a column of values per attribute for all the objects that are generated, only one for a prototype
+        batch_size = 1 if clone_prototype and not randomize_clones else amount_objects_to_create
+        return DummyDataGenerator.for_class(seed=seed, class_uri=class_uri, batch_size=batch_size, chunk=chunk)
+
+    @classmethod
+    def create_x_object_dicts(cls, oslo_class: OSLOClass, add_geometry: bool, filter_attributes_by_subset: bool,
+                              model_directory: Path, amount_objects_to_create: int, attribute_names: [str],
+                              clone_prototype: bool = False, randomize_clones: bool = False,
+                              seed: Optional[int] = None, chunk: int = 0) -> list[dict]:
+        """
+        Variant of create_x_objects that runs in a worker process. The objects are returned as dictionaries
+        (OTLObject.to_dict()), as those pickle compactly, unlike the objects themselves.
+        """
+        otl_objects = cls.create_x_objects(
+            oslo_class=oslo_class, add_geometry=add_geometry, collector=None,
+            filter_attributes_by_subset=filter_attributes_by_subset, model_directory=model_directory,
+            amount_objects_to_create=amount_objects_to_create,
+            attribute_index={oslo_class.objectUri: attribute_names}, clone_prototype=clone_prototype,
+            randomize_clones=randomize_clones, seed=seed, chunk=chunk)
+        return [otl_object.to_dict() for otl_object in otl_objects]
+
+    @classmethod
+    def _initialize_generation_process(cls, class_uris: [str], model_directory: Path = None) -> None:
+        # imports the model classes once per worker process instead of once per submitted class
+        for class_uri in class_uris:
+            with contextlib.suppress(Exception):
+                cls.type_registry.get_type(class_uri=class_uri, model_directory=model_directory)
+
+    @classmethod
+    def _create_objects_with_threads(cls, context: GenerationContext, oslo_classes: [OSLOClass], add_geometry: bool,
+                                     collector: OSLOCollector, filter_attributes_by_subset: bool,
+                                     amount_objects_to_create: int, clone_prototype: bool = False,
+                                     randomize_clones: bool = False) -> [OTLObject]:
+        results = {}
+        with ThreadPoolExecutor() as executor:
+            futures = {
+                executor.submit(
+                    cls.create_x_objects, oslo_class=oslo_class, add_geometry=add_geometry, collector=collector,
+                    filter_attributes_by_subset=filter_attributes_by_subset, model_directory=context.model_directory,
+                    amount_objects_to_create=amount_objects_to_create, attribute_index=context.attribute_index,
+                    clone_prototype=clone_prototype, randomize_clones=randomize_clones, seed=context.seed,
+                    context=context): index
+                for index, oslo_class in enumerate(oslo_classes)
+            }
+            while futures:
+                done, not_done = concurrent.futures.wait(futures, return_when=ALL_COMPLETED, timeout=60)
+                for future in as_completed(done):
+                    results[futures[future]] = future.result()
+                futures = {future: futures[future] for future in not_done}
+                if not_done:
+                    logging.debug(f'Generating objects: {len(done)} classes done, waiting for {len(not_done)} more')
+
+        # the identificators are assigned in the order of the classes, so they do not depend on the thread timing
+        otl_objects = []
+        for index in sorted(results):
+            for otl_object in results[index]:
+                context.asset_id_allocator.assign(otl_object)
+                otl_objects.append(otl_object)
+        return otl_objects
+
+    @classmethod
+    def _create_objects_with_executor(cls, context: GenerationContext, executor: Executor,
+                                      oslo_classes: [OSLOClass], add_geometry: bool, filter_attributes_by_subset: bool,
+                                      amount_objects_to_create: int, clone_prototype: bool = False,
+                                      randomize_clones: bool = False) -> [OTLObject]:
+        model_directory = context.model_directory
+        futures = []
+        for oslo_class in oslo_classes:
+            if context.is_relation(oslo_class.objectUri):
+                continue
+            attribute_names = context.attribute_index.get(oslo_class.objectUri, [])
+            # large amounts are split in chunks so a single class is spread over multiple workers
+            for chunk_start in range(0, amount_objects_to_create, PROCESS_CHUNK_SIZE):
+                chunk_size = min(PROCESS_CHUNK_SIZE, amount_objects_to_create - chunk_start)
+                futures.append(executor.submit(
+                    cls.create_x_object_dicts, oslo_class, add_geometry, filter_attributes_by_subset,
+                    model_directory, chunk_size, attribute_names, clone_prototype, randomize_clones, context.seed,
+                    chunk_start // PROCESS_CHUNK_SIZE))
+
+        # the identificators are assigned here, as the allocator is not shared with the worker processes
+        otl_objects = []
+        for future in futures:
+            for object_dict in future.result():
+                otl_object = cls.type_registry.create_instance_from_dict(object_dict, model_directory=model_directory)
+                context.asset_id_allocator.assign(otl_object)
+                otl_objects.append(otl_object)
         return otl_objects
 
     @classmethod
     def generate_objects_for_template(
             cls, subset_path: Path, class_uris_filter: [str], filter_attributes_by_subset: bool,
-            dummy_data_rows: int, add_geometry: bool, ignore_relations: bool, model_directory: Path = None
-    ) -> [OTLObject]:
+            dummy_data_rows: int, add_geometry: bool, ignore_relations: bool, model_directory: Path = None,
+            lazy_loading: bool = False, executor: Union[str, Executor] = 'thread', clone_prototype: bool = False,
+            randomize_clones: bool = False, seed: Optional[int] = None) -> [OTLObject]:
         """
         This method is used to generate objects for the template. It will generate objects based on the subset file
+        See generate_template_from_subset for executor, clone_prototype, randomize_clones and seed.
         """
-        collector = cls._load_collector_from_subset_path(subset_path=subset_path)
-        filtered_class_list = cls.filters_classes_by_subset(collector=collector, class_uris_filter=class_uris_filter)
-        if filtered_class_list == []:
-            raise ValueError('Something went wrong, as the class_uri filter list is empty')
-        cls.relation_dict = get_hardcoded_relation_dict(model_directory=model_directory)
+        collector, filtered_class_list, context = cls._prepare_generation(
+            subset_path=subset_path, class_uris_filter=class_uris_filter, ignore_relations=ignore_relations,
+            model_directory=model_directory, lazy_loading=lazy_loading, executor=executor, seed=seed)
+        concrete_classes = [cl for cl in filtered_class_list if cl.abstract == 0]
 
         amount_objects_to_create = max(1, dummy_data_rows)
-        otl_objects = []
 
-        while True:
-            with ThreadPoolExecutor() as executor:
-                futures = [
-                    executor.submit(cls.create_x_objects, oslo_class, add_geometry, collector,
-                                    filter_attributes_by_subset, model_directory, amount_objects_to_create)
-                    for oslo_class in [cl for cl in filtered_class_list if cl.abstract == 0]
-                ]
-                while futures:
-                    done, not_done = concurrent.futures.wait(futures, return_when=ALL_COMPLETED, timeout=60)
-                    for future in as_completed(done):
-                        otl_objects.extend(future.result())
-                    futures = not_done
-                    print(f'when using multiprocessing: {len(done)} done, {len(not_done)} not done')
-                    if len(not_done) > 0:
-                        print('restarting the loop with the not done ones')
-
-            created = len(otl_objects)
-            unique_ids = len({obj.assetId.identificator if obj.typeURI != 'http://purl.org/dc/terms/Agent' else obj.agentId.identificator
-                              for obj in otl_objects})
-            if created == unique_ids:
-                break
-            otl_objects = []
+        process_pool = None
+        if executor == 'process':
+            process_pool = ProcessPoolExecutor(
+                initializer=cls._initialize_generation_process,
+                initargs=([cl.objectUri for cl in concrete_classes], model_directory))
+            executor = process_pool
+
+        try:
+            if executor == 'thread':
+                otl_objects = cls._create_objects_with_threads(
+                    context=context, oslo_classes=concrete_classes, add_geometry=add_geometry, collector=collector,
+                    filter_attributes_by_subset=filter_attributes_by_subset,
+                    amount_objects_to_create=amount_objects_to_create, clone_prototype=clone_prototype,
+                    randomize_clones=randomize_clones)
+            else:
+                otl_objects = cls._create_objects_with_executor(
+                    context=context, executor=executor, oslo_classes=concrete_classes, add_geometry=add_geometry,
+                    filter_attributes_by_subset=filter_attributes_by_subset,
+                    amount_objects_to_create=amount_objects_to_create, clone_prototype=clone_prototype,
+                    randomize_clones=randomize_clones)
+        finally:
+            if process_pool is not None:
+                process_pool.shutdown()
 
         if not ignore_relations:
             non_relations_class_uris = [cl.objectUri for cl in filtered_class_list
-                                        if cl.abstract == 0 and cl.objectUri not in cls.relation_dict]
+                                        if cl.abstract == 0 and not context.is_relation(cl.objectUri)]
             cls.append_relations_to_objects(otl_objects=otl_objects, collector=collector,
                                             class_uris_filter=non_relations_class_uris, model_directory=model_directory)
 
         return otl_objects
 
+    @classmethod
+    def _prepare_generation(cls, subset_path: Path, class_uris_filter: [str], ignore_relations: bool,
+                            model_directory: Path, lazy_loading: bool, executor: Union[str, Executor],
+                            seed: Optional[int]) -> tuple[OSLOCollector, list[OSLOClass], GenerationContext]:
+        if not isinstance(executor, Executor) and executor not in ('thread', 'process'):
+            raise ValueError(f"executor must be 'thread', 'process' or an Executor instance, not {executor!r}")
+
+        collector = cls._load_collector_for_template(
+            subset_path=subset_path, class_uris_filter=class_uris_filter, ignore_relations=ignore_relations,
+            lazy_loading=lazy_loading)
+        filtered_class_list = cls.filters_classes_by_subset(collector=collector, class_uris_filter=class_uris_filter)
+        if filtered_class_list == []:
+            raise ValueError('Something went wrong, as the class_uri filter list is empty')
+        # the state of this run, the allocator is shared by all classes so the identificators are unique
+        context = GenerationContext.create(model_directory=model_directory,
+                                           attribute_index=cls.build_attribute_index(collector=collector), seed=seed)
+        return collector, filtered_class_list, context
+
+    @classmethod
+    def iter_objects_for_template(
+            cls, subset_path: Path, class_uris_filter: [str], filter_attributes_by_subset: bool,
+            dummy_data_rows: int, add_geometry: bool, ignore_relations: bool, model_directory: Path = None,
+            lazy_loading: bool = False, executor: Union[str, Executor] = 'thread', clone_prototype: bool = False,
+            randomize_clones: bool = False, seed: Optional[int] = None) -> Iterator[list[OTLObject]]:
+        """
+        Streaming variant of generate_objects_for_template: yields the objects as a list per class, followed by the
+        relations as a list per relation type. The next class is only generated when the previous one is consumed.
+        """
+        collector, filtered_class_list, context = cls._prepare_generation(
+            subset_path=subset_path, class_uris_filter=class_uris_filter, ignore_relations=ignore_relations,
+            model_directory=model_directory, lazy_loading=lazy_loading, executor=executor, seed=seed)
+        concrete_classes = [cl for cl in filtered_class_list
+                            if cl.abstract == 0 and not context.is_relation(cl.objectUri)]
+        amount_objects_to_create = max(1, dummy_data_rows)
+
+        relation_index = {}
+        endpoint_class_uris = set()
+        if not ignore_relations:
+            relation_index = cls.build_relation_index(
+                collector=collector, class_uris=[cl.objectUri for cl in concrete_classes],
+                model_directory=model_directory)
+            for bron_uri, relations in relation_index.items():
+                endpoint_class_uris.add(bron_uri)
+                endpoint_class_uris.update(doel_uri for _, doel_uri, _, _ in relations)
+
+        process_pool = None
+        if executor == 'process':
+            process_pool = ProcessPoolExecutor(
+                initializer=cls._initialize_generation_process,
+                initargs=([cl.objectUri for cl in concrete_classes], model_directory))
+            executor = process_pool
+
+        identificators = {}
+        try:
+            for oslo_class in concrete_classes:
+                if executor == 'thread':
+                    otl_objects = cls.create_x_objects(
+                        oslo_class=oslo_class, add_geometry=add_geometry, collector=collector,
+                        filter_attributes_by_subset=filter_attributes_by_subset, model_directory=model_directory,
+                        amount_objects_to_create=amount_objects_to_create, attribute_index=context.attribute_index,
+                        clone_prototype=clone_prototype, randomize_clones=randomize_clones, seed=seed,
+                        context=context)
+                    for otl_object in otl_objects:
+                        context.asset_id_allocator.assign(otl_object)
+                else:
+                    otl_objects = cls._create_objects_with_executor(
+                        context=context, executor=executor, oslo_classes=[oslo_class], add_geometry=add_geometry,
+                        filter_attributes_by_subset=filter_attributes_by_subset,
+                        amount_objects_to_create=amount_objects_to_create, clone_prototype=clone_prototype,
+                        randomize_clones=randomize_clones)
+                if not otl_objects:
+                    continue
+                if oslo_class.objectUri in endpoint_class_uris:
+                    identificators[oslo_class.objectUri] = [cls._get_identificator(o) for o in otl_objects]
+                yield otl_objects
+                del otl_objects
+        finally:
+            if process_pool is not None:
+                process_pool.shutdown()
+
+        if not ignore_relations:
+            yield from cls._iter_relations_per_type(
+                identificators=identificators, class_uris=[cl.objectUri for cl in concrete_classes],
+                relation_index=relation_index, model_directory=model_directory)
+
+    @classmethod
+    def _get_identificator(cls, otl_object: OTLObject) -> tuple[str, str]:
+        id_attribute = otl_object.agentId if otl_object.typeURI == AGENT_URI else otl_object.assetId
+        return id_attribute.identificator, id_attribute.toegekendDoor
+
+    @classmethod
+    def _iter_relations_per_type(cls, identificators: dict[str, list[tuple[str, str]]], class_uris: [str],
+                                 relation_index: dict[str, list[tuple]], model_directory: Path = None
+                                 ) -> Iterator[list[OTLObject]]:
+        """
+        Creates the relations of append_relations_to_objects from the identificators of the objects per class and
+        yields them as a list per relation type.
+        """
+        endpoints = {}
+        relations_per_type = {}
+        for class_uri in class_uris:
+            for relation_type, doel_uri, richting, relation_uri in relation_index.get(class_uri, []):
+                if doel_uri not in identificators:
+                    continue
+                for i, bron_identificator in enumerate(identificators[class_uri]):
+                    relation_instance = cls._create_relation_instance(
+                        relation_type=relation_type, relation_uri=relation_uri, richting=richting,
+                        bron_instance=cls._get_relation_endpoint(
+                            endpoints=endpoints, type_uri=class_uri, identificator=bron_identificator,
+                            model_directory=model_directory),
+                        doel_instance=cls._get_relation_endpoint(
+                            endpoints=endpoints, type_uri=doel_uri, identificator=identificators[doel_uri][i],
+                            model_directory=model_directory))
+                    if relation_instance is not None:
+                        relations_per_type.setdefault(relation_instance.typeURI, []).append(relation_instance)
+        yield from relations_per_type.values()
+
+    @classmethod
+    def _get_relation_endpoint(cls, endpoints: dict[str, OTLObject], type_uri: str, identificator: tuple[str, str],
+                               model_directory: Path = None) -> OTLObject:
+        if type_uri not in endpoints:
+            endpoints[type_uri] = cls.type_registry.get_type(class_uri=type_uri, model_directory=model_directory)()
+        endpoint = endpoints[type_uri]
+        id_attribute = endpoint.agentId if type_uri == AGENT_URI else endpoint.assetId
+        id_attribute.identificator, id_attribute.toegekendDoor = identificator
+        return endpoint
+
     @classmethod
     async def create_x_objects_async(cls, oslo_class, add_geometry, collector, filter_attributes_by_subset,
                                   model_directory,
-                         amount_objects_to_create):
-        if oslo_class.objectUri in cls.relation_dict:
+                         amount_objects_to_create, attribute_index: dict = None,
+                         asset_id_allocator: AssetIdAllocator = None, clone_prototype: bool = False,
+                         randomize_clones: bool = False, seed: Optional[int] = None,
+                         context: GenerationContext = None):
+        if context is None:
+            context = GenerationContext.create(model_directory=model_directory)
+        if context.is_relation(oslo_class.objectUri):
             return []
 
+        dummy_data_generator = cls._create_dummy_data_generator(
+            class_uri=oslo_class.objectUri, amount_objects_to_create=amount_objects_to_create,
+            clone_prototype=clone_prototype, randomize_clones=randomize_clones, seed=seed)
         otl_objects = []
+        prototype = None
         for _ in range(amount_objects_to_create):
             await sleep(0)
+            if prototype is not None:
+                otl_objects.append(cls.create_object_from_prototype(
+                    prototype=prototype, asset_id_allocator=asset_id_allocator, randomize_values=randomize_clones,
+                    dummy_data_generator=dummy_data_generator))
+                continue
             otl_object = cls.generate_object_from_oslo_class(
                 oslo_class=oslo_class, add_geometry=add_geometry, collector=collector,
-                filter_attributes_by_subset=filter_attributes_by_subset, model_directory=model_directory)
+                filter_attributes_by_subset=filter_attributes_by_subset, model_directory=model_directory,
+                attribute_index=attribute_index, asset_id_allocator=asset_id_allocator,
+                dummy_data_generator=dummy_data_generator)
             if otl_object is not None:
                 otl_objects.append(otl_object)
+                if clone_prototype:
+                    prototype = otl_object
         return otl_objects
 
 
     @classmethod
     async def generate_objects_for_template_async(
             cls, subset_path: Path, class_uris_filter: [str], filter_attributes_by_subset: bool,
-            dummy_data_rows: int, add_geometry: bool, ignore_relations: bool, model_directory: Path = None
-    ) -> [OTLObject]:
+            dummy_data_rows: int, add_geometry: bool, ignore_relations: bool, model_directory: Path = None,
+            lazy_loading: bool = False, executor: Union[str, Executor] = 'thread', clone_prototype: bool = False,
+            randomize_clones: bool = False, seed: Optional[int] = None,
+            offload_executor: Optional[Executor] = None) -> [OTLObject]:
         """
         This method is used to generate objects for the template. It will generate objects based on the subset file
+        The objects are generated in offload_executor, defaults to the default executor of the event loop.
         """
-        await sleep(0)
-        collector = cls._load_collector_from_subset_path(subset_path=subset_path)
-        await sleep(0)
-        filtered_class_list = cls.filters_classes_by_subset(collector=collector, class_uris_filter=class_uris_filter)
-        if filtered_class_list == []:
-            raise ValueError('Something went wrong, as the class_uri filter list is empty')
-        await sleep(0)
-        cls.relation_dict = get_hardcoded_relation_dict(model_directory=model_directory)
-
-        amount_objects_to_create = max(1, dummy_data_rows)
-        otl_objects = []
-
-        while True:
-            tasks = [
-                cls.create_x_objects_async(oslo_class, add_geometry, collector,
-                                           filter_attributes_by_subset, model_directory, amount_objects_to_create)
-                for oslo_class in [cl for cl in filtered_class_list if cl.abstract == 0]
-            ]
-            results = await asyncio.gather(*tasks)
-            otl_objects.extend([item for sublist in results for item in sublist])
-
-            created = len(otl_objects)
-            unique_ids = len({
-                                 obj.assetId.identificator if obj.typeURI != 'http://purl.org/dc/terms/Agent' else obj.agentId.identificator
-                                 for obj in otl_objects})
-            if created == unique_ids:
-                break
-            otl_objects = []
-
-        if not ignore_relations:
-            non_relations_class_uris = [cl.objectUri for cl in filtered_class_list
-                                        if cl.abstract == 0 and cl.objectUri not in cls.relation_dict]
-            cls.append_relations_to_objects(otl_objects=otl_objects, collector=collector,
-                                            class_uris_filter=non_relations_class_uris, model_directory=model_directory)
+        return await cls._run_in_executor(
+            offload_executor, cls.generate_objects_for_template, subset_path=subset_path,
+            class_uris_filter=class_uris_filter, filter_attributes_by_subset=filter_attributes_by_subset,
+            dummy_data_rows=dummy_data_rows, add_geometry=add_geometry, ignore_relations=ignore_relations,
+            model_directory=model_directory, lazy_loading=lazy_loading, clone_prototype=clone_prototype,
+            randomize_clones=randomize_clones, seed=seed, executor=executor)
 
-        return otl_objects
+    @classmethod
+    async def _run_in_executor(cls, offload_executor: Optional[Executor], function, **kwargs):
+        """Runs a blocking function in offload_executor (None for the default executor of the running event loop)."""
+        return await asyncio.get_running_loop().run_in_executor(offload_executor,
+                                                                functools.partial(function, **kwargs))
 
     @classmethod
     def generate_object_from_oslo_class(
             cls, oslo_class: OSLOClass, add_geometry: bool,
-            filter_attributes_by_subset: bool, collector: OSLOCollector, model_directory: Path = None) -> [OTLObject]:
+            filter_attributes_by_subset: bool, collector: OSLOCollector, model_directory: Path = None,
+            attribute_index: dict = None, asset_id_allocator: AssetIdAllocator = None,
+            dummy_data_generator: DummyDataGenerator = None) -> [OTLObject]:
         """
-        Generate an object from a given OSLO class
+        Generate an object from a given OSLO class. attribute_index is the result of build_attribute_index().
         """
-        instance = dynamic_create_instance_from_uri(oslo_class.objectUri, model_directory=model_directory)
+        if dummy_data_generator is None:
+            dummy_data_generator = DummyDataGenerator()
+        instance = cls.type_registry.get_type(class_uri=oslo_class.objectUri, model_directory=model_directory)()
         if instance is None:
             return
 
         if filter_attributes_by_subset:
-            for attribute_object in collector.find_attributes_by_class(oslo_class):
-                attr = get_attribute_by_name(instance, attribute_object.name)
+            if attribute_index is None:
+                attribute_names = [a.name for a in collector.find_attributes_by_class(oslo_class)]
+            else:
+                attribute_names = attribute_index.get(oslo_class.objectUri, [])
+            for attribute_name in attribute_names:
+                attr = get_attribute_by_name(instance, attribute_name)
                 if attr is None:
-                    logging.warning(f'Attribute {attribute_object.name} not found in class {oslo_class.objectUri}')
+                    logging.warning(f'Attribute {attribute_name} not found in class {oslo_class.objectUri}')
                 elif attr.naam == 'isActief':
                     attr.set_waarde(True)
                 else:
-                    attr.fill_with_dummy_data()
+                    dummy_data_generator.fill_attribute(attr)
         else:
             for attr in instance:
                 if attr.naam == 'isActief':
                     attr.set_waarde(True)
                 elif attr.naam != 'geometry':
-                    attr.fill_with_dummy_data()
+                    dummy_data_generator.fill_attribute(attr)
 
         with contextlib.suppress(AttributeError):
             assetId_attr = get_attribute_by_name(instance, 'assetId')
             if assetId_attr is not None:
-                assetId_attr.fill_with_dummy_data()
+                dummy_data_generator.fill_attribute(assetId_attr)
             if add_geometry:
                 geo_attr = get_attribute_by_name(instance, 'geometry')
                 if geo_attr is not None:
-                    geo_attr.fill_with_dummy_data()
+                    dummy_data_generator.fill_attribute(geo_attr)
 
         asset_versie = get_attribute_by_name(instance, 'assetVersie')
         if asset_versie is not None:
             asset_versie.set_waarde(None)
 
+        if asset_id_allocator is not None:
+            asset_id_allocator.assign(instance)
+
         DotnotationHelper.clear_list_of_list_attributes(instance)
 
         return instance
 
+    @classmethod
+    def build_attribute_index(cls, collector: OSLOCollector) -> dict[str, list[str]]:
+        """
+        Builds a dictionary from class URI to the names of the attributes of that class in the subset, ordered by
+        attribute URI like OSLOCollector.find_attributes_by_class(). The attributes are grouped in a single pass.
+        """
+        attributes_per_class = defaultdict(list)
+        for attribute in collector.attributes:
+            attributes_per_class[attribute.class_uri].append(attribute)
+        return {class_uri: [a.name for a in sorted(attributes, key=lambda a: a.objectUri)]
+                for class_uri, attributes in attributes_per_class.items()}
+
+    @classmethod
+    def generate_columnar_template_from_subset(
+            cls, subset_path: Path, template_file_path: Path, dummy_data_rows: int,
+            filter_attributes_by_subset: bool = True, class_uris_filter: [str] = None, add_geometry: bool = True,
+            add_attribute_info: bool = False, add_deprecated: bool = False, split_per_type: bool = True,
+            model_directory: Path = None, lazy_loading: bool = False, seed: Optional[int] = None,
+            chunk_size: int = COLUMNAR_CHUNK_SIZE, abbreviate_excel_sheettitles: bool = False) -> tuple[Path]:
+        """
+        Generate a template with a large amount of dummy data rows (.csv or .xlsx), without creating an object per
+        row. The files contain the headers and the data only, without relations, choice lists or styling.
+
+        :param subset_path: Path to the subset file
+        :param template_file_path: Path to where the template file should be created
+        :param dummy_data_rows: Amount of dummy data rows to add to the template
+        :param filter_attributes_by_subset: Whether to filter by the attributes in the subset, defaults to True
+        :param class_uris_filter: List of class URIs to filter by. If not None, only classes with these URIs will be included, defaults to None
+        :param add_geometry: Whether to include the geometry attribute in the template, defaults to True
+        :param add_attribute_info: Whether to add a row with attribute information to the template, defaults to False
+        :param add_deprecated: Whether to add a deprecated row to the template, defaults to False
+        :param split_per_type: Whether to split the template into a file per type (only for CSV), defaults to True
+        :param model_directory: Path to the model directory, defaults to None
+        :param lazy_loading: Whether to only load the classes in class_uris_filter (and their attributes and relations) from the subset instead of the whole subset, defaults to False
+        :param seed: Seed for the dummy data, the same seed generates the same dummy data, defaults to None (random dummy data)
+        :param chunk_size: Amount of rows that are generated and written at once, defaults to COLUMNAR_CHUNK_SIZE
+        :param abbreviate_excel_sheettitles: Whether to abbreviate the sheet titles (only for Excel), defaults to False
+
+        :return: the paths of the created files
+        """
+        extension = template_file_path.suffix.lower()
+        if extension not in ('.csv', '.xlsx'):
+            raise ValueError(f'Columnar templates can only be written to .csv or .xlsx files, not {extension}')
+
+        prototypes = cls.generate_objects_for_template(
+            subset_path=subset_path, class_uris_filter=class_uris_filter,
+            filter_attributes_by_subset=filter_attributes_by_subset, dummy_data_rows=1, add_geometry=add_geometry,
+            ignore_relations=True, model_directory=model_directory, lazy_loading=lazy_loading, seed=seed)
+        row_sources = [ColumnarRowSource.from_prototype(prototype) for prototype in prototypes]
+
+        if extension == '.xlsx':
+            return (ColumnarTemplateWriter.write_xlsx(
+                row_sources=row_sources, file_path=template_file_path, row_count=dummy_data_rows,
+                chunk_size=chunk_size, seed=seed, add_attribute_info=add_attribute_info,
+                add_deprecated=add_deprecated, abbreviate_excel_sheettitles=abbreviate_excel_sheettitles),)
+
+        if not split_per_type:
+            return (ColumnarTemplateWriter.write_csv(
+                row_sources=row_sources, file_path=template_file_path, row_count=dummy_data_rows,
+                chunk_size=chunk_size, seed=seed, add_attribute_info=add_attribute_info,
+                add_deprecated=add_deprecated),)
+
+        # shared by the files, so the identificators are unique over the whole template
+        asset_id_allocator = AssetIdAllocator()
+        return tuple(
+            ColumnarTemplateWriter.write_csv(
+                row_sources=[row_source], row_count=dummy_data_rows, chunk_size=chunk_size, seed=seed,
+                file_path=cls.get_csv_file_path_for_type(file_path=template_file_path, type_uri=row_source.type_uri),
+                add_attribute_info=add_attribute_info, add_deprecated=add_deprecated,
+                asset_id_allocator=asset_id_allocator)
+            for row_source in row_sources)
+
+    @classmethod
+    def compile_template_plan(cls, subset_path: Path, ignore_relations: bool = True,
+                              filter_attributes_by_subset: bool = True, class_uris_filter: [str] = None,
+                              dummy_data_rows: int = 1, add_geometry: bool = True, model_directory: Path = None,
+                              plan_file_path: Path = None) -> TemplatePlan:
+        """
+        Compiles the template plan of a subset, see TemplatePlan.
+
+        :param subset_path: Path to the subset file
+        :param ignore_relations: Whether to ignore relations, defaults to True
+        :param filter_attributes_by_subset: Whether to filter by the attributes in the subset, defaults to True
+        :param class_uris_filter: List of class URIs to filter by, defaults to None
+        :param dummy_data_rows: Amount of dummy data rows the plan accounts for, defaults to 1
+        :param add_geometry: Whether to include the geometry attribute, defaults to True
+        :param model_directory: Path to the model directory, defaults to None
+        :param plan_file_path: Path to save the plan to as JSON, defaults to None (not saved)
+
+        :return: TemplatePlan
+        """
+        objects = cls.generate_objects_for_template(
+            subset_path=subset_path, ignore_relations=ignore_relations, class_uris_filter=class_uris_filter,
+            add_geometry=add_geometry, filter_attributes_by_subset=filter_attributes_by_subset,
+            dummy_data_rows=dummy_data_rows, model_directory=model_directory)
+        template_plan = TemplatePlan.compile(objects)
+        if plan_file_path is not None:
+            template_plan.save(plan_file_path)
+        return template_plan
+
     @classmethod
     def alter_excel_template(cls, instances: list, file_path: Path, add_attribute_info: bool,
                              generate_choice_list: bool, dummy_data_rows: int, add_deprecated: bool,
-                             abbreviate_excel_sheettitles: bool):
+                             abbreviate_excel_sheettitles: bool, template_plan: TemplatePlan = None,
+                             max_row: int = DEFAULT_MAX_ROW):
+        if template_plan is None:
+            template_plan = TemplatePlan.compile(instances)
         wb = load_workbook(file_path)
-        wb.create_sheet('Keuzelijsten')
+        cls.alter_excel_workbook(workbook=wb, add_attribute_info=add_attribute_info,
+                                 generate_choice_list=generate_choice_list, dummy_data_rows=dummy_data_rows,
+                                 add_deprecated=add_deprecated, abbreviate_excel_sheettitles=abbreviate_excel_sheettitles,
+                                 template_plan=template_plan, max_row=max_row)
+        wb.save(file_path)
+        wb.close()
+
+    @classmethod
+    def alter_excel_workbook(cls, workbook: Workbook, add_attribute_info: bool, generate_choice_list: bool,
+                             dummy_data_rows: int, add_deprecated: bool, abbreviate_excel_sheettitles: bool,
+                             template_plan: TemplatePlan, max_row: int = DEFAULT_MAX_ROW):
+        """
+        Alters the sheets of a workbook with a sheet per type into a template and adds the Keuzelijsten sheet. The
+        validations and the formatting of the columns reach up to max_row.
+        """
+        workbook.create_sheet('Keuzelijsten')
 
         choice_list_dict = {}
-        for sheet in wb:
+        for sheet in workbook:
             if sheet.title == 'Keuzelijsten':
                 break
 
             cls.alter_excel_sheet(add_attribute_info=add_attribute_info, choice_list_dict=choice_list_dict,
                                   generate_choice_list=generate_choice_list, dummy_data_rows=dummy_data_rows,
-                                  instances=instances, sheet=sheet, add_deprecated=add_deprecated, workbook=wb,
-                                  abbreviate_excel_sheettitle=abbreviate_excel_sheettitles)
+                                  template_plan=template_plan, sheet=sheet, add_deprecated=add_deprecated,
+                                  workbook=workbook, abbreviate_excel_sheettitle=abbreviate_excel_sheettitles,
+                                  max_row=max_row)
 
-        wb.save(file_path)
-        wb.close()
+    @classmethod
+    def write_excel_template(cls, objects: Iterable[OTLObject], file_path: Path, add_attribute_info: bool,
+                             generate_choice_list: bool, dummy_data_rows: int, add_deprecated: bool,
+                             abbreviate_excel_sheettitles: bool, template_plan: TemplatePlan = None,
+                             max_row: int = DEFAULT_MAX_ROW, **kwargs) -> tuple[Path]:
+        """
+        Writes the Excel template of the objects in a single pass, with the same result as exporting the objects with
+        OtlmowConverter and altering the file with alter_excel_template().
+
+        :return: the path of the created file
+        """
+        prototypes = {}
+        table_dict = ExcelTemplateWriter.get_tables_per_type(
+            sequence_of_objects=TemplatePlan.iter_recording_prototypes(objects, prototypes), **kwargs)
+        if template_plan is None:
+            template_plan = ExcelTemplateWriter.compile_template_plan(table_dict=table_dict, prototypes=prototypes)
+        workbook = ExcelTemplateWriter.create_workbook_from_tables(table_dict=table_dict, **kwargs)
+        cls.alter_excel_workbook(workbook=workbook, add_attribute_info=add_attribute_info,
+                                 generate_choice_list=generate_choice_list, dummy_data_rows=dummy_data_rows,
+                                 add_deprecated=add_deprecated, abbreviate_excel_sheettitles=abbreviate_excel_sheettitles,
+                                 template_plan=template_plan, max_row=max_row)
+        workbook.save(file_path)
+        workbook.close()
+        return (file_path,)
+
+    @classmethod
+    def write_csv_template(cls, objects: Iterable[OTLObject], file_path: Path, split_per_type: bool,
+                           add_attribute_info: bool, add_deprecated: bool, dummy_data_rows: int,
+                           template_plan: TemplatePlan = None, **kwargs) -> tuple[Path]:
+        """
+        Writes the CSV template of the objects in a single pass, see CsvTemplateWriter.
+
+        :return: the paths of the created files
+        """
+        prototypes = {}
+        tables = CsvTemplateWriter.get_tables(
+            sequence_of_objects=TemplatePlan.iter_recording_prototypes(objects, prototypes),
+            split_per_type=split_per_type, **kwargs)
+        if template_plan is None:
+            template_plan = CsvTemplateWriter.compile_template_plan(tables=tables, prototypes=prototypes)
+        return tuple(CsvTemplateWriter.write_files(
+            tables=tables, file_path=file_path, template_plan=template_plan, add_attribute_info=add_attribute_info,
+            add_deprecated=add_deprecated, dummy_data_rows=dummy_data_rows, delimiter=kwargs.get('delimiter')))
 
     @classmethod
     def fill_class_dict(cls, instances: list) -> dict:
@@ -378,48 +1279,43 @@ class SubsetTemplateCreator:
 
     @classmethod
     def alter_csv_template(cls, instances: list, file_path: Path, add_attribute_info: bool,
-                             split_per_type: bool, dummy_data_rows: int, add_deprecated: bool):
-        classes_dict = cls.fill_class_dict(instances)
+                             split_per_type: bool, dummy_data_rows: int, add_deprecated: bool,
+                           template_plan: TemplatePlan = None):
+        if template_plan is None:
+            template_plan = TemplatePlan.compile(instances)
         if split_per_type:
-            for type_uri, typed_instances in classes_dict.items():
-                ns, name = get_ns_and_name_from_uri(type_uri)
-                ns_name = f'{ns}_{name}'
-                if name == 'Agent':
-                    ns_name = 'Agent'
-                class_file_path = file_path.parent / f'{file_path.stem}_{ns_name}.csv'
+            for type_uri, class_plan in template_plan.classes.items():
                 cls.alter_csv_file(add_attribute_info=add_attribute_info, add_deprecated=add_deprecated,
-                                   dummy_data_rows=dummy_data_rows, instances=typed_instances, file_path=class_file_path)
+                                   dummy_data_rows=dummy_data_rows, class_plan=class_plan,
+                                   file_path=cls.get_csv_file_path_for_type(file_path=file_path, type_uri=type_uri))
         else:
             cls.alter_csv_file(add_attribute_info=add_attribute_info, add_deprecated=add_deprecated,
-                               dummy_data_rows=dummy_data_rows, instances=instances, file_path=file_path)
-    
+                               dummy_data_rows=dummy_data_rows, class_plan=next(iter(template_plan.classes.values())),
+                               file_path=file_path)
+
     @classmethod
     async def alter_csv_template_async(cls, instances: list, file_path: Path, add_deprecated: bool,
-                                       add_attribute_info: bool, split_per_type: bool, dummy_data_rows: int):
-        classes_dict = cls.fill_class_dict(instances)
-        if split_per_type:
-            for type_uri, typed_instances in classes_dict.items():
-                await sleep(0)
-                ns, name = get_ns_and_name_from_uri(type_uri)
-                ns_name = f'{ns}_{name}'
-                if name == 'Agent':
-                    ns_name = 'Agent'
-                class_file_path = file_path.parent / f'{file_path.stem}_{ns_name}.csv'
-                cls.alter_csv_file(add_attribute_info=add_attribute_info,
-                                   dummy_data_rows=dummy_data_rows, instances=typed_instances, add_deprecated=add_deprecated,
-                                   file_path=class_file_path)
-        else:
-            await sleep(0)
-            cls.alter_csv_file(add_attribute_info=add_attribute_info,
-                               dummy_data_rows=dummy_data_rows, instances=instances, add_deprecated=add_deprecated,
-                               file_path=file_path)
+                                       add_attribute_info: bool, split_per_type: bool, dummy_data_rows: int,
+                                       template_plan: TemplatePlan = None,
+                                       offload_executor: Optional[Executor] = None):
+        await cls._run_in_executor(
+            offload_executor, cls.alter_csv_template, instances=instances, file_path=file_path,
+            add_deprecated=add_deprecated, add_attribute_info=add_attribute_info, split_per_type=split_per_type,
+            dummy_data_rows=dummy_data_rows, template_plan=template_plan)
 
     @classmethod
-    def alter_csv_file(cls, add_attribute_info: bool, instances: [OTLObject], add_deprecated: bool, file_path: Path,
+    def get_csv_file_path_for_type(cls, file_path: Path, type_uri: str) -> Path:
+        ns, name = get_ns_and_name_from_uri(type_uri)
+        ns_name = f'{ns}_{name}'
+        if name == 'Agent':
+            ns_name = 'Agent'
+        return file_path.parent / f'{file_path.stem}_{ns_name}.csv'
+
+    @classmethod
+    def alter_csv_file(cls, add_attribute_info: bool, class_plan: ClassPlan, add_deprecated: bool, file_path: Path,
                        dummy_data_rows: int):
         collected_attribute_info_row = []
         deprecated_attributes_row = []
-        instance = instances[0]
         quote_char = '"'
 
         with open(file_path, encoding='utf-8') as file:
@@ -433,15 +1329,13 @@ class SubsetTemplateCreator:
 
             if header == 'typeURI':
                 if add_attribute_info:
-                    collected_attribute_info_row.append(
-                        'De URI van het object volgens https://www.w3.org/2001/XMLSchema#anyURI .')
+                    collected_attribute_info_row.append(TYPE_URI_DEFINITION)
                 if add_deprecated:
                     deprecated_attributes_row.append('')
                 continue
 
-            try:
-                attribute = DotnotationHelper.get_attribute_by_dotnotation(instance, header)
-            except AttributeError:
+            column = class_plan.get_column(header)
+            if column is None or not column.resolved:
                 if add_attribute_info:
                     collected_attribute_info_row.append('')
                 if add_deprecated:
@@ -449,10 +1343,10 @@ class SubsetTemplateCreator:
                 continue
 
             if add_attribute_info:
-                collected_attribute_info_row.append(attribute.definition)
+                collected_attribute_info_row.append(column.definition)
 
             if add_deprecated:
-                deprecated_attributes_row.append('DEPRECATED' if attribute.deprecated_version else '')
+                deprecated_attributes_row.append('DEPRECATED' if column.deprecated else '')
 
         with open(file_path, 'w', newline='', encoding='utf-8') as file:
             csv_writer = csv.writer(file, delimiter=';', quotechar=quote_char, quoting=csv.QUOTE_MINIMAL)
@@ -468,119 +1362,69 @@ class SubsetTemplateCreator:
     @classmethod
     async def alter_excel_template_async(cls, instances: list, file_path: Path, add_attribute_info: bool,
                                          generate_choice_list: bool, dummy_data_rows: int, add_deprecated: bool,
-                                         abbreviate_excel_sheettitles: bool):
-        wb = load_workbook(file_path)
-        wb.create_sheet('Keuzelijsten')
-
-        choice_list_dict = {}
-        for sheet in wb:
-            if sheet.title == 'Keuzelijsten':
-                break
-
-            cls.alter_excel_sheet(add_attribute_info=add_attribute_info, choice_list_dict=choice_list_dict,
-                                  generate_choice_list=generate_choice_list, dummy_data_rows=dummy_data_rows,
-                                  instances=instances, sheet=sheet, add_deprecated=add_deprecated, workbook=wb,
-                                  abbreviate_excel_sheettitle=abbreviate_excel_sheettitles)
-            await sleep(0)
-
-        wb.save(file_path)
-        wb.close()
+                                         abbreviate_excel_sheettitles: bool, template_plan: TemplatePlan = None,
+                                         offload_executor: Optional[Executor] = None,
+                                         max_row: int = DEFAULT_MAX_ROW):
+        await cls._run_in_executor(
+            offload_executor, cls.alter_excel_template, instances=instances, file_path=file_path,
+            add_attribute_info=add_attribute_info, generate_choice_list=generate_choice_list,
+            dummy_data_rows=dummy_data_rows, add_deprecated=add_deprecated,
+            abbreviate_excel_sheettitles=abbreviate_excel_sheettitles, template_plan=template_plan, max_row=max_row)
 
     @classmethod
     def alter_excel_sheet(cls, add_attribute_info: bool, choice_list_dict: dict, generate_choice_list: bool,
-                          instances: [OTLObject], sheet: Worksheet, add_deprecated: bool, workbook: Workbook,
-                          dummy_data_rows: int, abbreviate_excel_sheettitle: bool = True):
+                          template_plan: TemplatePlan, sheet: Worksheet, add_deprecated: bool, workbook: Workbook,
+                          dummy_data_rows: int, abbreviate_excel_sheettitle: bool = True,
+                          max_row: int = DEFAULT_MAX_ROW):
         type_uri = cls.get_uri_from_sheet_name(sheet.title)
-        instance = next((x for x in instances if x.typeURI == type_uri), None)
-        if instance is None:
-            instance = next((x for x in instances if x.typeURI.startswith(type_uri)), None)
-        if instance is None:
+        class_plan = template_plan.get_class_plan(type_uri)
+        if class_plan is None:
             raise UnknownExcelError(f'When creating a template, no instance could be created for {type_uri}')
 
-        boolean_validation = DataValidation(type="list", formula1='"TRUE,FALSE,-"', allow_blank=True)
-        sheet.add_data_validation(boolean_validation)
-        collected_attribute_info = []
-        deprecated_attributes_row = []
-
-        header_row = next(sheet.iter_rows(min_row=1, max_row=1))
-
-        first_data_row = 2 # first row is header, first data row is needed for later adjustments of formatting
-        if add_attribute_info:
-            first_data_row += 1
-        if add_deprecated and any(deprecated_attributes_row):
-            first_data_row += 1
-
-        max_row = 1000  # limit to 1000 as we only add validations up to row 1000
-        # Collect string columns to format after header processing
-        string_col_indices = []
-
-        for header_cell in header_row:
+        columns = []
+        for header_cell in next(sheet.iter_rows(min_row=1, max_row=1)):
             header = header_cell.value
-            if not header:
+            if not header or (type_uri == AGENT_URI and header.startswith('assetId.')):
+                columns.append(None)
                 continue
-
             if header == 'typeURI':
-                data_validation = DataValidation(type="list", formula1=f'"{type_uri}"', allow_blank=True)
-                sheet.add_data_validation(data_validation)
-                data_validation.add(f'{header_cell.column_letter}{first_data_row}:{header_cell.column_letter}{max_row}')
-                if add_attribute_info:
-                    collected_attribute_info.append(
-                        'De URI van het object volgens https://www.w3.org/2001/XMLSchema#anyURI .')
-                if add_deprecated:
-                    deprecated_attributes_row.append('')
-                continue
-
-            if type_uri == 'http://purl.org/dc/terms/Agent' and header.startswith('assetId.'):
+                columns.append(ColumnPlan(header=header, definition=TYPE_URI_DEFINITION, native_type='str'))
                 continue
-
-            attribute = DotnotationHelper.get_attribute_by_dotnotation(instance, header)
-
-            if add_attribute_info:
-                collected_attribute_info.append(attribute.definition)
-
-            if add_deprecated:
-                deprecated_attributes_row.append('DEPRECATED' if attribute.deprecated_version else '')
-
-            if generate_choice_list:
-                if attribute.field.native_type == bool:
-                    boolean_validation.add(f'{header_cell.column_letter}{first_data_row}:{header_cell.column_letter}{max_row}')
-                    cls.color_choice_lists_green(sheet=sheet, header_cell_column=header_cell)
-                elif hasattr(attribute.field, 'options') and attribute.field.options is not None:
-                    cls.generate_choice_list_in_excel(
-                        attribute=attribute, choice_list_dict=choice_list_dict, column=header_cell.column,
-                        row_nr=1, sheet=sheet, workbook=workbook)
-                    cls.color_choice_lists_green(sheet=sheet, header_cell_column=header_cell)
-
-            if attribute.field.native_type == str:
-                string_col_indices.append(header_cell.column)
-
-        # Efficiently format all string columns in one pass
-        for col_idx in string_col_indices:
-            for row_idx in range(first_data_row, max_row + 1):
-                sheet.cell(row=row_idx, column=col_idx).number_format = "@"
-
-        if dummy_data_rows == 0:
-            instance_count = len([x for x in instances if x.typeURI == type_uri])
-            if instance_count > 0:
-                sheet.delete_rows(idx=2, amount=instance_count)
-
+            column = class_plan.get_column(header)
+            if column is None or not column.resolved:
+                raise UnknownExcelError(f'The header {header} could not be found in the template plan of {type_uri}')
+            columns.append(column)
+
+            if generate_choice_list and column.validation == 'choice_list' and \
+                    column.choice_list_name not in choice_list_dict:
+                cls.add_choice_list_to_sheet(workbook=workbook, name=column.choice_list_name,
+                                             options=column.choice_list_options, choice_list_dict=choice_list_dict)
+
+        if dummy_data_rows == 0 and class_plan.row_count > 0:
+            sheet.delete_rows(idx=2, amount=class_plan.row_count)
+
+        first_data_row = 2
+        deprecated_attributes_row = ['DEPRECATED' if column is not None and column.deprecated else ''
+                                     for column in columns]
         if add_deprecated and any(deprecated_attributes_row):
             cls.add_deprecated_row_to_sheet(deprecated_attributes_row, sheet)
+            first_data_row += 1
 
         if add_attribute_info:
-            cls.add_attribute_info_to_sheet(collected_attribute_info, sheet)
+            cls.add_attribute_info_to_sheet([None if column is None else column.definition for column in columns],
+                                            sheet)
+            first_data_row += 1
 
-        cls.set_fixed_column_width(sheet=sheet, width=25)
+        # the formatting and validations are set per column, only the existing data cells are formatted one by one
+        TemplateColumnFormatter.format_data_cells(sheet=sheet, columns=columns, first_data_row=first_data_row)
+        TemplateColumnFormatter.set_column_dimensions(sheet=sheet, columns=columns)
+        TemplateColumnFormatter.add_column_ranges(
+            sheet=sheet, type_uri=type_uri, columns=columns, generate_choice_list=generate_choice_list,
+            first_data_row=first_data_row, max_row=max(max_row, sheet.max_row))
 
         if abbreviate_excel_sheettitle:
             cls.abbreviate_excel_sheettitle(sheet=sheet)
 
-    @classmethod
-    def color_choice_lists_green(cls, sheet: Worksheet, header_cell_column: Cell):
-        for cell in sheet.iter_rows(min_col=header_cell_column.column, max_col=header_cell_column.column,
-                                    min_row=2, max_row=1000):
-            cell[0].fill = cls.green_fill
-
     @classmethod
     def add_deprecated_row_to_sheet(cls, deprecated_attributes_row, sheet):
         sheet.insert_rows(idx=1)
@@ -600,23 +1444,6 @@ class SubsetTemplateCreator:
             cell.alignment = alignment
             cell.fill = fill
 
-    @classmethod
-    def generate_choice_list_in_excel(cls, attribute, choice_list_dict, column, row_nr, sheet: Worksheet,
-                                      workbook: Workbook):
-        choice_list_values = [cv for cv in attribute.field.options.values()
-                              if cv.status != 'verwijderd']
-        if attribute.field.naam not in choice_list_dict:
-            cls.add_choice_list_to_sheet(workbook=workbook, name=attribute.field.naam,
-                                         options=choice_list_values, choice_list_dict=choice_list_dict)
-        column_in_choice_sheet = choice_list_dict[attribute.field.naam]
-        start_range = f"${column_in_choice_sheet}$2"
-        end_range = f"${column_in_choice_sheet}${len(choice_list_values) + 2}"
-        data_val = DataValidation(type="list", formula1=f"Keuzelijsten!{start_range}:{end_range}",
-                                  allowBlank=True)
-        sheet.add_data_validation(data_val)
-        data_val.add(f'{get_column_letter(column)}{row_nr + 1}:'
-                     f'{get_column_letter(column)}1000')
-
     @classmethod
     def filters_classes_by_subset(cls, collector: OSLOCollector,
                                   class_uris_filter: [str] = None) -> list[OSLOClass]:
@@ -624,13 +1451,6 @@ class SubsetTemplateCreator:
             return collector.classes
         return [x for x in collector.classes if x.objectUri in class_uris_filter]
 
-    @classmethod
-    def set_fixed_column_width(cls, sheet, width: int):
-        dim_holder = DimensionHolder(worksheet=sheet)
-        for col in range(sheet.min_column, sheet.max_column + 1):
-            dim_holder[get_column_letter(col)] = ColumnDimension(sheet, min=col, max=col, width=width)
-        sheet.column_dimensions = dim_holder
-
     @classmethod
     def add_choice_list_to_sheet(cls, workbook, name, options, choice_list_dict):
         active_sheet = workbook['Keuzelijsten']
@@ -644,9 +1464,12 @@ class SubsetTemplateCreator:
         cell.value = "-"
         for index, option in enumerate(options, start=2):
             cell = active_sheet.cell(row=row_nr + index, column=column_nr)
-            cell.value = option.invulwaarde
+            cell.value = option
 
         choice_list_dict[name] = new_header.column_letter
+        TemplateColumnFormatter.define_choice_list_range(workbook=workbook, choice_list_name=name,
+                                                         column_letter=new_header.column_letter,
+                                                         option_count=len(options))
 
     @classmethod
     def get_uri_from_sheet_name(cls, title: str) -> str:
@@ -657,42 +1480,74 @@ class SubsetTemplateCreator:
         class_ns, class_name = title.split('#', maxsplit=1)
         return short_to_long_ns.get(class_ns, class_ns) + class_name
 
+    @classmethod
+    def build_relation_index(cls, collector: OSLOCollector, class_uris: [str], model_directory: Path = None
+                             ) -> dict[str, list[tuple]]:
+        """
+        Builds a dictionary from source class URI to the tuples (relation type, doel_uri, richting, relation URI)
+        of the relations between class_uris.
+        """
+        class_uris = set(class_uris)
+        relation_index = defaultdict(list)
+        for relation in sorted(collector.relations, key=lambda r: r.objectUri):
+            if relation.bron_uri not in class_uris:
+                continue
+            bron_class = collector.class_dict.get(relation.bron_uri)
+            doel_class = collector.class_dict.get(relation.doel_uri)
+            if bron_class is None or doel_class is None or bron_class.abstract != 0 or doel_class.abstract != 0:
+                continue
+
+            relation_type = cls.type_registry.get_type(class_uri=relation.objectUri, model_directory=model_directory)
+            relation_index[relation.bron_uri].append(
+                (relation_type, relation.doel_uri, relation.richting, relation.objectUri))
+        return relation_index
+
     @classmethod
     def append_relations_to_objects(cls, otl_objects: [OTLObject], collector: OSLOCollector, class_uris_filter: [str],
-                                    model_directory: Path):
+                                    model_directory: Path, relation_index: dict[str, list[tuple]] = None):
+        if relation_index is None:
+            relation_index = cls.build_relation_index(collector=collector, class_uris=class_uris_filter,
+                                                      model_directory=model_directory)
         class_dict = defaultdict(list)
         for instance in otl_objects:
             class_dict[instance.typeURI].append(instance)
 
         for class_uri in class_uris_filter:
-            for relation in collector.find_all_concrete_relations(objectUri=class_uri):
-                if class_uri != relation.bron_uri:
+            for relation_type, doel_uri, richting, relation_uri in relation_index.get(class_uri, []):
+                if doel_uri not in class_dict:
                     continue
-                for i, bron_instance in enumerate(class_dict[relation.bron_uri]):
-                    if relation.doel_uri not in class_dict:
-                        continue
-                    doel_instance = class_dict[relation.doel_uri][i]
-                    if relation.objectUri == 'https://wegenenverkeer.data.vlaanderen.be/ns/onderdeel#HeeftBetrokkene':
-                        relation_instance = create_betrokkenerelation(rol='toezichter', source=bron_instance,
-                                                            target=doel_instance, model_directory=model_directory)
-                    else:
-                        if relation.richting == 'Unspecified' and bron_instance.assetId.identificator > doel_instance.assetId.identificator:
-                            continue
-                        relation_type = dynamic_create_type_from_uri(class_uri=relation.objectUri, model_directory=model_directory)
-                        relation_instance = create_relation(relation_type=relation_type, source=bron_instance,
-                                                            target=doel_instance, model_directory=model_directory)
-
-                    otl_objects.append(relation_instance)
+                for i, bron_instance in enumerate(class_dict[class_uri]):
+                    relation_instance = cls._create_relation_instance(
+                        relation_type=relation_type, relation_uri=relation_uri, richting=richting,
+                        bron_instance=bron_instance, doel_instance=class_dict[doel_uri][i])
+                    if relation_instance is not None:
+                        otl_objects.append(relation_instance)
+
+    @classmethod
+    def _create_relation_instance(cls, relation_type, relation_uri: str, richting: str, bron_instance: OTLObject,
+                                  doel_instance: OTLObject) -> Optional[OTLObject]:
+        # like create_relation() of otlmow_model, but with the relation type of the type registry
+        if relation_uri != HEEFT_BETROKKENE_URI and richting == 'Unspecified' and \
+                bron_instance.assetId.identificator > doel_instance.assetId.identificator:
+            # an undirected relation is only created once for a pair of objects
+            return None
+        if not is_valid_relation(relation_type=relation_type, source=bron_instance, target=doel_instance):
+            raise CouldNotCreateRelationError("Can't create an invalid relation_type, please validate relations first")
+
+        relation_instance = relation_type()
+        bron_identificator = cls._get_identificator(bron_instance)
+        doel_identificator = cls._get_identificator(doel_instance)
+        relation_instance.bronAssetId.identificator, relation_instance.bronAssetId.toegekendDoor = bron_identificator
+        relation_instance.doelAssetId.identificator, relation_instance.doelAssetId.toegekendDoor = doel_identificator
+        relation_instance.assetId.identificator = \
+            f'{relation_type.__name__}_-_{bron_identificator[0]}_-_{doel_identificator[0]}'
+        relation_instance.assetId.toegekendDoor = 'OTLMOW'
+        relation_instance.bron.typeURI = bron_instance.typeURI
+        relation_instance.doel.typeURI = doel_instance.typeURI
+        if relation_uri == HEEFT_BETROKKENE_URI:
+            relation_instance.rol = 'toezichter'
+        return relation_instance
 
     @classmethod
     def abbreviate_excel_sheettitle(cls, sheet):
-        class_name = sheet.title
-        # abbreviates the class_name so it doesn't exceed the 31 character limit of sheet titles in excel
-        if '#' not in class_name:
-            sheet.title = class_name[:31]
-            return
-        split_name = class_name.split("#")
-        namespace_name = split_name[0]
-        subclass_name = split_name[1]
-        class_name = f"{namespace_name[:3]}#{subclass_name}"
-        sheet.title = class_name[:31]
+        sheet.title = TemplateColumnFormatter.abbreviate_sheet_title(sheet.title)
@@ -0,0 +1,23 @@
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+
+@dataclass
+class TemplateJob:
+    """
+    A template to generate in a batch: the subset, the path of the template and the keyword arguments of
+    SubsetTemplateCreator.generate_template_from_subset (e.g. dummy_data_rows or model_directory).
+    """
+    subset_path: Path
+    template_file_path: Path
+    options: dict = field(default_factory=dict)
+
+
+@dataclass
+class TemplateJobResult:
+    """The outcome of a TemplateJob: whether it succeeded, how long it took and the error it raised, if any."""
+    job: TemplateJob
+    success: bool
+    duration_seconds: float
+    error: Optional[Exception] = None
@@ -0,0 +1,134 @@
+import re
+from typing import Optional
+
+from openpyxl.formatting.rule import FormulaRule
+from openpyxl.styles import PatternFill
+from openpyxl.utils import get_column_letter
+from openpyxl.workbook import Workbook
+from openpyxl.workbook.defined_name import DefinedName
+from openpyxl.worksheet.datavalidation import DataValidation
+from openpyxl.worksheet.dimensions import ColumnDimension, DimensionHolder
+from openpyxl.worksheet.worksheet import Worksheet
+from otlmow_model.OtlmowModel.Helpers.GenericHelper import get_shortened_uri
+
+from otlmow_template.TemplatePlan import AGENT_URI, ColumnPlan
+
+DEFAULT_MAX_ROW = 1000
+COLUMN_WIDTH = 25
+TEXT_FORMAT = '@'
+CHOICE_LIST_FILL = PatternFill(start_color="90EE90", end_color="90EE90", fill_type="solid")
+
+
+class TemplateColumnFormatter:
+    """
+    Formats and validates the columns of a template sheet per column instead of per cell. The columns are given
+    as the ColumnPlan per column of the sheet, None for a column without a plan.
+    """
+
+    @classmethod
+    def is_text_column(cls, column: Optional[ColumnPlan]) -> bool:
+        return column is not None and column.header != 'typeURI' and column.is_string
+
+    @classmethod
+    def is_choice_list_column(cls, column: Optional[ColumnPlan], generate_choice_list: bool) -> bool:
+        return generate_choice_list and column is not None and column.validation in ('boolean', 'choice_list')
+
+    @classmethod
+    def set_column_dimensions(cls, sheet: Worksheet, columns: list[Optional[ColumnPlan]],
+                              width: int = COLUMN_WIDTH) -> None:
+        """
+        Sets the width of the columns (also the default width of the sheet) and the text format as the style of the
+        string columns. In a write-only sheet this must be done before the first row is written.
+        """
+        sheet.sheet_format.defaultColWidth = width
+        dimension_holder = DimensionHolder(worksheet=sheet)
+        for column_nr, column in enumerate(columns, start=1):
+            dimension = ColumnDimension(sheet, min=column_nr, max=column_nr, width=width)
+            if cls.is_text_column(column):
+                dimension.number_format = TEXT_FORMAT
+            dimension_holder[get_column_letter(column_nr)] = dimension
+        sheet.column_dimensions = dimension_holder
+
+    @classmethod
+    def format_data_cells(cls, sheet: Worksheet, columns: list[Optional[ColumnPlan]], first_data_row: int) -> None:
+        """Sets the text format of the existing cells of the string columns, from first_data_row on."""
+        if sheet.max_row < first_data_row:
+            return
+        for column_nr, column in enumerate(columns, start=1):
+            if not cls.is_text_column(column):
+                continue
+            for row in sheet.iter_rows(min_row=first_data_row, max_row=sheet.max_row, min_col=column_nr,
+                                       max_col=column_nr):
+                row[0].number_format = TEXT_FORMAT
+
+    @classmethod
+    def get_sheet_title(cls, type_uri: str, abbreviate_excel_sheettitles: bool) -> str:
+        """
+        Returns the title of the sheet of a class: its shortened URI (Agent for agents), abbreviated if
+        abbreviate_excel_sheettitles (see abbreviate_sheet_title), like the sheets of the regular templates.
+        """
+        title = 'Agent' if type_uri == AGENT_URI else get_shortened_uri(type_uri)
+        if abbreviate_excel_sheettitles:
+            return cls.abbreviate_sheet_title(title)
+        return title
+
+    @classmethod
+    def abbreviate_sheet_title(cls, title: str) -> str:
+        # abbreviates the title so it doesn't exceed the 31 character limit of sheet titles in excel
+        if '#' not in title:
+            return title[:31]
+        namespace_name, class_name = title.split('#', 1)
+        return f'{namespace_name[:3]}#{class_name}'[:31]
+
+    @classmethod
+    def get_choice_list_range_name(cls, choice_list_name: str) -> str:
+        """Returns the name of the range of the choice list in the Keuzelijsten sheet."""
+        return f'Keuzelijst_{re.sub(r"[^A-Za-z0-9_.]", "_", choice_list_name)}'
+
+    @classmethod
+    def define_choice_list_range(cls, workbook: Workbook, choice_list_name: str, column_letter: str,
+                                 option_count: int) -> None:
+        """
+        Defines the named range of a choice list: its column in the Keuzelijsten sheet, from the '-' row (row 2) up
+        to its last option. The validations of all the sheets refer to this single range.
+        """
+        range_name = cls.get_choice_list_range_name(choice_list_name)
+        workbook.defined_names[range_name] = DefinedName(
+            range_name, attr_text=f'Keuzelijsten!${column_letter}$2:${column_letter}${option_count + 2}')
+
+    @classmethod
+    def add_column_ranges(cls, sheet: Worksheet, type_uri: str, columns: list[Optional[ColumnPlan]],
+                          generate_choice_list: bool, first_data_row: int, max_row: int = DEFAULT_MAX_ROW) -> None:
+        """
+        Adds the conditional format and the merged validations of the columns, from first_data_row up to max_row.
+        The named ranges of the choice lists (see define_choice_list_range) must be defined in the workbook.
+        """
+        data_validations = {}
+        choice_list_ranges = []
+        for column_nr, column in enumerate(columns, start=1):
+            if column is None:
+                continue
+            column_letter = get_column_letter(column_nr)
+            cell_range = f'{column_letter}{first_data_row}:{column_letter}{max_row}'
+            if cls.is_choice_list_column(column=column, generate_choice_list=generate_choice_list):
+                choice_list_ranges.append(cell_range)
+
+            if column.validation == 'type_uri':
+                formula = f'"{type_uri}"'
+            elif not generate_choice_list:
+                continue
+            elif column.validation == 'boolean':
+                formula = '"TRUE,FALSE,-"'
+            elif column.validation == 'choice_list':
+                formula = cls.get_choice_list_range_name(column.choice_list_name)
+            else:
+                continue
+            if formula not in data_validations:
+                data_validations[formula] = DataValidation(type="list", formula1=formula, allow_blank=True)
+            data_validations[formula].add(cell_range)
+
+        for data_validation in data_validations.values():
+            sheet.data_validations.append(data_validation)
+        if choice_list_ranges:
+            sheet.conditional_formatting.add(' '.join(choice_list_ranges),
+                                             FormulaRule(formula=['TRUE'], fill=CHOICE_LIST_FILL))
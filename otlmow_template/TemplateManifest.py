@@ -0,0 +1,91 @@
+import hashlib
+import json
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+
+from otlmow_modelbuilder.OSLOCollector import OSLOCollector
+
+from otlmow_template.HelperFunctions import get_package_version
+
+
+@dataclass
+class TemplateChanges:
+    """The classes that were added, removed or changed in a subset since a template was generated from it."""
+    added: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    changed: list[str] = field(default_factory=list)
+
+    @property
+    def classes_to_build(self) -> list[str]:
+        return self.changed + self.added
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.added or self.removed or self.changed)
+
+
+@dataclass
+class TemplateManifest:
+    """
+    The generation manifest of a template, saved next to it: the fingerprints of the options and of every class,
+    and the number of the next identificator.
+    """
+    options_fingerprint: str
+    class_fingerprints: dict[str, str] = field(default_factory=dict)
+    next_identificator: int = 0
+
+    @classmethod
+    def get_manifest_path(cls, template_file_path: Path) -> Path:
+        return template_file_path.parent / f'{template_file_path.stem}.manifest.json'
+
+    @classmethod
+    def get_options_fingerprint(cls, template_file_path: Path, model_directory: Path = None, **options) -> str:
+        """
+        Returns the fingerprint of the generation options, which includes the versions of the model, converter and
+        template packages. Every keyword argument of the generation (except the paths) must be passed as an option.
+        """
+        if options.get('class_uris_filter') is not None:
+            options['class_uris_filter'] = sorted(options['class_uris_filter'])
+        fingerprint_dict = {
+            'extension': template_file_path.suffix.lower(),
+            'model_directory': None if model_directory is None else str(Path(model_directory).resolve()),
+            'otlmow_model': get_package_version('otlmow_model'),
+            'otlmow_converter': get_package_version('otlmow_converter'),
+            'otlmow_template': get_package_version('otlmow_template'),
+            'options': {key: repr(value) for key, value in sorted(options.items())}
+        }
+        return hashlib.sha256(json.dumps(fingerprint_dict, sort_keys=True).encode('utf-8')).hexdigest()
+
+    @classmethod
+    def get_class_fingerprints(cls, collector: OSLOCollector, class_uris: [str]) -> dict[str, str]:
+        """Returns the fingerprint of the definition of every class in class_uris, in the order of class_uris."""
+        attributes_per_class = {}
+        for attribute in collector.attributes:
+            attributes_per_class.setdefault(attribute.class_uri, []).append(asdict(attribute))
+
+        fingerprints = {}
+        for class_uri in class_uris:
+            fingerprint_dict = {
+                'class': asdict(collector.class_dict[class_uri]),
+                'attributes': sorted(attributes_per_class.get(class_uri, []), key=lambda a: a['objectUri'])
+            }
+            fingerprints[class_uri] = hashlib.sha256(
+                json.dumps(fingerprint_dict, sort_keys=True).encode('utf-8')).hexdigest()
+        return fingerprints
+
+    def get_changes(self, class_fingerprints: dict[str, str]) -> TemplateChanges:
+        """Compares the fingerprints of the classes of a (new) subset with those of this manifest."""
+        return TemplateChanges(
+            added=[uri for uri in class_fingerprints if uri not in self.class_fingerprints],
+            removed=[uri for uri in self.class_fingerprints if uri not in class_fingerprints],
+            changed=[uri for uri, fingerprint in class_fingerprints.items()
+                     if uri in self.class_fingerprints and self.class_fingerprints[uri] != fingerprint])
+
+    def save(self, file_path: Path) -> None:
+        with open(file_path, 'w', encoding='utf-8') as file:
+            json.dump(asdict(self), file, ensure_ascii=False, indent=1)
+
+    @classmethod
+    def load(cls, file_path: Path) -> 'TemplateManifest':
+        with open(file_path, encoding='utf-8') as file:
+            return cls(**json.load(file))
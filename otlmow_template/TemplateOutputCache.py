@@ -0,0 +1,141 @@
+import hashlib
+import json
+import os
+import shutil
+import threading
+import uuid
+from pathlib import Path
+
+from otlmow_template.HelperFunctions import hash_file, get_package_version
+
+
+class TemplateOutputCache:
+    """
+    On-disk LRU cache of finished template files, keyed by the content hash of the subset file, the versions of
+    the packages and the generation options. The dummy data is that of the run that created the entry.
+    """
+
+    def __init__(self, cache_directory: Path, max_size_bytes: int = 1024 * 1024 * 1024, use_hard_links: bool = False):
+        self.cache_directory = Path(cache_directory)
+        self.max_size_bytes = max_size_bytes
+        self.use_hard_links = use_hard_links
+        self.cache_directory.mkdir(parents=True, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def get_cache_key(cls, subset_path: Path, template_file_path: Path, model_directory: Path = None,
+                      **options) -> str:
+        """
+        Returns the key of the template generated from subset_path with the given options. Every keyword argument
+        of generate_template_from_subset (except the paths) must be passed as an option.
+        """
+        if options.get('class_uris_filter') is not None:
+            options['class_uris_filter'] = sorted(options['class_uris_filter'])
+        key_dict = {
+            'subset_hash': hash_file(subset_path),
+            'extension': template_file_path.suffix.lower(),
+            'model_directory': None if model_directory is None else str(Path(model_directory).resolve()),
+            'otlmow_model': get_package_version('otlmow_model'),
+            'otlmow_converter': get_package_version('otlmow_converter'),
+            'otlmow_template': get_package_version('otlmow_template'),
+            'options': {key: repr(value) for key, value in sorted(options.items())}
+        }
+        return hashlib.sha256(json.dumps(key_dict, sort_keys=True).encode('utf-8')).hexdigest()
+
+    def _get_entry_path(self, cache_key: str) -> Path:
+        return self.cache_directory / cache_key
+
+    def restore(self, cache_key: str, template_file_path: Path) -> bool:
+        """
+        Places the cached files of the entry next to template_file_path.
+        Returns False if there is no entry for cache_key.
+        """
+        entry_path = self._get_entry_path(cache_key)
+        try:
+            cached_files = list(entry_path.iterdir())
+        except FileNotFoundError:
+            cached_files = []
+        if not cached_files:
+            with self._lock:
+                self.misses += 1
+            return False
+
+        for cached_file in cached_files:
+            target_path = template_file_path.parent / f'{template_file_path.stem}{cached_file.name}'
+            self._place_file(cached_file, target_path)
+
+        # touching the entry marks it as recently used for the eviction
+        os.utime(entry_path)
+        with self._lock:
+            self.hits += 1
+        return True
+
+    def _place_file(self, cached_file: Path, target_path: Path) -> None:
+        target_path.unlink(missing_ok=True)
+        if self.use_hard_links:
+            try:
+                os.link(cached_file, target_path)
+                return
+            except OSError:
+                pass
+        shutil.copyfile(cached_file, target_path)
+
+    def store(self, cache_key: str, template_file_path: Path, created_file_paths: [Path]) -> None:
+        """Stores the files that make up the template generated at template_file_path."""
+        entry_path = self._get_entry_path(cache_key)
+        if entry_path.exists():
+            return
+        temp_path = self.cache_directory / f'{cache_key}.{uuid.uuid4().hex}.tmp'
+        temp_path.mkdir()
+        stem = template_file_path.stem
+        for created_file_path in created_file_paths:
+            created_file_path = Path(created_file_path)
+            if not created_file_path.name.startswith(stem) or not created_file_path.exists():
+                shutil.rmtree(temp_path, ignore_errors=True)
+                return
+            shutil.copyfile(created_file_path, temp_path / created_file_path.name[len(stem):])
+        try:
+            os.replace(temp_path, entry_path)
+        except OSError:
+            # another process stored the same entry in the meantime
+            shutil.rmtree(temp_path, ignore_errors=True)
+        self.evict()
+
+    def evict(self) -> None:
+        """Removes the least recently used entries until the cache fits within max_size_bytes."""
+        with self._lock:
+            entries = []
+            for entry_path in self.cache_directory.iterdir():
+                if not entry_path.is_dir() or entry_path.suffix == '.tmp':
+                    continue
+                try:
+                    size = sum(f.stat().st_size for f in entry_path.iterdir())
+                    entries.append((entry_path.stat().st_mtime, size, entry_path))
+                except FileNotFoundError:
+                    continue
+            total_size = sum(size for _, size, _ in entries)
+            for _, size, entry_path in sorted(entries, key=lambda e: e[0]):
+                if total_size <= self.max_size_bytes:
+                    break
+                shutil.rmtree(entry_path, ignore_errors=True)
+                total_size -= size
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            for entry_path in self.cache_directory.iterdir():
+                if entry_path.is_dir():
+                    shutil.rmtree(entry_path, ignore_errors=True)
+
+    def get_statistics(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_ratio': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions
+            }
@@ -0,0 +1,171 @@
+import json
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+from otlmow_converter.DotnotationDictConverter import DotnotationDictConverter
+from otlmow_converter.DotnotationHelper import DotnotationHelper
+from otlmow_model.OtlmowModel.BaseClasses.OTLObject import OTLObject
+
+AGENT_URI = 'http://purl.org/dc/terms/Agent'
+TYPE_URI_DEFINITION = 'De URI van het object volgens https://www.w3.org/2001/XMLSchema#anyURI .'
+
+
+@dataclass
+class ColumnPlan:
+    """
+    A single column of a template: the dotnotation header and everything needed to render it (definition,
+    deprecation, native type and the options of the choice list, if any).
+    """
+    header: str
+    definition: str = ''
+    deprecated: bool = False
+    native_type: Optional[str] = None
+    choice_list_name: Optional[str] = None
+    choice_list_options: list[str] = field(default_factory=list)
+    resolved: bool = True
+
+    @property
+    def is_boolean(self) -> bool:
+        return self.native_type == 'bool'
+
+    @property
+    def is_string(self) -> bool:
+        return self.native_type == 'str'
+
+    @property
+    def has_choice_list(self) -> bool:
+        return self.choice_list_name is not None
+
+    @property
+    def validation(self) -> Optional[str]:
+        """The data validation this column requires: 'type_uri', 'boolean', 'choice_list' or None."""
+        if self.header == 'typeURI':
+            return 'type_uri'
+        if self.is_boolean:
+            return 'boolean'
+        if self.has_choice_list:
+            return 'choice_list'
+        return None
+
+
+@dataclass
+class ClassPlan:
+    """The ordered columns of the template of one class and the number of (dummy data) rows of that class."""
+    type_uri: str
+    columns: list[ColumnPlan] = field(default_factory=list)
+    row_count: int = 0
+
+    def __post_init__(self):
+        self._columns_by_header = {c.header: c for c in self.columns}
+
+    @property
+    def headers(self) -> list[str]:
+        return [c.header for c in self.columns]
+
+    def get_column(self, header: str) -> Optional[ColumnPlan]:
+        return self._columns_by_header.get(header)
+
+
+@dataclass
+class TemplatePlan:
+    """
+    Format independent description of a template: per class the ordered columns with their type, choice list,
+    definition and deprecation. It can be saved as JSON.
+    """
+    classes: dict[str, ClassPlan] = field(default_factory=dict)
+
+    def get_class_plan(self, type_uri: str) -> Optional[ClassPlan]:
+        class_plan = self.classes.get(type_uri)
+        if class_plan is None:
+            class_plan = next((p for uri, p in self.classes.items() if uri.startswith(type_uri)), None)
+        return class_plan
+
+    @classmethod
+    def compile(cls, instances: [OTLObject]) -> 'TemplatePlan':
+        """Compiles the plan of the given instances, in the column order of the converter."""
+        instances_per_type = {}
+        for instance in instances:
+            instances_per_type.setdefault(instance.typeURI, []).append(instance)
+
+        plan = cls()
+        for type_uri, typed_instances in instances_per_type.items():
+            header_instances = {}
+            for instance in typed_instances:
+                for header in DotnotationDictConverter.to_dict(instance, cast_list=True, cast_datetime=True):
+                    header_instances.setdefault(header, instance)
+
+            columns = [cls._compile_column(header=header, instance=header_instances.get(header, typed_instances[0]))
+                       for header in cls._order_headers(type_uri=type_uri, headers=header_instances)]
+            plan.classes[type_uri] = ClassPlan(type_uri=type_uri, columns=columns, row_count=len(typed_instances))
+        return plan
+
+    @classmethod
+    def compile_from_headers(cls, headers_per_type: dict[str, Iterable[str]], row_counts: dict[str, int],
+                             prototypes: dict[str, OTLObject]) -> 'TemplatePlan':
+        """
+        Compiles the plan from the headers of every type, resolved on a new instance of the class of its prototype
+        (see iter_recording_prototypes).
+        """
+        plan = cls()
+        for type_uri, headers in headers_per_type.items():
+            instance = type(prototypes[type_uri])()
+            columns = [cls._compile_column(header=header, instance=instance)
+                       for header in cls._order_headers(type_uri=type_uri, headers=headers)]
+            plan.classes[type_uri] = ClassPlan(type_uri=type_uri, columns=columns, row_count=row_counts[type_uri])
+        return plan
+
+    @classmethod
+    def iter_recording_prototypes(cls, instances: Iterable[OTLObject], prototypes: dict[str, OTLObject]
+                                  ) -> Iterator[OTLObject]:
+        """Yields the instances and keeps the first instance of every type in prototypes."""
+        for instance in instances:
+            if instance.typeURI not in prototypes:
+                prototypes[instance.typeURI] = instance
+            yield instance
+
+    @classmethod
+    def _order_headers(cls, type_uri: str, headers: Iterable[str]) -> list[str]:
+        id_name = 'agentId' if type_uri == AGENT_URI else 'assetId'
+        first_headers = ['typeURI', f'{id_name}.identificator', f'{id_name}.toegekendDoor']
+        return first_headers + sorted(h for h in headers if h not in first_headers)
+
+    @classmethod
+    def _compile_column(cls, header: str, instance: OTLObject) -> ColumnPlan:
+        if header == 'typeURI':
+            return ColumnPlan(header=header, definition=TYPE_URI_DEFINITION, native_type='str')
+        try:
+            attribute = DotnotationHelper.get_attribute_by_dotnotation(instance, header)
+        except AttributeError:
+            return ColumnPlan(header=header, resolved=False)
+
+        native_type = attribute.field.native_type
+        column = ColumnPlan(header=header, definition=attribute.definition,
+                            deprecated=bool(attribute.deprecated_version),
+                            native_type=None if native_type is None else native_type.__name__)
+        if native_type != bool and getattr(attribute.field, 'options', None) is not None:
+            column.choice_list_name = attribute.field.naam
+            column.choice_list_options = [option.invulwaarde for option in attribute.field.options.values()
+                                          if option.status != 'verwijderd']
+        return column
+
+    def to_dict(self) -> dict:
+        return {'classes': [asdict(class_plan) for class_plan in self.classes.values()]}
+
+    @classmethod
+    def from_dict(cls, plan_dict: dict) -> 'TemplatePlan':
+        plan = cls()
+        for class_dict in plan_dict['classes']:
+            columns = [ColumnPlan(**column_dict) for column_dict in class_dict['columns']]
+            plan.classes[class_dict['type_uri']] = ClassPlan(
+                type_uri=class_dict['type_uri'], columns=columns, row_count=class_dict['row_count'])
+        return plan
+
+    def save(self, file_path: Path) -> None:
+        with open(file_path, 'w', encoding='utf-8') as file:
+            json.dump(self.to_dict(), file, ensure_ascii=False, indent=1)
+
+    @classmethod
+    def load(cls, file_path: Path) -> 'TemplatePlan':
+        with open(file_path, encoding='utf-8') as file:
+            return cls.from_dict(json.load(file))
@@ -0,0 +1,152 @@
+from itertools import zip_longest
+from pathlib import Path
+from typing import Iterable, Optional
+
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import PatternFill, Alignment
+from openpyxl.utils import get_column_letter
+from openpyxl.workbook import Workbook
+from otlmow_converter.Exceptions.UnknownExcelError import UnknownExcelError
+from otlmow_converter.FileFormats.DotnotationTableConverter import DotnotationTableConverter
+from otlmow_converter.FileFormats.ExcelExporter import SEPARATOR
+from otlmow_model.OtlmowModel.BaseClasses.OTLObject import OTLObject
+
+from otlmow_template.ExcelTemplateWriter import ExcelTemplateWriter
+from otlmow_template.TemplateColumnFormatter import TemplateColumnFormatter, DEFAULT_MAX_ROW, TEXT_FORMAT
+from otlmow_template.TemplatePlan import AGENT_URI, ClassPlan, ColumnPlan, TemplatePlan
+
+GREY_FILL = PatternFill(start_color="808080", fill_type="solid")
+RED_FILL = PatternFill(start_color="FF7276", end_color="FF7276", fill_type="solid")
+WRAP_ALIGNMENT = Alignment(wrapText=True, vertical='top')
+
+
+class WriteOnlyExcelTemplateWriter:
+    """
+    Writes the Excel template of SubsetTemplateCreator.write_excel_template() in openpyxl's write-only mode, so
+    no cell is kept in memory after it is written.
+    """
+
+    @classmethod
+    def write(cls, class_batches: Iterable[list[OTLObject]], file_path: Path, add_attribute_info: bool,
+              generate_choice_list: bool, dummy_data_rows: int, add_deprecated: bool,
+              abbreviate_excel_sheettitles: bool = False, template_plan: TemplatePlan = None,
+              max_row: int = DEFAULT_MAX_ROW, **kwargs) -> tuple[Path]:
+        """
+        Writes a sheet per type of the objects in the class batches and the Keuzelijsten sheet. The objects of a
+        type must all be in the same batch.
+
+        :return: the path of the created file
+        """
+        workbook = Workbook(write_only=True)
+        choice_list_dict = {}
+        choice_list_options = {}
+        for class_batch in class_batches:
+            prototypes = {}
+            table_dict = ExcelTemplateWriter.get_tables_per_type(
+                sequence_of_objects=TemplatePlan.iter_recording_prototypes(class_batch, prototypes), **kwargs)
+            del class_batch
+            batch_plan = ExcelTemplateWriter.compile_template_plan(table_dict=table_dict, prototypes=prototypes)
+            if template_plan is not None:
+                template_plan.classes.update(batch_plan.classes)
+            for table_data in table_dict.values():
+                if len(table_data) < 2:
+                    continue
+                type_uri = table_data[1]['typeURI']
+                class_plan = batch_plan.get_class_plan(type_uri)
+                if class_plan is None:
+                    raise UnknownExcelError(f'When creating a template, no instance could be created for {type_uri}')
+                cls.write_sheet(workbook=workbook, table_data=table_data, class_plan=class_plan,
+                                choice_list_dict=choice_list_dict, choice_list_options=choice_list_options,
+                                add_attribute_info=add_attribute_info, generate_choice_list=generate_choice_list,
+                                dummy_data_rows=dummy_data_rows, add_deprecated=add_deprecated,
+                                abbreviate_excel_sheettitles=abbreviate_excel_sheettitles, max_row=max_row)
+
+        cls.write_choice_list_sheet(workbook=workbook, choice_list_options=choice_list_options)
+        workbook.save(file_path)
+        workbook.close()
+        return (file_path,)
+
+    @classmethod
+    def write_sheet(cls, workbook: Workbook, table_data: list[dict], class_plan: ClassPlan, choice_list_dict: dict,
+                    choice_list_options: dict, add_attribute_info: bool, generate_choice_list: bool,
+                    dummy_data_rows: int, add_deprecated: bool, abbreviate_excel_sheettitles: bool,
+                    max_row: int = DEFAULT_MAX_ROW):
+        """
+        Writes the sheet of a single type from its table and adds its new choice lists to choice_list_dict
+        (name: column letter) and choice_list_options (name: options).
+        """
+        sheet = workbook.create_sheet(TemplateColumnFormatter.get_sheet_title(
+            type_uri=class_plan.type_uri, abbreviate_excel_sheettitles=abbreviate_excel_sheettitles))
+        headers, *data_rows = DotnotationTableConverter.transform_list_of_dicts_to_2d_sequence(
+            list_of_dicts=table_data, empty_string_equals_none=True, separator=SEPARATOR)
+        columns = [cls._get_column(class_plan=class_plan, header=header) for header in headers]
+        if generate_choice_list:
+            for column in columns:
+                if column is not None and column.validation == 'choice_list' and \
+                        column.choice_list_name not in choice_list_dict:
+                    choice_list_dict[column.choice_list_name] = get_column_letter(len(choice_list_dict) + 1)
+                    choice_list_options[column.choice_list_name] = column.choice_list_options
+                    TemplateColumnFormatter.define_choice_list_range(
+                        workbook=workbook, choice_list_name=column.choice_list_name,
+                        column_letter=choice_list_dict[column.choice_list_name],
+                        option_count=len(column.choice_list_options))
+
+        # the columns precede the rows in the file, so they are set before the first row is written
+        TemplateColumnFormatter.set_column_dimensions(sheet=sheet, columns=columns)
+
+        header_rows = [headers]
+        if add_deprecated and any(column is not None and column.deprecated for column in columns):
+            header_rows.insert(0, [cls._create_cell(sheet=sheet, value='DEPRECATED', fill=RED_FILL)
+                                   if column is not None and column.deprecated else None for column in columns])
+        if add_attribute_info:
+            header_rows.insert(0, [cls._create_cell(sheet=sheet, value=None if column is None else column.definition,
+                                                    fill=GREY_FILL, alignment=WRAP_ALIGNMENT) for column in columns])
+        for header_row in header_rows:
+            sheet.append(header_row)
+        first_data_row = len(header_rows) + 1
+
+        if dummy_data_rows == 0:
+            data_rows = []
+        text_columns = [TemplateColumnFormatter.is_text_column(column) for column in columns]
+        for data_row in data_rows:
+            sheet.append([cls._create_cell(sheet=sheet, value=value, number_format=TEXT_FORMAT) if is_text else value
+                          for value, is_text in zip(data_row, text_columns)])
+
+        TemplateColumnFormatter.add_column_ranges(
+            sheet=sheet, type_uri=class_plan.type_uri, columns=columns, generate_choice_list=generate_choice_list,
+            first_data_row=first_data_row, max_row=max(max_row, first_data_row + len(data_rows) - 1))
+        return sheet
+
+    @classmethod
+    def write_choice_list_sheet(cls, workbook: Workbook, choice_list_options: dict):
+        """Writes the Keuzelijsten sheet: a column per choice list with its name, '-' and its options."""
+        sheet = workbook.create_sheet('Keuzelijsten')
+        if not choice_list_options:
+            return sheet
+        sheet.append(list(choice_list_options))
+        sheet.append(['-'] * len(choice_list_options))
+        for row in zip_longest(*choice_list_options.values()):
+            sheet.append(list(row))
+        return sheet
+
+    @classmethod
+    def _get_column(cls, class_plan: ClassPlan, header: str) -> Optional[ColumnPlan]:
+        if class_plan.type_uri == AGENT_URI and header.startswith('assetId.'):
+            return None
+        column = class_plan.get_column(header)
+        if column is None or not column.resolved:
+            raise UnknownExcelError(
+                f'The header {header} could not be found in the template plan of {class_plan.type_uri}')
+        return column
+
+    @classmethod
+    def _create_cell(cls, sheet, value, fill: PatternFill = None, alignment: Alignment = None,
+                     number_format: str = None) -> WriteOnlyCell:
+        cell = WriteOnlyCell(sheet, value)
+        if fill is not None:
+            cell.fill = fill
+        if alignment is not None:
+            cell.alignment = alignment
+        if number_format is not None:
+            cell.number_format = number_format
+        return cell